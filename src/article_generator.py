@@ -1,40 +1,49 @@
-
-import sys
-import os
 import networkx as nx
 from datetime import datetime
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import graph_ops
-import visualizer
-from vehicle_parts import V_CARROS, V_PECAS
+from . import graph_ops
+from . import pipeline
+from . import render
+from . import visualizer
+
 
-def generate_article(save_path="artigo_final.md"):
+def generate_article(save_path="artigo_final.md", processes=None):
     print("Initializing Robust Article Generation...")
     
     # --- Calculations ---
+    # Independent analyses run concurrently (see pipeline.analysis_pipeline)
     B = graph_ops.build_bipartite_graph()
     P = graph_ops.build_projected_graph(B)
-    comm_map, communities = graph_ops.detect_communities(P)
-    critical_parts = graph_ops.get_part_criticality(B)
+    results = pipeline.analysis_pipeline(B, P, processes).run(
+        ['communities', 'criticality', 'cumulative_failure', 'stock', 'assortativity',
+         'k_core', 'demand', 'mst'])
+    comm_map, communities = results['communities']
+    critical_parts = results['criticality']
     top_parts = critical_parts[:10]
-    top_5_part_names = [p[0] for p in top_parts[:5]]
-    failure_stats = graph_ops.simulate_cumulative_failure(B, top_5_part_names)
-    total_needed, unique, savings = graph_ops.analyze_stock_savings(B)
-    coeff, mixing = graph_ops.calculate_assortativity(P)
-    cores, ksub, max_k = graph_ops.get_k_core_decomposition(P)
-    stds, sugs = graph_ops.predict_demand(B, communities)
-    T = graph_ops.get_mst(P)
+    failure_stats = results['cumulative_failure']
+    total_needed, unique, savings = results['stock']
+    coeff, mixing = results['assortativity']
+    cores, ksub, max_k = results['k_core']
+    stds, sugs = results['demand']
+    T = results['mst']
 
     # --- Visual Generation ---
     print("Generating High-Res Figures...")
-    visualizer.plot_graph(B, title="Rede Complexa Bipartida (Veículos-Peças)", filename="fig1_network.png")
-    visualizer.plot_graph(P, title="Clusters Estratégicos Detectados (Algoritmo Louvain)", filename="fig2_clusters.png", groups=comm_map, weighted=True)
-    visualizer.plot_criticality(critical_parts, filename="fig3_hubs.png")
-    visualizer.plot_resilience_curve(failure_stats, filename="fig4_resilience.png")
-    visualizer.plot_graph(T, title="Infraestrutura Mínima Conectada (Backbone MST)", filename="fig5_backbone.png", weighted=True)
-    visualizer.plot_k_core(P, cores, filename="fig6_kcore.png")
+    render.render_figures([
+        render.figure_job(visualizer.plot_graph, B,
+                          title="Rede Complexa Bipartida (Veículos-Peças)",
+                          filename="fig1_network.png"),
+        render.figure_job(visualizer.plot_graph, P,
+                          title="Clusters Estratégicos Detectados (Algoritmo Louvain)",
+                          filename="fig2_clusters.png", groups=comm_map, weighted=True),
+        render.figure_job(visualizer.plot_criticality, critical_parts, filename="fig3_hubs.png"),
+        render.figure_job(visualizer.plot_resilience_curve, failure_stats,
+                          filename="fig4_resilience.png"),
+        render.figure_job(visualizer.plot_graph, T,
+                          title="Infraestrutura Mínima Conectada (Backbone MST)",
+                          filename="fig5_backbone.png", weighted=True),
+        render.figure_job(visualizer.plot_k_core, P, cores, filename="fig6_kcore.png"),
+    ], processes=processes)
 
     # --- Text Generation ---
     print("Writing Extensive Academic Content (LaTeX)...")
@@ -146,7 +155,7 @@ A Tabela \ref{tab:hubs} lista os componentes mais críticos. O 'Sistema ABS Bosc
     Rank & Componente (Hub) & N. de Veículos Dependentes \\
     \midrule
 """)
-        for i, (p, d) in enumerate(top_parts[:5]):
+        for i, (p, d, *_) in enumerate(top_parts[:5]):
             f.write(f"    {i+1} & {p} & {d} \\\\\n")
         f.write(r"""    \bottomrule
     \end{tabular}
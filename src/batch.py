@@ -0,0 +1,108 @@
+"""
+Parallel batch runner for supplier-collapse scenarios.
+
+Each scenario is a set of parts that fail together. Workers receive the
+bipartite structure once, through the pool initializer, and evaluate every
+scenario with union-find over cars instead of copying the graph and
+rebuilding the projection.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .percolation import UnionFind
+from .projection import car_nodes, part_nodes
+
+# Read-only structure installed in each worker by _init_worker
+_STRUCTURE = None
+
+
+def build_structure(B):
+    """
+    Extracts the compact structure the workers need from B.
+    Returns (num_cars, {part: tuple_of_car_indices}).
+    """
+    cars = car_nodes(B)
+    car_index = {c: i for i, c in enumerate(cars)}
+    part_users = {}
+    for part in part_nodes(B):
+        part_users[part] = tuple(car_index[c] for c in B.neighbors(part) if c in car_index)
+    return len(cars), part_users
+
+
+def evaluate_scenario(structure, parts_to_fail):
+    """
+    Evaluates one scenario on a structure from build_structure().
+    Returns (num_components, largest_cc), as simulate_supplier_collapse does.
+    """
+    num_cars, part_users = structure
+    failed = set(parts_to_fail)
+
+    uf = UnionFind(num_cars)
+    for part, users in part_users.items():
+        if part in failed:
+            continue
+        for other in users[1:]:
+            uf.union(users[0], other)
+    return uf.components, uf.largest
+
+
+def _init_worker(structure):
+    global _STRUCTURE
+    _STRUCTURE = structure
+
+
+def _run_worker(parts_to_fail):
+    return evaluate_scenario(_STRUCTURE, parts_to_fail)
+
+
+def _resolve_processes(processes, num_tasks):
+    if processes is None:
+        processes = os.cpu_count() or 1
+    return max(1, min(processes, num_tasks))
+
+
+def iter_supplier_scenarios(B, scenarios, processes=None):
+    """
+    Evaluates scenarios across a process pool, streaming results as they finish.
+    Yields (scenario_index, (num_components, largest_cc)) in completion order.
+    - processes: pool size (defaults to the CPU count); 1 runs in this process.
+    """
+    scenarios = [list(s) for s in scenarios]
+    if not scenarios:
+        return
+    structure = build_structure(B)
+    processes = _resolve_processes(processes, len(scenarios))
+
+    if processes == 1:
+        for i, parts in enumerate(scenarios):
+            yield i, evaluate_scenario(structure, parts)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(structure,)) as pool:
+        futures = {pool.submit(_run_worker, parts): i for i, parts in enumerate(scenarios)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def run_supplier_scenarios(B, scenarios, processes=None, chunksize=None):
+    """
+    Evaluates many supplier-collapse scenarios across a process pool.
+    Returns [(num_components, largest_cc)] in the order of the scenarios.
+    - processes: pool size (defaults to the CPU count); 1 runs in this process.
+    - chunksize: scenarios sent to a worker at a time (defaults to an even split).
+    """
+    scenarios = [list(s) for s in scenarios]
+    if not scenarios:
+        return []
+    structure = build_structure(B)
+    processes = _resolve_processes(processes, len(scenarios))
+
+    if processes == 1:
+        return [evaluate_scenario(structure, parts) for parts in scenarios]
+
+    if chunksize is None:
+        chunksize = max(1, len(scenarios) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                             initargs=(structure,)) as pool:
+        return list(pool.map(_run_worker, scenarios, chunksize=chunksize))
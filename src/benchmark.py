@@ -0,0 +1,300 @@
+"""
+Offline benchmark harness for the graph_ops hot paths and the visualizer.
+
+Every benchmark runs on a ladder of synthetic catalogs (synthetic.py), so no
+data or network access is needed. For each (benchmark, size) the best of
+`repeat` wall-clock times and the peak traced memory (tracemalloc, a separate
+run) are recorded. Results are written as JSON and/or CSV, and a previous
+JSON file can serve as a baseline: slower or hungrier results beyond a
+threshold are flagged as regressions.
+
+    python -m src.benchmark --sizes 100 300 1000 --json bench.json
+    python -m src.benchmark --baseline bench.json --threshold 0.25
+
+Some benchmarks are quadratic by nature (the projected graph of a catalog
+with a few near-universal parts is almost complete), or are loop reference
+implementations; each has a size limit above which it is skipped.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from . import cache, graph_ops, synthetic
+
+DEFAULT_SIZES = (100, 300, 1000)
+# Benchmarks that need the projected graph are skipped above this many cars
+PROJECTION_LIMIT = 1000
+LOOP_LIMIT = 300
+
+
+class _Context:
+    """Lazily built inputs for one catalog size (setup is never timed)."""
+
+    def __init__(self, num_cars, seed, workdir):
+        self.num_cars = num_cars
+        self.seed = seed
+        self.workdir = workdir
+        self.B = synthetic.generate_bipartite_graph(num_cars, seed=seed)
+        self.cars = graph_ops.projection.car_nodes(self.B)
+        self._projected = None
+        self._critical = None
+
+    @property
+    def projected(self):
+        if self._projected is None:
+            self._projected = graph_ops.build_projected_graph(self.B, method='sparse')
+            graph_ops.calculate_jaccard_weights(self.B, self._projected, method='sparse')
+        return self._projected
+
+    @property
+    def top_parts(self):
+        if self._critical is None:
+            k = min(64, self.B.number_of_nodes())
+            self._critical = graph_ops.get_part_criticality(self.B, k=k, seed=0)
+        return [p for p, *_ in self._critical[:20]]
+
+    @property
+    def critical(self):
+        self.top_parts
+        return self._critical
+
+    @property
+    def platforms(self):
+        """Cars grouped by synthetic platform, standing in for detected communities."""
+        groups = {}
+        for car in self.cars:
+            groups.setdefault(car.split()[1], set()).add(car)
+        return list(groups.values())
+
+    def path(self, name):
+        return os.path.join(self.workdir, name)
+
+
+def _plot_graph(ctx):
+    from . import layout_cache, visualizer
+    store = layout_cache.LayoutStore(tempfile.mkdtemp(dir=ctx.workdir))  # Always a cold layout
+    visualizer.plot_graph(ctx.projected, filename=ctx.path("graph.png"), weighted=True,
+                          layout_store=store)
+
+
+def _plot(func_name, make_args):
+    def run(ctx):
+        from . import visualizer
+        args, kwargs = make_args(ctx)
+        getattr(visualizer, func_name)(*args, filename=ctx.path(func_name + ".png"), **kwargs)
+    return run
+
+
+def _resilience_args(c):
+    return (graph_ops.simulate_cumulative_failure(c.B, c.top_parts, method='percolation'),), {}
+
+
+def _k_core_args(c):
+    return (c.projected, graph_ops.get_k_core_decomposition(c.projected)[0]), {}
+
+
+# name -> (function of a _Context, largest number of cars it runs on or None)
+BENCHMARKS = {
+    'build_projected_graph[loop]': (
+        lambda c: graph_ops.build_projected_graph(c.B, method='loop'), LOOP_LIMIT),
+    'build_projected_graph[sparse]': (
+        lambda c: graph_ops.build_projected_graph(c.B, method='sparse'), PROJECTION_LIMIT),
+    'get_part_criticality': (
+        lambda c: graph_ops.get_part_criticality(c.B), PROJECTION_LIMIT),
+    'get_part_criticality[k=64]': (
+        lambda c: graph_ops.get_part_criticality(c.B, k=64, seed=0), None),
+    'get_graph_info': (
+        lambda c: graph_ops.get_graph_info(c.projected), PROJECTION_LIMIT),
+    'get_graph_info[sampled]': (
+        lambda c: graph_ops.get_graph_info(c.projected, apl_samples=64, seed=0), PROJECTION_LIMIT),
+    'detect_communities[greedy]': (
+        lambda c: graph_ops.detect_communities(c.projected), LOOP_LIMIT),
+    'detect_communities[louvain]': (
+        lambda c: graph_ops.detect_communities(c.projected, method='louvain', seed=0),
+        PROJECTION_LIMIT),
+    'simulate_cumulative_failure[loop]': (
+        lambda c: graph_ops.simulate_cumulative_failure(c.B, c.top_parts), LOOP_LIMIT),
+    'simulate_cumulative_failure[percolation]': (
+        lambda c: graph_ops.simulate_cumulative_failure(c.B, c.top_parts, method='percolation'),
+        None),
+    'calculate_jaccard_weights[loop]': (
+        lambda c: graph_ops.calculate_jaccard_weights(c.B, c.projected), LOOP_LIMIT),
+    'calculate_jaccard_weights[sparse]': (
+        lambda c: graph_ops.calculate_jaccard_weights(c.B, c.projected, method='sparse'),
+        PROJECTION_LIMIT),
+    'predict_demand': (
+        lambda c: graph_ops.predict_demand(c.B, c.platforms), None),
+    'plot_graph': (_plot_graph, PROJECTION_LIMIT),
+    'plot_criticality': (_plot('plot_criticality', lambda c: ((c.critical,), {})), None),
+    'plot_resilience_curve': (_plot('plot_resilience_curve', _resilience_args), None),
+    'plot_k_core': (_plot('plot_k_core', _k_core_args), PROJECTION_LIMIT),
+    'plot_jaccard_heatmap': (
+        _plot('plot_jaccard_heatmap', lambda c: ((c.projected,), {})), PROJECTION_LIMIT),
+    'plot_degree_distribution': (
+        _plot('plot_degree_distribution', lambda c: ((c.B,), {})), None),
+}
+
+
+def _measure(func, ctx, repeat, memory):
+    """Best wall time of repeat runs, plus peak traced memory (MB) of one more run."""
+    best = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            cache.invalidate()  # Time the analysis, not the memoized result
+            start = time.perf_counter()
+            func(ctx)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        peak = None
+        if memory:
+            cache.invalidate()
+            tracemalloc.start()
+            try:
+                func(ctx)
+                peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            finally:
+                tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, names=None, repeat=3, memory=True, seed=0, verbose=True):
+    """
+    Runs the selected benchmarks (all by default) on synthetic catalogs of each size.
+    Returns a list of records {'benchmark', 'cars', 'parts', 'edges', 'seconds', 'peak_mb'}.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+    names = list(BENCHMARKS) if names is None else list(names)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            ctx = _Context(size, seed, workdir)
+            parts = ctx.B.number_of_nodes() - len(ctx.cars)
+            for name in names:
+                func, limit = BENCHMARKS[name]
+                if limit is not None and size > limit:
+                    continue
+                seconds, peak = _measure(func, ctx, repeat, memory)
+                record = {'benchmark': name, 'cars': size, 'parts': parts,
+                          'edges': ctx.B.number_of_edges(), 'seconds': seconds, 'peak_mb': peak}
+                results.append(record)
+                if verbose:
+                    mem = f"{peak:10.1f} MB" if peak is not None else ""
+                    print(f"{name:<42} {size:>8} cars {seconds:10.4f} s {mem}", flush=True)
+    return results
+
+
+def _metadata():
+    import networkx
+    import numpy
+    import scipy
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'networkx': networkx.__version__,
+        'numpy': numpy.__version__,
+        'scipy': scipy.__version__,
+    }
+
+
+def write_json(results, path, **settings):
+    with open(path, 'w') as f:
+        json.dump({'metadata': dict(_metadata(), **settings), 'results': results}, f, indent=2)
+
+
+def write_csv(results, path):
+    fields = ['benchmark', 'cars', 'parts', 'edges', 'seconds', 'peak_mb']
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_results(path):
+    """Results from a JSON file written by write_json."""
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=0.25, min_seconds=0.005):
+    """
+    Flags results slower (or with a higher memory peak) than the baseline by
+    more than threshold (0.25 = 25%). Timings under min_seconds in both runs
+    are ignored as noise. Returns [(benchmark, cars, metric, baseline, current)].
+    """
+    previous = {(r['benchmark'], r['cars']): r for r in baseline}
+    regressions = []
+    for r in results:
+        old = previous.get((r['benchmark'], r['cars']))
+        if old is None:
+            continue
+        seconds, old_seconds = r['seconds'], old['seconds']
+        if max(seconds, old_seconds) >= min_seconds and seconds > old_seconds * (1 + threshold):
+            regressions.append((r['benchmark'], r['cars'], 'seconds', old_seconds, seconds))
+        peak, old_peak = r.get('peak_mb'), old.get('peak_mb')
+        if peak is not None and old_peak is not None \
+                and peak > old_peak * (1 + threshold) and peak - old_peak > 1:
+            regressions.append((r['benchmark'], r['cars'], 'peak_mb', old_peak, peak))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmarks graph_ops and visualizer on synthetic catalogs.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="numbers of cars")
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help="benchmarks to run (default: all)")
+    parser.add_argument('--list', action='store_true', help="list benchmark names and exit")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="write results to this JSON file")
+    parser.add_argument('--csv', help="write results to this CSV file")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, limit) in BENCHMARKS.items():
+            print(f"{name:<42} {'up to %d cars' % limit if limit else ''}")
+        return 0
+
+    results = run_benchmarks(args.sizes, args.only, args.repeat, not args.no_memory, args.seed)
+    if args.json:
+        write_json(results, args.json, sizes=args.sizes, repeat=args.repeat, seed=args.seed)
+    if args.csv:
+        write_csv(results, args.csv)
+
+    if args.baseline:
+        regressions = compare(results, load_results(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for name, cars, metric, old, new in regressions:
+                change = new / old - 1
+                print(f"  {name} @ {cars} cars: {metric} {old:.4f} -> {new:.4f} ({change:+.0%})")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
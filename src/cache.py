@@ -0,0 +1,117 @@
+"""
+Memoization of expensive graph analyses keyed by a structural fingerprint.
+
+The CLI, the report and the article generators run the same analyses on
+unchanged graphs. Results are cached under (analysis, fingerprint, arguments)
+with LRU eviction, so repeated calls on the same structure return at once.
+"""
+import functools
+import hashlib
+from collections import OrderedDict
+
+
+def graph_fingerprint(G):
+    """
+    Returns a hex digest of the structure of G: nodes with their 'type', and
+    edges with their 'weight'. Stable across runs and independent of insertion order.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    nodes = sorted((repr(n), repr(d.get('type'))) for n, d in G.nodes(data=True))
+    for name, kind in nodes:
+        h.update(f"N{name}:{kind}\n".encode())
+
+    edges = []
+    for u, v, d in G.edges(data=True):
+        a, b = sorted((repr(u), repr(v)))
+        edges.append((a, b, repr(d.get('weight'))))
+    for a, b, w in sorted(edges):
+        h.update(f"E{a}|{b}:{w}\n".encode())
+    return h.hexdigest()
+
+
+class AnalysisCache:
+    """LRU cache of analysis results keyed by graph fingerprint."""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, G=None):
+        """Drops every entry, or only the entries computed on graph G."""
+        if G is None:
+            self._entries.clear()
+            return
+        fingerprint = graph_fingerprint(G)
+        for key in [k for k in self._entries if k[1] == fingerprint]:
+            del self._entries[key]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared by graph_ops, so the CLI and both generators reuse each other's results
+default_cache = AnalysisCache()
+
+
+def analysis_key(func, G, args=(), kwargs=None):
+    """
+    The default_cache key of func(G, *args, **kwargs), or None when the
+    arguments are unhashable or G cannot be fingerprinted (not a networkx-like
+    graph, e.g. a csr.CSRGraph); such calls are not cached.
+    """
+    try:
+        key = (func.__qualname__, graph_fingerprint(G), tuple(args),
+               tuple(sorted((kwargs or {}).items())))
+        hash(key)
+    except (TypeError, AttributeError):
+        return None
+    return key
+
+
+def cached_analysis(func):
+    """
+    Caches func(G, *args, **kwargs) in default_cache.
+    Calls with unhashable arguments or a graph without networkx edges run
+    uncached. The undecorated function is available as .uncached, for callers
+    that compute the result elsewhere (e.g. in a worker process) and store it
+    under analysis_key themselves.
+    """
+    @functools.wraps(func)
+    def wrapper(G, *args, **kwargs):
+        key = analysis_key(func, G, args, kwargs)
+        if key is None:
+            return func(G, *args, **kwargs)
+
+        missing = object()
+        result = default_cache.get(key, missing)
+        if result is missing:
+            result = func(G, *args, **kwargs)
+            default_cache.put(key, result)
+        return result
+
+    wrapper.uncached = func
+    return wrapper
+
+
+def invalidate(G=None):
+    """Drops cached analyses (all of them, or only those computed on G)."""
+    default_cache.invalidate(G)
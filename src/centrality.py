@@ -0,0 +1,144 @@
+"""
+Centrality engines used by graph_ops.get_part_criticality.
+"""
+import math
+import random
+
+import networkx as nx
+
+from .projection import part_nodes
+
+
+def sample_size_for_error(n, epsilon, delta=0.1):
+    """
+    Number of pivots needed so that every normalized betweenness estimate is
+    within epsilon of the exact value with probability at least 1 - delta
+    (Hoeffding bound with a union bound over the n vertices).
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon must be in (0, 1)")
+    if n < 2:
+        return n
+    k = math.ceil(math.log(2 * n / delta) / (2 * epsilon ** 2))
+    return min(k, n)
+
+
+def betweenness_centrality(B, k=None, epsilon=None, delta=0.1, seed=None, parts_only=False):
+    """
+    Betweenness Centrality on the bipartite graph, exact or by pivot sampling.
+    - k: number of sampled source pivots (exact when k and epsilon are None).
+    - epsilon, delta: pick k so the error is below epsilon with probability 1 - delta.
+    - seed: makes the sampled pivots reproducible.
+    - parts_only: only count shortest paths between pairs of parts.
+    Returns a dict node -> normalized betweenness.
+    """
+    sources = part_nodes(B) if parts_only else list(B.nodes())
+    n = len(sources)
+    if epsilon is not None:
+        k = sample_size_for_error(n, epsilon, delta)
+    if k is not None and k >= n:
+        k = None
+
+    if not parts_only:
+        return nx.betweenness_centrality(B, k=k, seed=seed)
+
+    pivots = sources if k is None else random.Random(seed).sample(sources, k)
+    scores = nx.betweenness_centrality_subset(B, sources=pivots, targets=sources)
+
+    # Extrapolate the sampled sources, then normalize by the number of part pairs
+    scale = n / len(pivots) if pivots else 0.0
+    pairs = (n - 1) * (n - 2) / 2 if n > 2 else 1.0
+    return {v: s * scale / pairs for v, s in scores.items()}
+
+
+def _adjacency(G, weight):
+    nodes = list(G.nodes())
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, format='csr', dtype=float)
+    return nodes, A
+
+
+def _start_vector(nodes, x0):
+    import numpy as np
+
+    if x0 is None:
+        return np.full(len(nodes), 1.0 / len(nodes))
+    # Warm start: reuse known scores, give new nodes the average of the known ones
+    known = [x0[n] for n in nodes if n in x0]
+    fill = sum(known) / len(known) if known else 1.0
+    x = np.array([x0.get(n, fill) for n in nodes], dtype=float)
+    x = np.abs(x)
+    if x.sum() == 0:
+        x[:] = 1.0
+    return x / x.sum()
+
+
+def eigenvector_centrality(G, x0=None, weight=None, shift=1.0, tol=1e-6, max_iter=1000,
+                           full_output=False):
+    """
+    Eigenvector Centrality by sparse power iteration on (A + shift * I).
+    On a bipartite graph A has eigenvalues +l and -l, so plain power iteration
+    oscillates; the shift makes the leading eigenvalue strictly dominant.
+    - x0: previous {node: score} to warm-start from (e.g. before removing a part).
+    - full_output: also return the number of iterations used.
+    Returns a dict node -> score with unit Euclidean norm, like networkx.
+    Raises nx.PowerIterationFailedConvergence after max_iter iterations.
+    """
+    import numpy as np
+
+    if len(G) == 0:
+        return ({}, 0) if full_output else {}
+    nodes, A = _adjacency(G, weight)
+    n = len(nodes)
+    x = _start_vector(nodes, x0)
+
+    for iteration in range(1, max_iter + 1):
+        x_last = x
+        x = A @ x_last + shift * x_last
+        norm = np.linalg.norm(x)
+        if norm == 0:
+            x = x_last
+            break
+        x = x / norm
+        x_last = x_last / np.linalg.norm(x_last)
+        if np.abs(x - x_last).sum() < n * tol:
+            break
+    else:
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    scores = dict(zip(nodes, x.tolist()))
+    return (scores, iteration) if full_output else scores
+
+
+def pagerank(G, alpha=0.85, x0=None, weight='weight', tol=1e-6, max_iter=100, full_output=False):
+    """
+    PageRank by sparse power iteration. Damping removes the bipartite periodicity.
+    Dangling nodes spread their rank uniformly.
+    - x0: previous {node: score} to warm-start from.
+    - full_output: also return the number of iterations used.
+    Returns a dict node -> score summing to 1.
+    Raises nx.PowerIterationFailedConvergence after max_iter iterations.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    if len(G) == 0:
+        return ({}, 0) if full_output else {}
+    nodes, A = _adjacency(G, weight)
+    n = len(nodes)
+
+    out_degree = np.asarray(A.sum(axis=1)).ravel()
+    dangling = out_degree == 0
+    inv = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    M = (sparse.diags(inv) @ A).T.tocsr()
+    x = _start_vector(nodes, x0)
+
+    for iteration in range(1, max_iter + 1):
+        x_last = x
+        x = alpha * (M @ x_last + x_last[dangling].sum() / n) + (1 - alpha) / n
+        if np.abs(x - x_last).sum() < n * tol:
+            break
+    else:
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    scores = dict(zip(nodes, x.tolist()))
+    return (scores, iteration) if full_output else scores
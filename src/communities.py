@@ -0,0 +1,149 @@
+"""
+Seeded, weighted Louvain community detection with warm starts.
+
+Local moving uses a queue (as in Leiden's fast local move): only nodes whose
+neighbourhood changed are revisited. Starting from a previous partition with
+a set of affected nodes therefore only refines the communities around them,
+which is what happens after a few parts are added to or removed from the
+catalog. Communities are then aggregated into super-nodes and the process
+repeats until modularity stops improving.
+"""
+import random
+from collections import deque
+
+
+def _graph_tables(G, weight):
+    """Adjacency {u: {v: w}} without self-loops, plus self-loop weights per node."""
+    adj = {u: {} for u in G.nodes()}
+    loops = {u: 0.0 for u in G.nodes()}
+    for u, v, d in G.edges(data=True):
+        w = float(d.get(weight, 1)) if weight else 1.0
+        if u == v:
+            loops[u] += w
+        else:
+            adj[u][v] = adj[u].get(v, 0.0) + w
+            adj[v][u] = adj[v].get(u, 0.0) + w
+    return adj, loops
+
+
+def _local_moving(adj, loops, comm, queue_nodes, resolution, rng, tol=1e-12):
+    """
+    Moves nodes between communities while modularity improves.
+    comm is updated in place. Returns True if any node moved.
+    """
+    degree = {u: sum(nbrs.values()) + 2 * loops[u] for u, nbrs in adj.items()}
+    m2 = sum(degree.values())
+    if m2 == 0:
+        return False
+    tot = {}
+    for u, c in comm.items():
+        tot[c] = tot.get(c, 0.0) + degree[u]
+
+    order = list(queue_nodes)
+    rng.shuffle(order)
+    queue = deque(order)
+    queued = set(order)
+    moved = False
+
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        own = comm[u]
+        k = degree[u]
+
+        links = {}
+        for v, w in adj[u].items():
+            links[comm[v]] = links.get(comm[v], 0.0) + w
+
+        tot[own] -= k
+        best, best_gain = own, links.get(own, 0.0) - resolution * tot[own] * k / m2
+        for c, w in links.items():
+            gain = w - resolution * tot[c] * k / m2
+            if gain > best_gain + tol:
+                best, best_gain = c, gain
+        tot[best] = tot.get(best, 0.0) + k
+
+        if best != own:
+            comm[u] = best
+            moved = True
+            for v in adj[u]:
+                if comm[v] != best and v not in queued:
+                    queue.append(v)
+                    queued.add(v)
+    return moved
+
+
+def _aggregate(adj, loops, comm):
+    """Collapses each community into one super-node."""
+    new_adj = {c: {} for c in set(comm.values())}
+    new_loops = {c: 0.0 for c in new_adj}
+    for u, nbrs in adj.items():
+        cu = comm[u]
+        new_loops[cu] += loops[u]
+        for v, w in nbrs.items():
+            cv = comm[v]
+            if cu == cv:
+                new_loops[cu] += w / 2  # each internal edge is seen from both ends
+            else:
+                new_adj[cu][cv] = new_adj[cu].get(cv, 0.0) + w
+    return new_adj, new_loops
+
+
+def louvain(G, weight='weight', resolution=1.0, seed=None, init=None, affected=None, max_levels=20):
+    """
+    Louvain community detection on an undirected graph.
+    - weight: edge attribute used as weight (None for unweighted).
+    - seed: makes the node visiting order, and so the result, deterministic.
+    - init: previous {node: community_id} to warm-start from; new nodes start alone.
+    - affected: with init, only these nodes are queued in the first pass.
+    Returns (community_map, communities) like graph_ops.detect_communities,
+    communities sorted by size (largest first).
+    """
+    rng = random.Random(seed)
+    adj, loops = _graph_tables(G, weight)
+
+    # Level-0 partition: the previous one, or singletons
+    if init is not None:
+        labels = {}
+        comm = {}
+        for u in adj:
+            key = ('init', init[u]) if u in init else ('new', u)
+            comm[u] = labels.setdefault(key, len(labels))
+        queue_nodes = [u for u in adj if u in affected] if affected is not None else list(adj)
+    else:
+        comm = {u: i for i, u in enumerate(adj)}
+        queue_nodes = list(adj)
+
+    membership = {u: u for u in adj}  # original node -> current super-node
+    for level in range(max_levels):
+        moved = _local_moving(adj, loops, comm, queue_nodes, resolution, rng)
+        if level > 0 and not moved:
+            break
+        membership = {u: comm[s] for u, s in membership.items()}
+        size_before = len(adj)
+        adj, loops = _aggregate(adj, loops, comm)
+        comm = {c: c for c in adj}
+        queue_nodes = list(adj)
+        if len(adj) == size_before:
+            break
+
+    groups = {}
+    for u, c in membership.items():
+        groups.setdefault(c, set()).add(u)
+    communities = sorted(groups.values(), key=lambda c: (-len(c), sorted(map(str, c))))
+    community_map = {u: i for i, c in enumerate(communities) for u in c}
+    return community_map, [frozenset(c) for c in communities]
+
+
+def refine_communities(G, community_map, changed_nodes, weight='weight', resolution=1.0, seed=None):
+    """
+    Updates a previous partition after local changes (e.g. parts added or
+    removed). Only the changed nodes and their neighbours are revisited first.
+    """
+    affected = set()
+    for u in changed_nodes:
+        if u in G:
+            affected.add(u)
+            affected.update(G.neighbors(u))
+    return louvain(G, weight=weight, resolution=resolution, seed=seed,
+                   init=community_map, affected=affected)
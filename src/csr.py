@@ -0,0 +1,241 @@
+"""
+Compact integer-ID CSR graph core.
+
+networkx keeps every edge in nested dicts keyed by long name strings, which
+costs hundreds of bytes per edge. CSRGraph interns node names once, stores
+adjacency as CSR offset/neighbor arrays and edge attributes as flat arrays
+aligned with the neighbor array (a few bytes per edge).
+
+CSRGraph implements a small part of the networkx API (nodes, neighbors,
+degree, membership). graph_ops accepts it directly for projection
+(build_projected_graph), degrees (get_degrees), failure simulation
+(simulate_part_failure, simulate_supplier_collapse, simulate_cumulative_failure)
+and Jaccard weights (calculate_jaccard_weights); the other analyses need a
+networkx graph (see to_networkx).
+"""
+import sys
+
+import networkx as nx
+
+KINDS = ('car', 'part')
+
+
+class _DegreeView:
+    """Mimics G.degree: iterable of (node, degree) and callable as G.degree(node)."""
+
+    def __init__(self, G):
+        self._G = G
+
+    def __iter__(self):
+        deg = self._G.degree_array()
+        return iter(zip(self._G.names, deg.tolist()))
+
+    def __call__(self, nbunch=None):
+        G = self._G
+        if nbunch is None:
+            return iter(self)
+        if nbunch in G:
+            i = G.index[nbunch]
+            return int(G.indptr[i + 1] - G.indptr[i])
+        return [(n, self(n)) for n in nbunch]
+
+
+class CSRGraph:
+    """
+    Undirected graph in CSR form.
+    - names: node names, position = node ID.
+    - kinds: per node index into KINDS ('car'/'part'), -1 if untyped.
+    - indptr, indices: CSR offsets and sorted neighbor IDs (each edge stored twice).
+    - edge_data: {attribute: array aligned with indices}, e.g. 'weight'.
+    """
+
+    def __init__(self, names, kinds, indptr, indices, edge_data=None):
+        import numpy as np
+
+        self.names = [sys.intern(n) if isinstance(n, str) else n for n in names]
+        self.index = {n: i for i, n in enumerate(self.names)}
+        self.kinds = np.asarray(kinds, dtype=np.int8)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.edge_data = dict(edge_data or {})
+
+    # ---------- networkx-like API ----------
+
+    def __contains__(self, n):
+        try:
+            return n in self.index
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def nodes(self, data=False):
+        if not data:
+            return list(self.names)
+        return [(n, {'type': KINDS[k]} if k >= 0 else {})
+                for n, k in zip(self.names, self.kinds.tolist())]
+
+    def neighbors(self, n):
+        i = self.index[n]
+        names = self.names
+        return (names[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]].tolist())
+
+    @property
+    def degree(self):
+        return _DegreeView(self)
+
+    def degree_array(self):
+        import numpy as np
+
+        return np.diff(self.indptr)
+
+    def number_of_nodes(self):
+        return len(self.names)
+
+    def number_of_edges(self):
+        return len(self.indices) // 2
+
+    def copy(self):
+        return CSRGraph(self.names, self.kinds.copy(), self.indptr.copy(), self.indices.copy(),
+                        {k: v.copy() for k, v in self.edge_data.items()})
+
+    # ---------- CSR helpers ----------
+
+    def ids_of_kind(self, kind):
+        import numpy as np
+
+        return np.flatnonzero(self.kinds == KINDS.index(kind))
+
+    def to_scipy(self, attr=None):
+        """Returns the adjacency as a scipy CSR matrix (values from edge_data[attr], or ones)."""
+        import numpy as np
+        from scipy import sparse
+
+        n = len(self.names)
+        data = self.edge_data[attr] if attr else np.ones(len(self.indices), dtype=np.int32)
+        return sparse.csr_matrix((data, self.indices, self.indptr), shape=(n, n))
+
+    def remove_nodes(self, nodes):
+        """Returns a new CSRGraph without the given nodes (unknown names are ignored)."""
+        import numpy as np
+
+        drop = np.zeros(len(self.names), dtype=bool)
+        drop[[self.index[n] for n in nodes if n in self]] = True
+        keep = np.flatnonzero(~drop)
+        new_id = np.full(len(self.names), -1, dtype=np.int64)
+        new_id[keep] = np.arange(len(keep))
+
+        rows = np.repeat(np.arange(len(self.names)), self.degree_array())
+        mask = ~drop[rows] & ~drop[self.indices]
+        counts = np.bincount(new_id[rows[mask]], minlength=len(keep))
+        indptr = np.concatenate(([0], np.cumsum(counts)))
+        return CSRGraph([self.names[i] for i in keep.tolist()], self.kinds[keep], indptr,
+                        new_id[self.indices[mask]],
+                        {k: v[mask] for k, v in self.edge_data.items()})
+
+    @property
+    def nbytes(self):
+        """Bytes used by the arrays (names table excluded)."""
+        return (self.kinds.nbytes + self.indptr.nbytes + self.indices.nbytes
+                + sum(v.nbytes for v in self.edge_data.values()))
+
+
+def from_scipy(names, kinds, M, attr='weight'):
+    """Builds a CSRGraph from a symmetric scipy matrix; values go to edge_data[attr]."""
+    import numpy as np
+
+    M = M.tocsr()
+    M.sort_indices()
+    edge_data = {attr: np.asarray(M.data, dtype=np.int32)} if attr else None
+    return CSRGraph(names, kinds, M.indptr, M.indices, edge_data)
+
+
+def from_networkx(G, weight=None):
+    """
+    Converts a networkx graph. Node 'type' becomes kinds; edge attribute
+    `weight` (if given) is copied to edge_data.
+    """
+    import numpy as np
+
+    names = list(G.nodes())
+    index = {n: i for i, n in enumerate(names)}
+    kinds = [KINDS.index(d['type']) if d.get('type') in KINDS else -1
+             for _, d in G.nodes(data=True)]
+
+    indptr = [0]
+    indices = []
+    values = []
+    for n in names:
+        row = sorted((index[m], d.get(weight, 1) if weight else 1) for m, d in G[n].items())
+        indices.extend(j for j, _ in row)
+        values.extend(w for _, w in row)
+        indptr.append(len(indices))
+
+    edge_data = {weight: np.asarray(values, dtype=np.int32)} if weight else None
+    return CSRGraph(names, kinds, indptr, indices, edge_data)
+
+
+def to_networkx(G):
+    """Converts back to networkx, restoring 'type'/'bipartite' node attributes and edge_data."""
+    N = nx.Graph()
+    for n, k in zip(G.names, G.kinds.tolist()):
+        if k >= 0:
+            N.add_node(n, type=KINDS[k], bipartite=k)
+        else:
+            N.add_node(n)
+
+    names = G.names
+    indptr = G.indptr.tolist()
+    indices = G.indices.tolist()
+    columns = {k: v.tolist() for k, v in G.edge_data.items()}
+    for i in range(len(names)):
+        for pos in range(indptr[i], indptr[i + 1]):
+            j = indices[pos]
+            if i < j:
+                N.add_edge(names[i], names[j], **{k: col[pos] for k, col in columns.items()})
+    return N
+
+
+def project(B):
+    """
+    Projected Graph of a bipartite CSRGraph as a CSRGraph of cars.
+    edge_data['weight'] holds the number of shared parts.
+    """
+    cars = B.ids_of_kind('car')
+    parts = B.ids_of_kind('part')
+    A = B.to_scipy()[cars][:, parts]
+    C = (A @ A.T).tolil()
+    C.setdiag(0)
+    C = C.tocsr()
+    C.eliminate_zeros()
+    return from_scipy([B.names[i] for i in cars.tolist()], B.kinds[cars], C)
+
+
+def connected_components(G):
+    """Returns (num_components, largest_component_size) of a CSRGraph."""
+    import numpy as np
+    from scipy.sparse.csgraph import connected_components as scipy_components
+
+    if len(G) == 0:
+        return 0, 0
+    num, labels = scipy_components(G.to_scipy(), directed=False)
+    return num, int(np.bincount(labels).max())
+
+
+def jaccard(B, P):
+    """
+    Jaccard similarity for every stored edge of a projected CSRGraph P,
+    J = w / (deg(u) + deg(v) - w) with degrees taken from B.
+    Returns an array aligned with P.indices.
+    """
+    import numpy as np
+
+    deg = np.array([B.degree(n) for n in P.names], dtype=np.float64)
+    rows = np.repeat(np.arange(len(P.names)), P.degree_array())
+    w = P.edge_data['weight'].astype(np.float64)
+    union = deg[rows] + deg[P.indices] - w
+    return np.divide(w, union, out=np.zeros_like(w), where=union > 0)
@@ -0,0 +1,192 @@
+"""
+Scalable distance metrics for get_graph_info.
+
+nx.diameter, nx.center and nx.average_shortest_path_length each run their
+own all-pairs BFS. Here one pass over BFS sources (optionally spread over a
+process pool) yields eccentricities and distance sums together, serving
+diameter, radius, center and average path length at once. For large graphs:
+- bounding_eccentricities: exact eccentricities with few BFS runs by
+  maintaining lower/upper bounds (Takes & Kosters, "BoundingDiameters");
+- ifub_diameter: the diameter alone with the iFUB fringe-level bound;
+- sampled_average_path_length: BFS from sampled sources, with a confidence interval.
+All functions expect a connected undirected graph.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import networkx as nx
+
+# Adjacency installed in each worker by _init_worker
+_ADJACENCY = None
+
+
+def _adjacency(G):
+    nodes = list(G.nodes())
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+    return nodes, A
+
+
+def _bfs(A, sources):
+    """Hop distances from each source (rows) to every node; raises if some node is unreachable."""
+    import numpy as np
+    from scipy.sparse.csgraph import shortest_path
+
+    dist = shortest_path(A, directed=False, unweighted=True, indices=sources)
+    if np.isinf(dist).any():
+        raise nx.NetworkXError("Graph is not connected.")
+    return dist.astype(np.int64)
+
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _source_stats(A, sources):
+    """(eccentricities, distance sums) for a list of sources, in row chunks."""
+    import numpy as np
+
+    n = A.shape[0]
+    step = max(1, (1 << 22) // max(n, 1))
+    ecc, sums = [], []
+    for chunk in _chunks(list(sources), step):
+        dist = _bfs(A, chunk)
+        ecc.append(dist.max(axis=1))
+        sums.append(dist.sum(axis=1))
+    return np.concatenate(ecc), np.concatenate(sums)
+
+
+def _init_worker(A):
+    global _ADJACENCY
+    _ADJACENCY = A
+
+
+def _run_worker(sources):
+    return _source_stats(_ADJACENCY, sources)
+
+
+def all_source_metrics(G, processes=None):
+    """
+    One BFS per node, serving every distance metric at once.
+    - processes: spread the BFS sources over a process pool (None/1 runs here).
+    Returns {'eccentricity', 'diameter', 'radius', 'center', 'avg_path_length'}.
+    """
+    import numpy as np
+
+    nodes, A = _adjacency(G)
+    n = len(nodes)
+    if n == 0:
+        raise nx.NetworkXPointlessConcept("Distance metrics need at least one node.")
+    sources = list(range(n))
+
+    if processes and processes > 1:
+        parts = _chunks(sources, max(1, -(-n // (processes * 4))))
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                 initargs=(A,)) as pool:
+            results = list(pool.map(_run_worker, parts))
+        ecc = np.concatenate([r[0] for r in results])
+        sums = np.concatenate([r[1] for r in results])
+    else:
+        ecc, sums = _source_stats(A, sources)
+
+    eccentricity = dict(zip(nodes, ecc.tolist()))
+    radius = int(ecc.min())
+    return {
+        'eccentricity': eccentricity,
+        'diameter': int(ecc.max()),
+        'radius': radius,
+        'center': [v for v in nodes if eccentricity[v] == radius],
+        'avg_path_length': float(sums.sum()) / (n * (n - 1)) if n > 1 else 0.0,
+    }
+
+
+def bounding_eccentricities(G):
+    """
+    Exact eccentricities with the BoundingDiameters bounds: after a BFS from v,
+    every w satisfies max(ecc(v) - d(v, w), d(v, w)) <= ecc(w) <= ecc(v) + d(v, w).
+    BFS sources alternate between the largest upper and smallest lower bound.
+    Returns (eccentricity dict, number of BFS runs).
+    """
+    import numpy as np
+
+    nodes, A = _adjacency(G)
+    n = len(nodes)
+    lower = np.zeros(n, dtype=np.int64)
+    upper = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+    unresolved = np.ones(n, dtype=bool)
+    degree = np.diff(A.indptr)
+    runs = 0
+    pick_upper = True
+
+    while unresolved.any():
+        candidates = np.flatnonzero(unresolved)
+        if pick_upper:
+            # Ties broken by degree: hubs tighten the bounds of many nodes
+            v = candidates[np.lexsort((-degree[candidates], -upper[candidates]))[0]]
+        else:
+            v = candidates[np.lexsort((-degree[candidates], lower[candidates]))[0]]
+        pick_upper = not pick_upper
+
+        dist = _bfs(A, [v])[0]
+        runs += 1
+        ecc_v = int(dist.max())
+        lower = np.maximum(lower, np.maximum(ecc_v - dist, dist))
+        upper = np.minimum(upper, ecc_v + dist)
+        lower[v] = upper[v] = ecc_v
+        unresolved &= lower != upper
+
+    return dict(zip(nodes, lower.tolist())), runs
+
+
+def ifub_diameter(G, start=None):
+    """
+    Diameter with iFUB: BFS from a central node, then eccentricities of the
+    fringe levels from the deepest up, stopping once the lower bound exceeds
+    twice the next level. Returns (diameter, number of BFS runs).
+    """
+    import numpy as np
+
+    nodes, A = _adjacency(G)
+    if start is None:
+        u = int(np.argmax(np.diff(A.indptr)))
+    else:
+        u = nodes.index(start)
+    dist = _bfs(A, [u])[0]
+    runs = 1
+    level = int(dist.max())
+    lower = level
+
+    while 2 * level > lower:
+        fringe = np.flatnonzero(dist == level).tolist()
+        ecc, _ = _source_stats(A, fringe)
+        runs += len(fringe)
+        lower = max(lower, int(ecc.max()))
+        if lower > 2 * (level - 1):
+            break
+        level -= 1
+    return lower, runs
+
+
+def sampled_average_path_length(G, samples=100, seed=None, confidence=0.95):
+    """
+    Average shortest path length from BFS runs on sampled sources.
+    Each source contributes its mean distance to all other nodes; the
+    estimate is their mean, with a normal confidence interval.
+    Returns (estimate, (low, high), number of sources).
+    """
+    import numpy as np
+
+    nodes, A = _adjacency(G)
+    n = len(nodes)
+    k = min(samples, n)
+    sources = sorted(random.Random(seed).sample(range(n), k))
+    _, sums = _source_stats(A, sources)
+    per_source = sums / max(n - 1, 1)  # A single node has path length 0
+    mean = float(per_source.mean())
+    if k == n:
+        return mean, (mean, mean), k
+    std = float(per_source.std(ddof=1)) if k > 1 else 0.0
+    # Finite population correction: sampling sources without replacement
+    fpc = np.sqrt((n - k) / (n - 1))
+    half = NormalDist().inv_cdf((1 + confidence) / 2) * std / np.sqrt(k) * fpc
+    return mean, (mean - half, mean + half), k
@@ -0,0 +1,215 @@
+"""
+Multilevel force-directed layout for large graphs.
+
+Fruchterman-Reingold forces, vectorized in NumPy:
+- attraction along edges, accumulated with bincount;
+- repulsion from a grid: node masses are deposited on a square grid and
+  convolved (FFT) with the 1/d force kernel, so every node feels every
+  other one in O(n + g^2 log g) per iteration instead of O(n^2). Small
+  graphs (and coarse levels) use the exact pairwise sum instead.
+The graph is first coarsened by repeated matching (each node merges with a
+free neighbour, leftovers join a neighbour's cluster); the coarsest graph is
+laid out from random positions and each finer level starts from its parent
+cluster's position, so few iterations are needed on the full graph.
+"""
+import networkx as nx
+
+# Up to this many nodes the exact pairwise repulsion is used
+EXACT_LIMIT = 400
+
+
+def _adjacency(G):
+    nodes = list(G.nodes())
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format='csr')
+    A.setdiag(0)
+    A.eliminate_zeros()
+    A.data[:] = 1
+    return nodes, A
+
+
+def coarsen(A, rng):
+    """
+    One coarsening step. Returns (labels, num_clusters): labels maps each
+    node of A to its cluster in the coarser graph.
+    """
+    import numpy as np
+
+    n = A.shape[0]
+    indptr, indices = A.indptr.tolist(), A.indices.tolist()
+    label = [-1] * n
+    size = 0
+    order = rng.permutation(n).tolist()
+    # Matching: pair each free node with a free neighbour
+    for u in order:
+        if label[u] >= 0:
+            continue
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if label[v] < 0:
+                label[v] = size
+                label[u] = size
+                size += 1
+                break
+    # Unmatched nodes join a neighbour's cluster (collapses stars), or stay alone
+    for u in order:
+        if label[u] >= 0:
+            continue
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if label[v] >= 0:
+                label[u] = label[v]
+                break
+        else:
+            label[u] = size
+            size += 1
+    return np.array(label, dtype=np.int64), size
+
+
+def _coarse_graph(A, labels, num_clusters):
+    import numpy as np
+    from scipy import sparse
+
+    n = A.shape[0]
+    C = sparse.csr_matrix((np.ones(n), (np.arange(n), labels)), shape=(n, num_clusters))
+    Ac = (C.T @ A @ C).tocsr()
+    Ac.setdiag(0)
+    Ac.eliminate_zeros()
+    Ac.data[:] = 1
+    return Ac
+
+
+class _GridKernel:
+    """FFT of the unit 1/d repulsion kernel for a g x g grid, reused every iteration."""
+
+    def __init__(self, grid):
+        import numpy as np
+        from scipy import fft
+
+        self.grid = grid
+        self.shape = (fft.next_fast_len(3 * grid - 2),) * 2
+        r = np.arange(-(grid - 1), grid, dtype=np.float64)
+        dx, dy = np.meshgrid(r, r, indexing='ij')
+        d2 = dx * dx + dy * dy
+        d2[grid - 1, grid - 1] = np.inf
+        self.kx = fft.rfft2(dx / d2, s=self.shape)
+        self.ky = fft.rfft2(dy / d2, s=self.shape)
+
+    def forces(self, pos, mass, k):
+        import numpy as np
+        from scipy import fft
+
+        g = self.grid
+        lo = pos.min(axis=0)
+        h = max(float((pos.max(axis=0) - lo).max()) / (g - 1), 1e-9)
+        cell = np.rint((pos - lo) / h).astype(np.int64)
+        flat = cell[:, 0] * g + cell[:, 1]
+        density = np.bincount(flat, weights=mass, minlength=g * g).reshape(g, g)
+
+        dens = fft.rfft2(density, s=self.shape)
+        window = (slice(g - 1, 2 * g - 1), slice(g - 1, 2 * g - 1))
+        fx = fft.irfft2(dens * self.kx, s=self.shape)[window]
+        fy = fft.irfft2(dens * self.ky, s=self.shape)[window]
+        # Kernel is in cell units: k^2 * d / |d|^2 with d = offset * h
+        scale = k * k / h
+        return np.column_stack((fx.ravel()[flat], fy.ravel()[flat])) * scale
+
+
+def _exact_repulsion(pos, mass, k):
+    import numpy as np
+
+    delta = pos[:, None, :] - pos[None, :, :]
+    d2 = (delta ** 2).sum(axis=2)
+    np.fill_diagonal(d2, np.inf)
+    d2 = np.maximum(d2, 1e-9)
+    return k * k * (delta * (mass[None, :] / d2)[:, :, None]).sum(axis=1)
+
+
+def _grid_size(n):
+    import numpy as np
+
+    return int(np.clip(np.sqrt(n), 16, 256))
+
+
+def _relax(A, pos, mass, iterations, t_start, t_end, k=1.0, gravity=0.05):
+    """Runs Fruchterman-Reingold iterations on positions pos (updated and returned)."""
+    import numpy as np
+
+    n = A.shape[0]
+    if n < 2 or iterations <= 0:
+        return pos
+    coo = A.tocoo()
+    keep = coo.row < coo.col
+    src, dst = coo.row[keep], coo.col[keep]
+    kernel = _GridKernel(_grid_size(n)) if n > EXACT_LIMIT else None
+    cooling = (t_end / t_start) ** (1.0 / iterations)
+    t = t_start
+
+    for _ in range(iterations):
+        disp = kernel.forces(pos, mass, k) if kernel else _exact_repulsion(pos, mass, k)
+
+        delta = pos[src] - pos[dst]
+        dist = np.sqrt((delta ** 2).sum(axis=1))
+        pull = delta * (dist / k)[:, None]
+        for axis in (0, 1):
+            disp[:, axis] -= np.bincount(src, weights=pull[:, axis], minlength=n)
+            disp[:, axis] += np.bincount(dst, weights=pull[:, axis], minlength=n)
+
+        # Weak pull to the centre keeps disconnected pieces from drifting away
+        center = np.average(pos, axis=0, weights=mass)
+        disp -= gravity * mass[:, None] * (pos - center)
+
+        length = np.sqrt((disp ** 2).sum(axis=1))
+        length[length == 0] = 1.0
+        pos += disp * (np.minimum(length, t) / length)[:, None]
+        t *= cooling
+    return pos
+
+
+def multilevel_layout(G, seed=None, pos=None, iterations=50, min_size=64, scale=1.0):
+    """
+    Force-directed layout of G for large graphs (see module docstring).
+    - seed: makes the layout reproducible.
+    - pos: initial {node: (x, y)} (e.g. a cached layout); nodes it covers
+      skip coarsening and are only refined.
+    - iterations: iterations on the finest level (coarser levels run more).
+    Returns {node: array([x, y])} scaled to [-scale, scale] like networkx layouts.
+    """
+    import numpy as np
+
+    if G.number_of_nodes() < 2:
+        return {v: np.zeros(2) for v in G.nodes()}
+    nodes, A = _adjacency(G)
+    n = len(nodes)
+    rng = np.random.default_rng(seed)
+
+    if pos is not None:
+        start = np.array([pos[v] if v in pos else rng.random(2) for v in nodes], dtype=np.float64)
+        # Bring the seed to the natural size of the layout (area ~ n k^2)
+        start -= start.mean(axis=0)
+        span = max(float(np.abs(start).max()), 1e-9)
+        start *= np.sqrt(n) / (2 * span)
+        coords = _relax(A, start, np.ones(n), iterations, 1.0, 0.02)
+        return dict(zip(nodes, nx.rescale_layout(coords, scale=scale)))
+
+    # Coarsening hierarchy: (adjacency, labels to the next coarser level, masses)
+    levels = [(A, None, np.ones(n))]
+    while levels[-1][0].shape[0] > min_size:
+        fine, _, mass = levels[-1]
+        labels, size = coarsen(fine, rng)
+        if size > 0.9 * fine.shape[0]:
+            break
+        levels[-1] = (fine, labels, mass)
+        levels.append((_coarse_graph(fine, labels, size), None, np.bincount(labels, weights=mass)))
+
+    coarse, _, mass = levels[-1]
+    m = coarse.shape[0]
+    coords = (rng.random((m, 2)) - 0.5) * np.sqrt(mass.sum())
+    coords = _relax(coarse, coords, mass, max(4 * iterations, 200), max(1.0, np.sqrt(m) / 5), 0.02)
+
+    for level in range(len(levels) - 2, -1, -1):
+        fine, labels, mass = levels[level]
+        coarse_n = levels[level + 1][0].shape[0]
+        # Children start at their cluster's position, spread out as the node count grows
+        coords = coords[labels] * np.sqrt(fine.shape[0] / coarse_n)
+        coords += (rng.random(coords.shape) - 0.5)
+        coords = _relax(fine, coords, mass, iterations, 2.0, 0.02)
+
+    return dict(zip(nodes, nx.rescale_layout(coords, scale=scale)))
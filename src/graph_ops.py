@@ -2,26 +2,65 @@
 import networkx as nx
 from networkx.algorithms.community import greedy_modularity_communities
 from .data import V_CARROS, V_PECAS, EDGES_BIPARTIDO
+from . import projection
+from . import percolation
+from . import centrality
+from . import csr
+from . import loader
+from . import similarity
+from . import minhash
+from . import distance
+from . import communities as communities_engine
+from .cache import cached_analysis
+
+def build_bipartite_graph(source=None, compact=False, **kwargs):
+    """
+    Builds the Bipartite Graph (Cars + Parts).
+    - source: None for the built-in dataset (data.py), a CSV/TSV/JSON Lines
+      catalog path, or an iterable of (car, part) pairs; see loader.load_edges.
+    - compact: return a csr.CSRGraph instead of a networkx.Graph.
+    """
+    if source is not None:
+        return loader.load_bipartite_graph(source, compact=compact, **kwargs)
 
-def build_bipartite_graph():
-    """Builds the Bipartite Graph (Cars + Parts)."""
     B = nx.Graph()
     B.add_nodes_from(V_CARROS, bipartite=0, type='car')
     B.add_nodes_from(V_PECAS, bipartite=1, type='part')
     B.add_edges_from(EDGES_BIPARTIDO)
-    return B
+    return csr.from_networkx(B) if compact else B
 
-def build_projected_graph(B):
-    """Builds the Projected Graph (Car-to-Car) based on shared parts."""
+def build_projected_graph(B, method='loop', threshold=0.5, with_shared_parts=True):
+    """
+    Builds the Projected Graph (Car-to-Car) based on shared parts.
+    - method: 'loop' compares every pair of cars in Python,
+      'sparse' computes all co-usage counts as one sparse matrix product,
+      'index' walks an inverted index part -> cars and only visits co-occurring pairs,
+      'minhash' keeps only pairs with Jaccard >= threshold, found through LSH buckets.
+    - with_shared_parts: False skips the 'shared_parts' edge lists with 'sparse'
+      (the other methods always build them).
+    A csr.CSRGraph input is always projected with sparse products into a CSRGraph.
+    """
+    if isinstance(B, csr.CSRGraph):
+        return csr.project(B)
+    if method == 'sparse':
+        return projection.project_sparse(B, with_shared_parts=with_shared_parts)
+    if method == 'index':
+        return projection.project_inverted_index(B)
+    if method == 'minhash':
+        return minhash.MinHashIndex(B, threshold=threshold).projected_graph(threshold)
+    if method != 'loop':
+        raise ValueError(f"Unknown projection method: {method}")
+
+    cars = projection.car_nodes(B)
     P = nx.Graph()
-    P.add_nodes_from(V_CARROS)
+    P.add_nodes_from(cars)
     
     # Manually calculate to add weights and details
-    for i in range(len(V_CARROS)):
-        u = V_CARROS[i]
+    for i in range(len(cars)):
+        u = cars[i]
         u_parts = set(n for n in B.neighbors(u))
-        for j in range(i + 1, len(V_CARROS)):
-            v = V_CARROS[j]
+        for j in range(i + 1, len(cars)):
+            v = cars[j]
             v_parts = set(n for n in B.neighbors(v))
             
             shared = u_parts.intersection(v_parts)
@@ -30,17 +69,33 @@ def build_projected_graph(B):
                 
     return P
 
-def get_graph_info(G):
-    """Returns basic info string."""
+@cached_analysis
+def get_graph_info(G, apl_samples=None, seed=None, processes=None):
+    """
+    Returns basic info string.
+    Distance metrics come from one BFS pass over all nodes (see distance.py).
+    - apl_samples: estimate the average path length from this many BFS sources
+      (with a 95% confidence interval); diameter and center stay exact through
+      eccentricity bounds.
+    - processes: spread the exact BFS pass over a process pool.
+    """
     info = f"Nodes: {G.number_of_nodes()}\n"
     info += f"Edges: {G.number_of_edges()}\n"
     info += f"Density: {nx.density(G):.4f}\n"
     if nx.is_connected(G):
         info += "Connected: Yes\n"
-        info += f"Diameter: {nx.diameter(G)}\n"
-        center = nx.center(G)
-        info += f"Center: {center}\n"
-        info += f"Avg Path Length: {nx.average_shortest_path_length(G):.4f}\n"
+        if apl_samples is None:
+            metrics = distance.all_source_metrics(G, processes=processes)
+            info += f"Diameter: {metrics['diameter']}\n"
+            info += f"Center: {metrics['center']}\n"
+            info += f"Avg Path Length: {metrics['avg_path_length']:.4f}\n"
+        else:
+            ecc, _ = distance.bounding_eccentricities(G)
+            radius = min(ecc.values())
+            apl, (low, high), k = distance.sampled_average_path_length(G, apl_samples, seed=seed)
+            info += f"Diameter: {max(ecc.values())}\n"
+            info += f"Center: {[v for v in G.nodes() if ecc[v] == radius]}\n"
+            info += f"Avg Path Length: {apl:.4f} (95% CI {low:.4f}-{high:.4f}, {k} sources)\n"
     else:
         info += "Connected: No\n"
         info += f"Connected Components: {nx.number_connected_components(G)}\n"
@@ -69,11 +124,22 @@ def get_bridges_and_cuts(G):
 
 # ==================== ADVANCED ANALYSIS (TG.txt) ====================
 
-def detect_communities(G):
+@cached_analysis
+def detect_communities(G, method='greedy', seed=None, init=None, changed=None):
     """
     Detects communities (Clusters/Platforms) using Greedy Modularity.
     Returns a dictionary mapping node -> community_id.
+    - method: 'greedy' (unweighted) or 'louvain' (seeded, uses the 'weight' attribute).
+    - init, changed: with 'louvain', warm-start from a previous community map; if
+      changed nodes are given, only they and their neighbours are revisited first.
     """
+    if method == 'louvain':
+        if init is not None and changed is not None:
+            return communities_engine.refine_communities(G, init, changed, seed=seed)
+        return communities_engine.louvain(G, seed=seed, init=init)
+    if method != 'greedy':
+        raise ValueError(f"Unknown community method: {method}")
+
     communities = list(greedy_modularity_communities(G))
     community_map = {}
     for i, c in enumerate(communities):
@@ -81,10 +147,13 @@ def detect_communities(G):
             community_map[node] = i
     return community_map, communities
 
-def get_part_criticality(B):
+@cached_analysis
+def get_part_criticality(B, k=None, epsilon=None, seed=None, parts_only=False):
     """
     Identifies 'Hubs' (Parts) by calculating Degree Centrality on the Bipartite Graph.
     Returns sorted list of (part, centrality_score, raw_degree).
+    Betweenness is exact by default; see centrality.betweenness_centrality for
+    sampling with k pivots or a target error epsilon (seed), and parts_only.
     """
     # Filter only part nodes
     parts = [n for n, d in B.nodes(data=True) if d.get('type') == 'part']
@@ -93,12 +162,13 @@ def get_part_criticality(B):
     deg_centrality = nx.degree_centrality(B)
     
     # 2. Betweenness Centrality (Bottlenecks)
-    bet_centrality = nx.betweenness_centrality(B)
+    bet_centrality = centrality.betweenness_centrality(B, k=k, epsilon=epsilon, seed=seed,
+                                                      parts_only=parts_only)
     
     # 3. Eigenvector Centrality (Influence)
     try:
-        eig_centrality = nx.eigenvector_centrality(B, max_iter=1000)
-    except:
+        eig_centrality = centrality.eigenvector_centrality(B, max_iter=1000)
+    except nx.PowerIterationFailedConvergence:
         eig_centrality = {n: 0 for n in B.nodes()}
 
     criticality = []
@@ -126,20 +196,38 @@ def simulate_part_failure(B, part_node):
         return [], 0.0
     
     affected_cars = list(B.neighbors(part_node))
-    severity = len(affected_cars) / len(V_CARROS) if V_CARROS else 0
+    total_cars = len(projection.car_nodes(B))
+    severity = len(affected_cars) / total_cars if total_cars else 0
     return affected_cars, severity
 
-def simulate_supplier_collapse(B, parts_to_fail):
+def simulate_supplier_collapse(B, parts_to_fail, method='loop', incremental=None):
     """
     Simulates collapse of a supplier providing multiple parts.
     Returns the impact on the projected graph connectivity.
+    - method: projection engine passed to build_projected_graph, or 'incremental'.
+    - incremental: an existing projection.IncrementalProjection of B. The parts are
+      removed, measured and restored, so one object can screen many scenarios.
     """
-    # Create copy of bipartite graph without these parts
-    B_damaged = B.copy()
-    B_damaged.remove_nodes_from(parts_to_fail)
-    
-    # Rebuild projected graph to see connectivity loss
-    P_damaged = build_projected_graph(B_damaged)
+    if isinstance(B, csr.CSRGraph):
+        P_damaged = csr.project(B.remove_nodes(parts_to_fail))
+        num_components, largest_cc = csr.connected_components(P_damaged)
+        return num_components, largest_cc, P_damaged
+
+    if incremental is not None:
+        removed = incremental.remove_parts(parts_to_fail)
+        P_damaged = incremental.snapshot()
+        incremental.add_parts(removed)
+    elif method == 'incremental':
+        incremental = projection.IncrementalProjection(B)
+        incremental.remove_parts(parts_to_fail)
+        P_damaged = incremental.P
+    else:
+        # Create copy of bipartite graph without these parts
+        B_damaged = B.copy()
+        B_damaged.remove_nodes_from(parts_to_fail)
+
+        # Rebuild projected graph to see connectivity loss
+        P_damaged = build_projected_graph(B_damaged, method=method)
     
     # Measure fragmentation
     num_components = nx.number_connected_components(P_damaged)
@@ -152,40 +240,58 @@ def analyze_stock_savings(B):
     Calculates stock savings vs independent stock.
     Stock Reduction = 1 - (Unique Parts / Sum of Parts per Car)
     """
-    unique_parts = len(V_PECAS)
+    unique_parts = len(projection.part_nodes(B))
     
     sum_parts_needed = 0
-    for car in V_CARROS:
+    for car in projection.car_nodes(B):
         sum_parts_needed += B.degree(car)
         
     reduction_factor = 1 - (unique_parts / sum_parts_needed) if sum_parts_needed > 0 else 0
     return sum_parts_needed, unique_parts, reduction_factor
 
-def simulate_cumulative_failure(B, parts_list):
+def simulate_cumulative_failure(B, parts_list, method='loop'):
     """
     Simulates sequential failure of parts in the list.
     Returns a list of stats: [(num_parts_failed, cars_remaining, giant_component_size)]
+    - method: projection engine passed to build_projected_graph, 'incremental'
+      to update one projection in place after each removal, or 'percolation'
+      to compute the whole curve with union-find (no projection is built).
+      A csr.CSRGraph input always uses 'percolation'.
+    'incremental' and 'percolation' skip list entries that are not parts; the
+    projection methods remove any node, so a car in the list leaves the projection.
     """
+    if method == 'percolation' or isinstance(B, csr.CSRGraph):
+        curve = percolation.percolation_curve(B, parts_list)
+        total_cars = len(projection.car_nodes(B))
+        return [(k, total_cars, gc) for k, _, gc in curve]
+
     stats = []
+    incremental = projection.IncrementalProjection(B) if method == 'incremental' else None
     
     # Initial State
-    total_cars = len(V_CARROS)
-    g_size = len(max(nx.connected_components(build_projected_graph(B)), key=len)) if len(V_CARROS) > 0 else 0
+    P = incremental.P if incremental else build_projected_graph(B, method=method)
+    total_cars = len(P)
+    g_size = len(max(nx.connected_components(P), key=len)) if total_cars > 0 else 0
     stats.append((0, total_cars, g_size))
     
-    current_B = B.copy()
+    current_B = incremental.B if incremental else B.copy()
     failed_parts = set()
     
     for part in parts_list:
+        if incremental and not incremental.is_part(part):
+            continue
         if part in current_B:
             # "Failure" means the part is gone. 
             # Cars relying on it might be considered "STOPPED"
             # For this sim, let's track Connectivity of the Remaining production capability
-            current_B.remove_node(part)
             failed_parts.add(part)
-            
-            # Rebuild projected graph to check industry connectivity
-            P = build_projected_graph(current_B)
+            if incremental:
+                incremental.remove_part(part)
+                P = incremental.P
+            else:
+                current_B.remove_node(part)
+                # Rebuild projected graph to check industry connectivity
+                P = build_projected_graph(current_B, method=method)
             if len(P) > 0:
                 gc = len(max(nx.connected_components(P), key=len))
             else:
@@ -199,10 +305,10 @@ def simulate_cumulative_failure(B, parts_list):
 
 # ==================== NEW ADVANCED LOGIC (EXPANSION) ====================
 
-def get_vehicle_segments():
-    """Manual mapping of vehicles to market segments."""
+def get_vehicle_segments(cars=None):
+    """Manual mapping of vehicles to market segments (defaults to the built-in cars)."""
     segments = {}
-    for v in V_CARROS:
+    for v in (V_CARROS if cars is None else cars):
         if any(x in v for x in ['Audi', 'BMW', 'Mercedes', 'Porsche', 'Volvo', 'Jeep']):
             segments[v] = 'Premium'
         else:
@@ -214,7 +320,7 @@ def calculate_assortativity(G):
     Calculates the assortativity coefficient based on vehicle segment.
     Do Premium cars only connect to Premium cars?
     """
-    segments = get_vehicle_segments()
+    segments = get_vehicle_segments(G.nodes())
     nx.set_node_attributes(G, segments, 'segment')
     
     # Calculate numeric assortativity
@@ -225,6 +331,7 @@ def calculate_assortativity(G):
     
     return coeff, mixing_matrix
 
+@cached_analysis
 def get_k_core_decomposition(G):
     """
     Decomposes the graph into k-shells.
@@ -236,39 +343,72 @@ def get_k_core_decomposition(G):
     
     return core_numbers, k_core_subgraph, max_k
 
-def predict_demand(B, communities):
+def predict_demand(B, communities, threshold=0.7, min_size=2, with_support=False):
     """
     Predicts missing parts for vehicles based on their community standard.
+    A part is "standard" for a community when at least `threshold` of its members use it.
     Returns: {Community_ID: [Common_Parts]}, {Vehicle: [Suggested_Parts]}
+    - min_size: communities smaller than this are skipped.
+    - with_support: return (part, support) pairs instead of bare parts, where
+      support is the share of the community using the part.
+    Parts are ranked by support (highest first). Frequencies for all communities
+    come from one sparse product: membership (communities x cars) @ incidence (cars x parts).
     """
-    # 1. Identify "Standard Parts" for each community (present in >70% of members)
-    comm_standards = {}
-    suggestions = {}
-    
+    import numpy as np
+    from scipy import sparse
+
+    A, cars, parts = projection.incidence_matrix(B)
+    car_index = {c: i for i, c in enumerate(cars)}
+
+    # 1. Membership matrix of the communities large enough to define a standard
+    comm_ids, sizes, rows, cols = [], [], [], []
     for i, comm_nodes in enumerate(communities):
-        if len(comm_nodes) < 2: continue
-        
-        # Count part frequency in this community
-        part_counts = {}
-        for car in comm_nodes:
-            parts = list(B.neighbors(car))
-            for p in parts:
-                part_counts[p] = part_counts.get(p, 0) + 1
-        
-        # Filter parts that define this cluster (Threshold 70%)
-        standard_parts = [p for p, count in part_counts.items() if count >= len(comm_nodes) * 0.7]
-        comm_standards[i] = standard_parts
-        
-        # 2. Find Gaps (Which car is missing a standard part?)
+        if len(comm_nodes) < min_size:
+            continue
+        r = len(comm_ids)
+        comm_ids.append(i)
+        sizes.append(len(comm_nodes))
         for car in comm_nodes:
-            existing = set(B.neighbors(car))
-            missing = [p for p in standard_parts if p not in existing]
-            if missing:
-                suggestions[car] = missing
+            if car in car_index:
+                rows.append(r)
+                cols.append(car_index[car])
+    if not comm_ids:
+        return {}, {}
+    M = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, cols)),
+                          shape=(len(comm_ids), len(cars)))
+    sizes = np.asarray(sizes, dtype=np.float64)
+
+    # 2. Community x part frequencies, kept only where they reach the threshold
+    F = (M @ A).tocoo()
+    standard = F.data >= sizes[F.row] * threshold
+    support = sparse.csr_matrix((F.data[standard] / sizes[F.row[standard]],
+                                 (F.row[standard], F.col[standard])), shape=F.shape)
+
+    def ranked(indices, values):
+        order = np.lexsort((indices, -values))
+        if with_support:
+            return [(parts[indices[k]], float(values[k])) for k in order]
+        return [parts[indices[k]] for k in order]
+
+    comm_standards = {}
+    for r, i in enumerate(comm_ids):
+        lo, hi = support.indptr[r], support.indptr[r + 1]
+        comm_standards[i] = ranked(support.indices[lo:hi], support.data[lo:hi])
+
+    # 3. Gaps: each member inherits its community standard, minus the parts it already has
+    expected = (M.T @ support).tocsr()
+    missing = (expected - expected.multiply(A)).tocsr()
+    missing.eliminate_zeros()
+
+    suggestions = {}
+    for c in np.flatnonzero(np.diff(missing.indptr)).tolist():
+        lo, hi = missing.indptr[c], missing.indptr[c + 1]
+        suggestions[cars[c]] = ranked(missing.indices[lo:hi], missing.data[lo:hi])
                 
     return comm_standards, suggestions
 
 
+@cached_analysis
 def get_clustering_analysis(G):
     """
     Calculates Clustering Coefficient and Transitivity.
@@ -280,12 +420,24 @@ def get_clustering_analysis(G):
     
     return avg_clustering, transitivity, local_clustering
 
-def calculate_jaccard_weights(B, P):
+def calculate_jaccard_weights(B, P, method='loop'):
     """
     Calculates Jaccard Similarity for edges in Projected Graph.
     J(A,B) = |intersection| / |union|
     Updates edges in P with 'jaccard' attribute.
+    - method: 'loop' compares part sets per edge, 'sparse' computes every pair
+      in one pass (see similarity.compute_similarity for the matrix itself).
+    A csr.CSRGraph P gets an edge_data['jaccard'] array instead.
     """
+    if isinstance(P, csr.CSRGraph):
+        P.edge_data['jaccard'] = csr.jaccard(B, P)
+        return P
+    if method == 'sparse':
+        cars, matrices = similarity.compute_similarity(B, cars=list(P.nodes()))
+        return similarity.annotate_projection(P, cars, matrices)
+    if method != 'loop':
+        raise ValueError(f"Unknown Jaccard method: {method}")
+
     for u, v in P.edges():
         u_parts = set(B.neighbors(u))
         v_parts = set(B.neighbors(v))
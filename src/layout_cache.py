@@ -0,0 +1,172 @@
+"""
+Persistent store of node positions for the visualizer.
+
+Layouts such as Kamada-Kawai are far more expensive than drawing, and the
+same graph is laid out for several figures and on every run. Positions are
+stored on disk under (layout name, parameters, graph fingerprint), so each
+layout is computed once. When the exact graph is not cached but an earlier
+version with mostly the same nodes is, its positions seed the layout
+(warm start) instead of starting from scratch.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+
+from .cache import graph_fingerprint
+
+LAYOUT_CACHE_DIR = ".layout_cache"
+
+
+def _params_key(name, params):
+    text = repr((name, sorted(params.items())))
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _as_tuples(pos):
+    return {n: tuple(float(c) for c in xy) for n, xy in pos.items()}
+
+
+def seed_positions(G, cached):
+    """
+    Initial positions for G from a cached layout of a similar graph: known
+    nodes keep their place, new ones start at the mean of their placed
+    neighbours (or of all placed nodes).
+    """
+    pos = {n: cached[n] for n in G.nodes() if n in cached}
+    if not pos:
+        return None
+    cx = sum(x for x, _ in pos.values()) / len(pos)
+    cy = sum(y for _, y in pos.values()) / len(pos)
+    for n in G.nodes():
+        if n in pos:
+            continue
+        placed = [pos[v] for v in G.neighbors(n) if v in pos]
+        if placed:
+            pos[n] = (sum(x for x, _ in placed) / len(placed),
+                      sum(y for _, y in placed) / len(placed))
+        else:
+            pos[n] = (cx, cy)
+    return pos
+
+
+def _mtime(path):
+    """Modification time of path, or -inf if another process has just removed it."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return float('-inf')
+
+
+class LayoutStore:
+    """
+    On-disk layout cache (one pickle per layout) with an in-memory layer.
+    - directory: where layouts are written (created on first write).
+    - max_per_layout: entries kept per (layout, parameters); the oldest are pruned.
+    - min_overlap: share of G's nodes a cached layout must cover to seed a warm start.
+    """
+
+    def __init__(self, directory=LAYOUT_CACHE_DIR, max_per_layout=16, min_overlap=0.5):
+        self.directory = directory
+        self.max_per_layout = max_per_layout
+        self.min_overlap = min_overlap
+        self._memory = {}
+        self.hits = 0
+        self.warm_starts = 0
+        self.misses = 0
+
+    def _path(self, prefix, fingerprint):
+        return os.path.join(self.directory, f"{prefix}-{fingerprint}.pkl")
+
+    def _read(self, path):
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _write(self, path, pos):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(pos, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    def _entries(self, prefix):
+        """Cached files for one (layout, parameters), newest first."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        paths = [os.path.join(self.directory, f) for f in names
+                 if f.startswith(prefix + '-') and f.endswith('.pkl')]
+        return sorted(paths, key=_mtime, reverse=True)
+
+    def _nearest(self, G, prefix):
+        """Cached positions covering most of G's nodes, if enough of them."""
+        best, best_shared = None, 0
+        for path in self._entries(prefix):
+            pos = self._read(path)
+            if pos is None:
+                continue
+            shared = sum(1 for n in G.nodes() if n in pos)
+            if shared > best_shared:
+                best, best_shared = pos, shared
+        if best is None or best_shared < self.min_overlap * G.number_of_nodes():
+            return None
+        return best
+
+    def _prune(self, prefix):
+        for path in self._entries(prefix)[self.max_per_layout:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def layout(self, G, name, compute, **params):
+        """
+        Positions of G for the layout called name with params.
+        compute(G, pos) runs the layout; pos is None or a warm-start seed.
+        Returns {node: (x, y)}.
+        """
+        prefix = _params_key(name, params)
+        path = self._path(prefix, graph_fingerprint(G))
+
+        pos = self._memory.get(path)
+        if pos is None and os.path.exists(path):
+            pos = self._read(path)
+        if pos is not None:
+            self.hits += 1
+            self._memory[path] = pos
+            return dict(pos)
+
+        seed = None
+        cached = self._nearest(G, prefix)
+        if cached is not None:
+            seed = seed_positions(G, cached)
+            self.warm_starts += 1
+        else:
+            self.misses += 1
+
+        pos = _as_tuples(compute(G, seed))
+        self._memory[path] = pos
+        try:
+            self._write(path, pos)
+            self._prune(prefix)
+        except OSError:
+            pass  # A read-only directory only costs the persistence
+        return dict(pos)
+
+    def clear(self):
+        """Removes every cached layout, in memory and on disk."""
+        self._memory.clear()
+        if os.path.isdir(self.directory):
+            for f in os.listdir(self.directory):
+                if f.endswith('.pkl'):
+                    try:
+                        os.remove(os.path.join(self.directory, f))
+                    except FileNotFoundError:
+                        pass  # Already removed by another process
+
+
+default_store = LayoutStore()
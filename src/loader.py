@@ -0,0 +1,186 @@
+"""
+Streaming bulk loader for external car-part catalogs.
+
+Edge lists are read in chunks from CSV, TSV or JSON Lines files (optionally
+gzip-compressed), so the raw file is never held in memory. Node names are
+interned to integer IDs and duplicate edges are dropped as they stream in;
+memory grows with the number of unique names and edges only.
+"""
+import csv
+import gzip
+import json
+import sys
+from array import array
+
+import networkx as nx
+
+FORMATS = {'.csv': 'csv', '.tsv': 'tsv', '.tab': 'tsv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+
+def detect_format(path):
+    """Infers 'csv', 'tsv' or 'jsonl' from the file extension (a trailing .gz is ignored)."""
+    name = str(path).lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    for ext, fmt in FORMATS.items():
+        if name.endswith(ext):
+            return fmt
+    raise ValueError(f"Cannot infer catalog format from '{path}'; pass fmt explicitly")
+
+
+def _open_text(path):
+    if str(path).lower().endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, 'r', encoding='utf-8', newline='')
+
+
+def _name(value):
+    # Numeric JSON IDs become names, as they would be in a CSV file
+    return '' if value is None else str(value)
+
+
+def _iter_rows(f, fmt, car_field, part_field, header):
+    if fmt == 'jsonl':
+        for line in f:
+            line = line.strip()
+            if line:
+                record = json.loads(line)
+                yield _name(record[car_field]), _name(record[part_field])
+        return
+
+    reader = csv.reader(f, delimiter='\t' if fmt == 'tsv' else ',')
+    if header:
+        first = next(reader, None)
+        if first is None:
+            return
+        if car_field not in first or part_field not in first:
+            raise ValueError(f"Header {first} does not name '{car_field}' and '{part_field}'; "
+                             "pass car_field/part_field, or header=False if there is no header")
+        ci, pi = first.index(car_field), first.index(part_field)
+    else:
+        # No header: the first two columns are car and part
+        ci, pi = 0, 1
+    for row in reader:
+        if len(row) > max(ci, pi):
+            yield row[ci].strip(), row[pi].strip()
+
+
+def iter_edge_chunks(path, fmt=None, chunk_size=100000, car_field='car', part_field='part',
+                     header=True):
+    """
+    Streams (car, part) edges from a catalog file in lists of at most chunk_size.
+    CSV/TSV files start with a header naming car_field and part_field (ValueError
+    otherwise); with header=False the first two columns of every row are used.
+    JSON Lines records need both fields.
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in ('csv', 'tsv', 'jsonl'):
+        raise ValueError(f"Unknown catalog format: {fmt}")
+
+    with _open_text(path) as f:
+        chunk = []
+        for car, part in _iter_rows(f, fmt, car_field, part_field, header):
+            if car and part:
+                chunk.append((car, part))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+
+class EdgeStore:
+    """
+    Interned, deduplicated car-part edges.
+    - cars, parts: names in first-seen order (position = ID).
+    - car_ids, part_ids: compact int arrays, one entry per unique edge.
+    """
+
+    def __init__(self):
+        self.cars = []
+        self.parts = []
+        self._car_index = {}
+        self._part_index = {}
+        self._seen = set()
+        self.car_ids = array('i')
+        self.part_ids = array('i')
+
+    def _intern(self, name, index, names):
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(names)
+            names.append(sys.intern(name) if isinstance(name, str) else name)
+        return i
+
+    def add_edges(self, edges):
+        for car, part in edges:
+            c = self._intern(car, self._car_index, self.cars)
+            p = self._intern(part, self._part_index, self.parts)
+            key = (c << 32) | p
+            if key not in self._seen:
+                self._seen.add(key)
+                self.car_ids.append(c)
+                self.part_ids.append(p)
+
+    def __len__(self):
+        return len(self.car_ids)
+
+    def check(self):
+        """Raises ValueError if a name is used both as a car and as a part."""
+        clash = self._car_index.keys() & self._part_index.keys()
+        if clash:
+            raise ValueError(f"Names used both as car and part: {sorted(clash)[:5]}")
+
+    def to_networkx(self):
+        """Builds the bipartite graph with the same node attributes as build_bipartite_graph."""
+        self.check()
+        B = nx.Graph()
+        B.add_nodes_from(self.cars, bipartite=0, type='car')
+        B.add_nodes_from(self.parts, bipartite=1, type='part')
+        cars, parts = self.cars, self.parts
+        B.add_edges_from((cars[c], parts[p]) for c, p in zip(self.car_ids, self.part_ids))
+        return B
+
+    def to_csr(self):
+        """Builds a csr.CSRGraph directly from the edge arrays (cars first, then parts)."""
+        import numpy as np
+        from scipy import sparse
+
+        from .csr import from_scipy
+
+        self.check()
+        n_cars = len(self.cars)
+        n = n_cars + len(self.parts)
+        rows = np.frombuffer(self.car_ids, dtype=np.int32).astype(np.int64)
+        cols = np.frombuffer(self.part_ids, dtype=np.int32).astype(np.int64) + n_cars
+        ones = np.ones(len(rows), dtype=np.int32)
+        M = sparse.coo_matrix((np.concatenate((ones, ones)),
+                               (np.concatenate((rows, cols)), np.concatenate((cols, rows)))),
+                              shape=(n, n))
+        kinds = [0] * n_cars + [1] * len(self.parts)
+        return from_scipy(self.cars + self.parts, kinds, M, attr=None)
+
+
+def load_edges(source, fmt=None, chunk_size=100000, car_field='car', part_field='part',
+               header=True):
+    """
+    Loads a catalog into an EdgeStore.
+    - source: path to a CSV/TSV/JSON Lines file, or an iterable of (car, part) pairs.
+    - header: whether a CSV/TSV file starts with a header row (see iter_edge_chunks).
+    """
+    store = EdgeStore()
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        for chunk in iter_edge_chunks(source, fmt, chunk_size, car_field, part_field, header):
+            store.add_edges(chunk)
+    else:
+        store.add_edges(source)
+    return store
+
+
+def load_bipartite_graph(source, compact=False, **kwargs):
+    """
+    Builds the bipartite graph from an external catalog.
+    Returns a networkx.Graph, or a csr.CSRGraph when compact=True.
+    """
+    store = load_edges(source, **kwargs)
+    return store.to_csr() if compact else store.to_networkx()
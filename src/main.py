@@ -2,12 +2,21 @@ import networkx as nx
 from . import graph_ops
 from . import visualizer
 from . import report_generator
+from . import pipeline
+from . import render
+from . import snapshot
+from . import csr
 from .data import V_CARROS, V_PECAS
 
+# Binary snapshot of B and P, rebuilt automatically when data.py changes
+SNAPSHOT_PATH = "graph_snapshot.vpg"
+# Menu options that run on the compact CSR graphs (the rest need networkx)
+CSR_OPTIONS = ('3', '10')
+
 def main():
     print("Loading data and building graphs...")
-    B = graph_ops.build_bipartite_graph()
-    P = graph_ops.build_projected_graph(B)
+    # Mapped CSR views; converted to networkx on first use by an option that needs it
+    B, P = snapshot.load_or_build(SNAPSHOT_PATH, as_networkx=False)
     
     while True:
         # clear_screen()
@@ -30,6 +39,8 @@ def main():
         print("="*50)
         
         choice = input("Enter choice (1-10): ").strip()
+        if choice not in CSR_OPTIONS and isinstance(B, csr.CSRGraph):
+            B, P = csr.to_networkx(B), csr.to_networkx(P)
         
         if choice == '1':
             print("\n[Bipartite Graph Info]")
@@ -66,7 +77,7 @@ def main():
             print("\n[Hub Identification - Critical Parts]")
             hubs = graph_ops.get_part_criticality(B)
             print("Top 10 Critical Parts:")
-            for i, (p, d) in enumerate(hubs[:10]):
+            for i, (p, d, *_) in enumerate(hubs[:10]):
                 print(f"  {i+1}. {p} (Used by {d} cars)")
 
         elif choice == '7':
@@ -85,20 +96,42 @@ def main():
             
         elif choice == '9':
             print("\n[Generating Visualizations]")
-            # Bipartite
-            visualizer.plot_graph(B, title="Automotive Supply Chain (Bipartite)", filename="bipartite.png")
-            
-            # Projected with Communities
-            comm_map, _ = graph_ops.detect_communities(P)
-            visualizer.plot_graph(P, title="Vehicle Clusters (Projected)", filename="clusters.png", groups=comm_map, weighted=True)
+            # Analyses run concurrently, then every figure renders in its own process
+            results = pipeline.analysis_pipeline(B, P).run(
+                ['communities', 'mst', 'criticality', 'cumulative_failure', 'k_core',
+                 'jaccard', 'assortativity', 'clustering'])
+            comm_map, _ = results['communities']
+            cores, _, _ = results['k_core']
+            _, mixing = results['assortativity']
+            _, _, local_clust = results['clustering']
+            bridges, cuts = graph_ops.get_bridges_and_cuts(P)
             
-            # MST
-            T = graph_ops.get_mst(P)
-            visualizer.plot_graph(T, title="Industry Backbone (MaxST)", filename="backbone.png", weighted=True)
-            
-            # Criticality Chart
-            hubs = graph_ops.get_part_criticality(B)
-            visualizer.plot_criticality(hubs, filename="criticality_chart.png")
+            job = render.figure_job
+            render.render_figures([
+                # Bipartite
+                job(visualizer.plot_graph, B, title="Automotive Supply Chain (Bipartite)",
+                    filename="bipartite.png"),
+                # Projected with Communities
+                job(visualizer.plot_graph, P, title="Vehicle Clusters (Projected)",
+                    filename="clusters.png", groups=comm_map, weighted=True),
+                # MST
+                job(visualizer.plot_graph, results['mst'], title="Industry Backbone (MaxST)",
+                    filename="backbone.png", weighted=True),
+                # Criticality Chart
+                job(visualizer.plot_criticality, results['criticality'],
+                    filename="criticality_chart.png"),
+                job(visualizer.plot_resilience_curve, results['cumulative_failure'],
+                    filename="resilience_curve.png"),
+                job(visualizer.plot_k_core, P, cores, filename="k_core.png"),
+                job(visualizer.plot_jaccard_heatmap, results['jaccard'],
+                    filename="jaccard_heatmap.png", groups=comm_map),
+                job(visualizer.plot_degree_distribution, B, filename="degree_distribution.png"),
+                job(visualizer.plot_mixing_matrix, mixing, filename="mixing_matrix.png"),
+                job(visualizer.plot_local_clustering, P, local_clust,
+                    filename="local_clustering.png"),
+                job(visualizer.plot_bridges_and_cuts, P, bridges, cuts,
+                    filename="bridges_cuts.png"),
+            ])
             print("Done! Check PNG files.")
             
         elif choice == '10':
@@ -0,0 +1,176 @@
+"""
+MinHash / LSH index for approximate vehicle similarity on very large catalogs.
+
+Each car gets a MinHash signature of its part set. Signatures are split into
+bands; cars that agree on every row of some band land in the same bucket and
+become candidate pairs. The probability of becoming a candidate is
+1 - (1 - J^r)^b for Jaccard J, b bands and r rows per band, so pairs above the
+threshold are found without comparing every pair of cars.
+"""
+import zlib
+
+import networkx as nx
+
+from .projection import car_nodes
+
+# Mersenne prime 2^31 - 1: a * x + b stays below 2^63 with 31-bit operands
+_PRIME = (1 << 31) - 1
+
+
+def choose_bands(num_perm, threshold):
+    """
+    Picks (bands, rows) with bands * rows == num_perm whose S-curve midpoint
+    (1 / bands) ** (1 / rows) is closest to the threshold.
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def _token(part):
+    return zlib.crc32(str(part).encode('utf-8')) % _PRIME
+
+
+class MinHashIndex:
+    """
+    MinHash signatures of every car's part set (B.neighbors) with banded LSH buckets.
+    - num_perm: signature length; more permutations give better estimates.
+    - threshold: Jaccard level the bands are tuned for (ignored if bands is given).
+    - bands: number of bands (num_perm must be divisible by it).
+    - seed: makes the hash functions reproducible.
+    - block_bytes: memory budget of the (num_perm x tokens) hash matrix built per block of cars.
+    """
+
+    def __init__(self, B, num_perm=128, threshold=0.5, bands=None, seed=0, block_bytes=64 << 20):
+        import numpy as np
+
+        if bands is None:
+            bands, rows = choose_bands(num_perm, threshold)
+        elif num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        else:
+            rows = num_perm // bands
+
+        self.B = B
+        self.num_perm, self.bands, self.rows, self.threshold = num_perm, bands, rows, threshold
+        self.cars = car_nodes(B)
+        self.index = {c: i for i, c in enumerate(self.cars)}
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.int64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.int64)
+        self.signatures = self._build_signatures(block_bytes)
+        self.buckets = self._build_buckets()
+
+    def _build_signatures(self, block_bytes):
+        import numpy as np
+
+        sig = np.full((len(self.cars), self.num_perm), _PRIME, dtype=np.int64)
+        tokens = [np.array([_token(p) for p in self.B.neighbors(c)], dtype=np.int64)
+                  for c in self.cars]
+
+        # Hash cars in blocks so the (num_perm x tokens) matrix stays within block_bytes;
+        # one buffer is reused and every step writes into it
+        block_size = max(1, block_bytes // (self.num_perm * 8))
+        longest = max((len(t) for t in tokens), default=0)
+        buffer = np.empty((self.num_perm, max(block_size, longest)), dtype=np.int64)
+        start = 0
+        while start < len(self.cars):
+            stop, size = start, 0
+            while stop < len(self.cars) and (size == 0 or size + len(tokens[stop]) <= block_size):
+                size += len(tokens[stop])
+                stop += 1
+            block = tokens[start:stop]
+            lengths = np.array([len(t) for t in block])
+            if lengths.sum():
+                x = np.concatenate(block)
+                hashed = buffer[:, :len(x)]
+                np.multiply(self._a[:, None], x[None, :], out=hashed)
+                np.add(hashed, self._b[:, None], out=hashed)
+                np.remainder(hashed, _PRIME, out=hashed)
+                offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+                nonempty = lengths > 0
+                mins = np.minimum.reduceat(hashed, offsets[nonempty], axis=1)
+                sig[np.arange(start, stop)[nonempty]] = mins.T
+            start = stop
+        return sig
+
+    def _build_buckets(self):
+        buckets = [{} for _ in range(self.bands)]
+        for i, car in enumerate(self.cars):
+            if self.B.degree(car) == 0:
+                continue
+            for band in range(self.bands):
+                key = self.signatures[i, band * self.rows:(band + 1) * self.rows].tobytes()
+                buckets[band].setdefault(key, []).append(i)
+        return buckets
+
+    def estimate_jaccard(self, u, v):
+        """Estimated Jaccard similarity of two cars (fraction of equal signature rows)."""
+        import numpy as np
+
+        return float(np.mean(self.signatures[self.index[u]] == self.signatures[self.index[v]]))
+
+    def _exact_jaccard(self, u, v):
+        a, b = set(self.B.neighbors(u)), set(self.B.neighbors(v))
+        union = len(a | b)
+        return len(a & b) / union if union else 0.0
+
+    def candidates(self, car):
+        """Cars sharing at least one LSH bucket with car."""
+        i = self.index[car]
+        found = set()
+        for band in range(self.bands):
+            key = self.signatures[i, band * self.rows:(band + 1) * self.rows].tobytes()
+            found.update(self.buckets[band].get(key, ()))
+        found.discard(i)
+        return [self.cars[j] for j in sorted(found)]
+
+    def query(self, car, threshold=None, exact=False):
+        """
+        Cars with Jaccard >= threshold to car, as [(other, similarity)] sorted
+        by similarity. Similarities are estimates unless exact=True.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        score = self._exact_jaccard if exact else self.estimate_jaccard
+        result = [(other, score(car, other)) for other in self.candidates(car)]
+        return sorted([r for r in result if r[1] >= threshold], key=lambda r: r[1], reverse=True)
+
+    def candidate_pairs(self, threshold=None, exact=False):
+        """
+        All pairs with Jaccard >= threshold found through the buckets,
+        as [(u, v, similarity)]. Similarities are estimates unless exact=True.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        score = self._exact_jaccard if exact else self.estimate_jaccard
+        pairs = set()
+        for band in self.buckets:
+            for members in band.values():
+                for a in range(len(members)):
+                    for b in range(a + 1, len(members)):
+                        pairs.add((members[a], members[b]))
+
+        result = []
+        for i, j in sorted(pairs):
+            s = score(self.cars[i], self.cars[j])
+            if s >= threshold:
+                result.append((self.cars[i], self.cars[j], s))
+        return result
+
+    def projected_graph(self, threshold=None):
+        """
+        Sparsified Projected Graph: only candidate pairs whose exact Jaccard is
+        >= threshold, with the usual 'weight' / 'shared_parts' plus 'jaccard'.
+        """
+        P = nx.Graph()
+        P.add_nodes_from(self.cars)
+        for u, v, j in self.candidate_pairs(threshold, exact=True):
+            shared = set(self.B.neighbors(u)) & set(self.B.neighbors(v))
+            P.add_edge(u, v, weight=len(shared), shared_parts=list(shared), jaccard=j)
+        return P
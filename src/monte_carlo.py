@@ -0,0 +1,122 @@
+"""
+Monte Carlo random-failure resilience estimator.
+
+Each part fails independently with its own probability. Failure masks are
+drawn in batches of trials as NumPy arrays and the per-trial impact is
+computed on the car x part incidence matrix, without copying graphs:
+- cars stopped: cars with at least one failed part;
+- giant component: largest group of cars still linked by surviving parts
+  (the largest connected component of the damaged Projected Graph).
+"""
+from statistics import NormalDist
+
+from .projection import incidence_matrix
+
+
+def _failure_probabilities(parts, failure_prob, default):
+    import numpy as np
+
+    if isinstance(failure_prob, dict):
+        probs = np.array([failure_prob.get(p, default) for p in parts], dtype=float)
+    else:
+        probs = np.full(len(parts), float(failure_prob))
+    if np.any((probs < 0) | (probs > 1)):
+        raise ValueError("Failure probabilities must be in [0, 1]")
+    return probs
+
+
+def _batch_impact(A, rows, cols, failed):
+    """
+    Computes (cars_stopped, giant_component) for a batch of failure masks.
+    failed: (trials x parts) boolean array.
+    """
+    import numpy as np
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    n_trials = failed.shape[0]
+    n_cars, n_parts = A.shape
+    n_nodes = n_cars + n_parts
+
+    # 1. Cars stopped = cars using at least one failed part
+    stopped = (A @ failed.T.astype(np.int32)) > 0
+    cars_stopped = stopped.sum(axis=0)
+
+    # 2. One block-diagonal bipartite graph holding every trial's surviving edges
+    trial, edge = np.nonzero(~failed[:, cols])
+    offset = trial.astype(np.int64) * n_nodes
+    src = offset + rows[edge]
+    dst = offset + n_cars + cols[edge]
+    total = n_trials * n_nodes
+    G = sparse.coo_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), shape=(total, total))
+    _, labels = connected_components(G, directed=False)
+
+    car_labels = labels.reshape(n_trials, n_nodes)[:, :n_cars]
+    counts = np.bincount(car_labels.ravel())
+    giant = counts[car_labels].max(axis=1) if n_cars else np.zeros(n_trials, dtype=np.int64)
+    return cars_stopped, giant
+
+
+def _summary(samples, confidence):
+    import numpy as np
+
+    n = len(samples)
+    mean = float(np.mean(samples))
+    std = float(np.std(samples, ddof=1)) if n > 1 else 0.0
+    half = NormalDist().inv_cdf((1 + confidence) / 2) * std / np.sqrt(n)
+    return {
+        'mean': mean,
+        'std': std,
+        'ci': (mean - half, mean + half),
+        'percentiles': {q: float(np.percentile(samples, q)) for q in (5, 50, 95)},
+    }
+
+
+def simulate_random_failures(B, failure_prob, trials=10000, batch_size=1000, seed=None,
+                             confidence=0.95, tolerance=None, default_prob=0.0):
+    """
+    Estimates the distribution of cars stopped and giant-component size under random failures.
+    - failure_prob: a single probability for every part, or {part: probability}.
+    - default_prob: probability for parts missing from a failure_prob dict.
+    - seed: makes the run reproducible; results do not depend on batch_size.
+    - tolerance: optional early stop once both means have a CI half-width below it.
+    Returns a dict with 'trials', 'cars_stopped' and 'giant_component' summaries
+    (mean, std, ci, percentiles) and the raw per-trial 'samples'.
+    """
+    import numpy as np
+
+    if trials < 1:
+        raise ValueError("Number of trials must be at least 1")
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+
+    A, cars, parts = incidence_matrix(B)
+    probs = _failure_probabilities(parts, failure_prob, default_prob)
+    coo = A.tocoo()
+    rows, cols = coo.row.astype(np.int64), coo.col.astype(np.int64)
+
+    rng = np.random.default_rng(seed)
+    stopped_batches, giant_batches = [], []
+    done = 0
+    while done < trials:
+        size = min(batch_size, trials - done)
+        failed = rng.random((size, len(parts))) < probs
+        stopped, giant = _batch_impact(A, rows, cols, failed)
+        stopped_batches.append(stopped)
+        giant_batches.append(giant)
+        done += size
+
+        if tolerance is not None and done > 1:
+            stats = [_summary(np.concatenate(b), confidence)
+                     for b in (stopped_batches, giant_batches)]
+            if all((s['ci'][1] - s['ci'][0]) / 2 <= tolerance for s in stats):
+                break
+
+    cars_stopped = np.concatenate(stopped_batches)
+    giant_component = np.concatenate(giant_batches)
+    return {
+        'trials': done,
+        'cars_stopped': _summary(cars_stopped, confidence),
+        'giant_component': _summary(giant_component, confidence),
+        'samples': {'cars_stopped': cars_stopped, 'giant_component': giant_component},
+    }
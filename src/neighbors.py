@@ -0,0 +1,131 @@
+"""
+Top-k "most similar vehicles" queries without materializing the Projected Graph.
+
+NeighborIndex keeps an inverted index part -> cars built from the bipartite
+graph. A single query walks the posting lists of the car's parts, rarest
+first, accumulating scores in a dict; once no unseen car could still enter
+the top k, new candidates are no longer admitted. Batches of queries use one
+sparse product per chunk of cars instead.
+
+Metrics:
+- 'shared':   number of shared parts (the Projected Graph 'weight');
+- 'jaccard':  shared / union of the two part sets;
+- 'weighted': Adamic-Adar style overlap, each shared part counts 1 / ln(deg(part)),
+  so rarely shared parts weigh more than ubiquitous ones.
+"""
+import heapq
+
+from .projection import incidence_matrix
+
+METRICS = ('shared', 'jaccard', 'weighted')
+
+
+def _rank_key(item):
+    # Rounded so float sums in a different order still tie, then by name
+    return (-round(item[1], 9), str(item[0]))
+
+
+class NeighborIndex:
+    """Precomputed index answering top-k similar-car queries on a bipartite graph B."""
+
+    def __init__(self, B):
+        import numpy as np
+
+        self.A, self.cars, self.parts = incidence_matrix(B)
+        self.index = {c: i for i, c in enumerate(self.cars)}
+        self.A_T = self.A.T.tocsr()
+        self.car_sizes = np.diff(self.A.indptr)
+        part_degrees = np.diff(self.A_T.indptr)
+        # A shared part has degree >= 2, so ln(deg) > 0 wherever it matters
+        self.part_weights = np.where(part_degrees > 1,
+                                     1.0 / np.log(np.maximum(part_degrees, 2)), 0.0)
+
+    def _check_metric(self, metric):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+
+    def _final_score(self, metric, acc, qsize, j):
+        if metric == 'jaccard':
+            union = qsize + self.car_sizes[j] - acc
+            return acc / union if union else 0.0
+        return acc
+
+    def query(self, car, k=10, metric='shared'):
+        """
+        Returns the k cars most similar to car as [(other, score)], best first
+        (ties broken by name). Cars sharing no part are never returned.
+        """
+        self._check_metric(metric)
+        i = self.index[car]
+        A, A_T = self.A, self.A_T
+        query_parts = A.indices[A.indptr[i]:A.indptr[i + 1]].tolist()
+        # Rarest parts first: short posting lists, and the largest weights early
+        query_parts.sort(key=lambda p: A_T.indptr[p + 1] - A_T.indptr[p])
+        qsize = len(query_parts)
+        gains = [1 if metric != 'weighted' else float(self.part_weights[p]) for p in query_parts]
+        remaining = sum(gains)
+
+        acc = {}
+        admitting = True
+        for p, gain in zip(query_parts, gains):
+            remaining -= gain
+            for j in A_T.indices[A_T.indptr[p]:A_T.indptr[p + 1]].tolist():
+                if j == i:
+                    continue
+                if j in acc:
+                    acc[j] += gain
+                elif admitting:
+                    acc[j] = gain
+
+            if admitting and len(acc) >= k:
+                # Upper bound of any car not seen yet vs. the current k-th best lower bound
+                if metric == 'jaccard':
+                    bound = remaining / qsize if qsize else 0.0
+                    scores = (self._final_score(metric, a, qsize, j) for j, a in acc.items())
+                    kth = heapq.nlargest(k, scores)[-1]
+                else:
+                    bound = remaining
+                    kth = heapq.nlargest(k, acc.values())[-1]
+                if kth > bound:
+                    admitting = False
+
+        scored = ((self.cars[j], self._final_score(metric, a, qsize, j)) for j, a in acc.items())
+        return heapq.nsmallest(k, scored, key=_rank_key)
+
+    def query_batch(self, cars, k=10, metric='shared', chunk_size=1024):
+        """
+        Top-k queries for many cars, one sparse product per chunk of queries.
+        Returns {car: [(other, score)]} with the same ordering as query().
+        """
+        import numpy as np
+        from scipy import sparse
+
+        self._check_metric(metric)
+        cars = list(cars)
+        right = self.A_T
+        if metric == 'weighted':
+            right = sparse.diags(self.part_weights) @ self.A_T
+
+        results = {}
+        for start in range(0, len(cars), chunk_size):
+            chunk = cars[start:start + chunk_size]
+            rows = np.array([self.index[c] for c in chunk], dtype=np.int64)
+            S = (self.A[rows].astype(np.float64) @ right).tocsr()
+            for r, car in enumerate(chunk):
+                cols = S.indices[S.indptr[r]:S.indptr[r + 1]]
+                vals = S.data[S.indptr[r]:S.indptr[r + 1]]
+                keep = (cols != rows[r]) & (vals > 0)
+                cols, vals = cols[keep], vals[keep]
+                if metric == 'jaccard':
+                    vals = vals / (self.car_sizes[rows[r]] + self.car_sizes[cols] - vals)
+                if len(vals) > k:
+                    # Keep everything tied with the k-th value so name tie-breaks stay exact;
+                    # compare rounded scores, as _rank_key does
+                    rounded = np.round(vals, 9)
+                    kth = np.partition(rounded, len(rounded) - k)[len(rounded) - k]
+                    mask = rounded >= kth
+                    cols, vals = cols[mask], vals[mask]
+                scored = [(self.cars[j], float(v) if metric != 'shared' else int(round(v)))
+                          for j, v in zip(cols.tolist(), vals.tolist())]
+                results[car] = heapq.nsmallest(k, scored, key=_rank_key)
+        return results
@@ -0,0 +1,180 @@
+"""
+Dependency-aware analysis pipeline.
+
+Tasks are named, declare the names of their inputs (other tasks or plain
+values) and are run at most once: results are memoized in the pipeline.
+Every task whose inputs are ready is submitted to a process pool, so a full
+report takes as long as its longest chain of dependent analyses instead of
+the sum of all of them.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from . import cache, graph_ops
+
+# analysis_pipeline runs in this process below this many edges (B and P
+# together): starting a pool costs more than the analyses themselves
+PARALLEL_MIN_EDGES = 20000
+
+
+def _call(func, args, kwargs):
+    return func(*args, **kwargs)
+
+
+def _call_uncached(func, args, kwargs):
+    # The worker's cache is private to it; the parent stores the result instead
+    return func.uncached(*args, **kwargs)
+
+
+class Pipeline:
+    """
+    Named tasks with declared inputs and memoized results.
+    - processes: pool size (defaults to the CPU count); 1 runs in this process.
+    Task functions and results cross process boundaries, so they must be
+    picklable (module-level functions, plain data and graphs).
+    Tasks that are cached analyses (see cache.cached_analysis) are looked up in
+    cache.default_cache before being submitted, and results computed by workers
+    are stored there, so the pipeline and direct calls share one cache.
+    """
+
+    def __init__(self, processes=None):
+        self.processes = processes
+        self.tasks = {}
+        self.results = {}
+
+    def add_input(self, name, value):
+        """Registers a plain value that tasks can declare as an input."""
+        self.results[name] = value
+        return self
+
+    def add(self, name, func, inputs=(), kwargs=None, local=False):
+        """
+        Registers func(*[result of each input], **kwargs) under name.
+        - local: run in this process (for cheap glue steps not worth a round trip).
+        """
+        if name in self.tasks or name in self.results:
+            raise ValueError(f"Duplicate task: {name}")
+        self.tasks[name] = (func, tuple(inputs), dict(kwargs or {}), local)
+        return self
+
+    def _required(self, targets):
+        required, stack = set(), list(targets)
+        while stack:
+            name = stack.pop()
+            if name in required or name in self.results:
+                continue
+            if name not in self.tasks:
+                raise ValueError(f"Unknown task or input: {name}")
+            required.add(name)
+            stack.extend(self.tasks[name][1])
+        return required
+
+    def _ready(self, pending):
+        return [n for n in sorted(pending) if all(i in self.results for i in self.tasks[n][1])]
+
+    def _args(self, name):
+        func, inputs, kwargs, _ = self.tasks[name]
+        return func, [self.results[i] for i in inputs], kwargs
+
+    def run(self, targets=None):
+        """
+        Computes the targets (all tasks by default) and whatever they depend on.
+        Returns {target: result}.
+        """
+        targets = list(self.tasks) if targets is None else list(targets)
+        pending = self._required(targets)
+        processes = self.processes or os.cpu_count() or 1
+
+        if processes == 1:
+            while pending:
+                ready = self._ready(pending)
+                if not ready:
+                    raise ValueError(f"Circular dependency between: {sorted(pending)}")
+                for name in ready:
+                    self.results[name] = _call(*self._args(name))
+                    pending.discard(name)
+        elif pending:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                running = {}
+                while pending or running:
+                    ready = self._ready(pending)
+                    while ready:
+                        for name in ready:
+                            pending.discard(name)
+                            func, args, kwargs = self._args(name)
+                            key = None
+                            if hasattr(func, 'uncached') and args:
+                                key = cache.analysis_key(func.uncached, args[0], args[1:], kwargs)
+                            missing = object()
+                            cached = missing
+                            if key is not None:
+                                cached = cache.default_cache.get(key, missing)
+                            if cached is not missing:
+                                self.results[name] = cached
+                            elif self.tasks[name][3]:
+                                self.results[name] = _call(func, args, kwargs)
+                            elif key is not None:
+                                future = pool.submit(_call_uncached, func, args, kwargs)
+                                running[future] = (name, key)
+                            else:
+                                running[pool.submit(_call, func, args, kwargs)] = (name, None)
+                        # Local steps may have unblocked further tasks
+                        ready = self._ready(pending)
+                    if not running:
+                        if pending:
+                            raise ValueError(f"Circular dependency between: {sorted(pending)}")
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name, key = running.pop(future)
+                        self.results[name] = future.result()
+                        if key is not None:
+                            cache.default_cache.put(key, self.results[name])
+
+        return {name: self.results[name] for name in targets}
+
+    def __getitem__(self, name):
+        if name not in self.results:
+            self.run([name])
+        return self.results[name]
+
+
+# ---- Glue steps for the report/article pipeline (module level so they pickle) ----
+
+def _top_parts(critical_parts, n):
+    return [p[0] for p in critical_parts[:n]]
+
+
+def _top_part_failure(B, top_parts):
+    return graph_ops.simulate_part_failure(B, top_parts[0])
+
+
+def _predict_demand(B, communities):
+    return graph_ops.predict_demand(B, communities[1])
+
+
+def analysis_pipeline(B, P, processes=None):
+    """
+    Pipeline with the analyses shared by report_generator and article_generator:
+    'communities', 'criticality', 'part_failure', 'stock', 'clustering',
+    'jaccard' (P annotated with Jaccard weights), 'assortativity', 'k_core',
+    'mst', 'cumulative_failure' (top 5 parts) and 'demand'.
+    With processes=None, graphs under PARALLEL_MIN_EDGES edges run in this process.
+    """
+    if processes is None and B.number_of_edges() + P.number_of_edges() < PARALLEL_MIN_EDGES:
+        processes = 1
+    pipe = Pipeline(processes)
+    pipe.add_input('B', B).add_input('P', P)
+    pipe.add('communities', graph_ops.detect_communities, ['P'])
+    pipe.add('criticality', graph_ops.get_part_criticality, ['B'])
+    pipe.add('top_parts', _top_parts, ['criticality'], {'n': 5}, local=True)
+    pipe.add('part_failure', _top_part_failure, ['B', 'top_parts'])
+    pipe.add('cumulative_failure', graph_ops.simulate_cumulative_failure, ['B', 'top_parts'])
+    pipe.add('stock', graph_ops.analyze_stock_savings, ['B'])
+    pipe.add('clustering', graph_ops.get_clustering_analysis, ['P'])
+    pipe.add('jaccard', graph_ops.calculate_jaccard_weights, ['B', 'P'])
+    pipe.add('assortativity', graph_ops.calculate_assortativity, ['P'])
+    pipe.add('k_core', graph_ops.get_k_core_decomposition, ['P'])
+    pipe.add('mst', graph_ops.get_mst, ['P'])
+    pipe.add('demand', _predict_demand, ['B', 'communities'])
+    return pipe
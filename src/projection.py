@@ -0,0 +1,218 @@
+"""
+Projection engines for the Car-to-Car graph.
+
+The original projection in graph_ops compares every pair of cars in Python.
+The engines here compute the same 'weight' / 'shared_parts' edges from the
+car x part incidence matrix instead.
+"""
+import networkx as nx
+
+
+def car_nodes(B):
+    """Returns car nodes of B in insertion order."""
+    return [n for n, d in B.nodes(data=True) if d.get('type') == 'car']
+
+
+def part_nodes(B):
+    """Returns part nodes of B in insertion order."""
+    return [n for n, d in B.nodes(data=True) if d.get('type') == 'part']
+
+
+def incidence_matrix(B, cars=None, parts=None):
+    """
+    Builds the sparse car x part incidence matrix of B.
+    Returns (A, cars, parts) where A[i, j] = 1 if cars[i] uses parts[j].
+    """
+    import numpy as np
+    from scipy import sparse
+
+    if cars is None:
+        cars = car_nodes(B)
+    if parts is None:
+        parts = part_nodes(B)
+    part_index = {p: j for j, p in enumerate(parts)}
+
+    indptr = [0]
+    indices = []
+    for car in cars:
+        row = sorted(part_index[p] for p in B.neighbors(car) if p in part_index)
+        indices.extend(row)
+        indptr.append(len(indices))
+
+    data = np.ones(len(indices), dtype=np.int32)
+    A = sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(cars), len(parts)),
+    )
+    return A, cars, parts
+
+
+def _shared_part_lists(A, C, parts):
+    """
+    The 'shared_parts' list of every pair (C.row[e], C.col[e]), built in one
+    pass over the part -> cars posting lists of A (in part order).
+    """
+    import numpy as np
+
+    n = A.shape[0]
+    At = A.T.tocsr()
+    At.sort_indices()
+    firsts, seconds, codes = [], [], []
+    for k in range(At.shape[0]):
+        users = At.indices[At.indptr[k]:At.indptr[k + 1]]
+        if len(users) < 2:
+            continue
+        a, b = np.triu_indices(len(users), 1)
+        firsts.append(users[a])
+        seconds.append(users[b])
+        codes.append(np.full(len(a), k, dtype=np.int64))
+
+    keys = np.concatenate(firsts).astype(np.int64) * n + np.concatenate(seconds)
+    order = np.argsort(keys, kind='stable')  # Stable: parts stay in order within a pair
+    keys = keys[order]
+    names = [parts[k] for k in np.concatenate(codes)[order].tolist()]
+    # Each pair occurs once per shared part, i.e. C.data times
+    starts = np.searchsorted(keys, C.row.astype(np.int64) * n + C.col).tolist()
+    return [names[s:s + w] for s, w in zip(starts, C.data.tolist())]
+
+
+def project_sparse(B, with_shared_parts=True):
+    """
+    Builds the Projected Graph as a single sparse product C = A @ A.T.
+    C[i, j] is the number of parts shared by cars i and j.
+    - with_shared_parts: False builds 'weight' edges only (much faster on dense projections).
+    """
+    from scipy import sparse
+
+    A, cars, parts = incidence_matrix(B)
+    C = sparse.triu(A @ A.T, k=1).tocoo()
+
+    P = nx.Graph()
+    P.add_nodes_from(cars)
+    if C.nnz == 0:
+        return P
+
+    rows, cols, weights = C.row.tolist(), C.col.tolist(), C.data.tolist()
+    if with_shared_parts:
+        shared = _shared_part_lists(A, C, parts)
+        P.add_edges_from((cars[i], cars[j], {'weight': w, 'shared_parts': s})
+                         for i, j, w, s in zip(rows, cols, weights, shared))
+    else:
+        P.add_edges_from((cars[i], cars[j], {'weight': w}) for i, j, w in zip(rows, cols, weights))
+
+    return P
+
+
+def project_inverted_index(B):
+    """
+    Builds the Projected Graph from an inverted index part -> cars.
+    Only pairs of cars that actually co-occur on some part are visited,
+    so the cost is the sum of deg(part)^2 instead of cars^2.
+    """
+    cars = car_nodes(B)
+    car_index = {c: i for i, c in enumerate(cars)}
+
+    shared = {}
+    for part in part_nodes(B):
+        users = sorted(car_index[c] for c in B.neighbors(part) if c in car_index)
+        for a in range(len(users)):
+            for b in range(a + 1, len(users)):
+                shared.setdefault((users[a], users[b]), []).append(part)
+
+    P = nx.Graph()
+    P.add_nodes_from(cars)
+    for (i, j), parts in shared.items():
+        P.add_edge(cars[i], cars[j], weight=len(parts), shared_parts=parts)
+
+    return P
+
+
+class IncrementalProjection:
+    """
+    Keeps a Projected Graph in sync with part removals and additions.
+    Removing or adding one part only touches the edges among that part's cars,
+    so each update costs deg(part)^2 instead of a full rebuild.
+
+    Attributes:
+    - B: private copy of the bipartite graph, updated alongside P.
+    - P: the maintained Projected Graph ('weight' and 'shared_parts' edges).
+    """
+
+    def __init__(self, B):
+        self.B = B.copy()
+        self.P = project_inverted_index(self.B)
+        self._car_order = {c: i for i, c in enumerate(car_nodes(self.B))}
+
+    def _users(self, cars):
+        return sorted((c for c in cars if c in self._car_order), key=self._car_order.get)
+
+    def is_part(self, node):
+        """True if node is a part (type 'part') still present in B."""
+        return node in self.B and self.B.nodes[node].get('type') == 'part'
+
+    def remove_part(self, part):
+        """
+        Removes a part and decrements the edges among its cars.
+        Returns the list of cars that used it (empty if the part is unknown
+        or the node is not a part: cars are never removed).
+        """
+        if not self.is_part(part):
+            return []
+        users = self._users(self.B.neighbors(part))
+        self.B.remove_node(part)
+
+        for a in range(len(users)):
+            for b in range(a + 1, len(users)):
+                u, v = users[a], users[b]
+                data = self.P[u][v]
+                data['weight'] -= 1
+                data['shared_parts'].remove(part)
+                if data['weight'] == 0:
+                    self.P.remove_edge(u, v)
+        return users
+
+    def add_part(self, part, cars):
+        """
+        Adds a part used by the given cars and increments the edges among them.
+        Cars that are not in the projection are ignored.
+        """
+        if part in self.B:
+            raise ValueError(f"Part already present: {part}")
+        users = self._users(cars)
+        self.B.add_node(part, bipartite=1, type='part')
+        self.B.add_edges_from((car, part) for car in users)
+
+        for a in range(len(users)):
+            for b in range(a + 1, len(users)):
+                u, v = users[a], users[b]
+                if self.P.has_edge(u, v):
+                    self.P[u][v]['weight'] += 1
+                    self.P[u][v]['shared_parts'].append(part)
+                else:
+                    self.P.add_edge(u, v, weight=1, shared_parts=[part])
+
+    def snapshot(self):
+        """Returns a copy of P whose 'shared_parts' lists are not touched by later updates."""
+        P = nx.Graph()
+        P.add_nodes_from(self.P.nodes(data=True))
+        P.add_edges_from(
+            (u, v, {'weight': d['weight'], 'shared_parts': list(d['shared_parts'])})
+            for u, v, d in self.P.edges(data=True)
+        )
+        return P
+
+    def remove_parts(self, parts):
+        """
+        Removes several parts.
+        Returns {part: cars} for the parts actually removed, usable with add_parts().
+        """
+        removed = {}
+        for part in parts:
+            if self.is_part(part) and part not in removed:
+                removed[part] = self.remove_part(part)
+        return removed
+
+    def add_parts(self, part_cars):
+        """Adds several parts from a {part: cars} mapping."""
+        for part, cars in part_cars.items():
+            self.add_part(part, cars)
@@ -1,37 +1,42 @@
 
 from datetime import datetime
-from . import graph_ops
+from . import pipeline
 from .data import V_CARROS, V_PECAS
 
-def generate_full_report(B, P, save_path="relatorio_completo.md"):
+def generate_full_report(B, P, save_path="relatorio_completo.md", processes=None):
     """
     Generates a comprehensive markdown report answering TG.txt questions.
+    Independent analyses run concurrently through pipeline.analysis_pipeline
+    (processes=1 runs them all in this process).
     """
+    results = pipeline.analysis_pipeline(B, P, processes).run(
+        ['communities', 'criticality', 'part_failure', 'stock', 'clustering', 'jaccard',
+         'assortativity'])
     
     # 1. Basic Stats
     num_cars = B.degree(V_CARROS)
     avg_per_car = sum(d for n, d in num_cars) / len(V_CARROS)
     
     # 2. Communities (Clusters)
-    community_map, communities = graph_ops.detect_communities(P)
+    community_map, communities = results['communities']
     
     # 3. Hubs (Critical Parts) - Expanded Analysis
-    critical_parts = graph_ops.get_part_criticality(B)
+    critical_parts = results['criticality']
     top_critical = critical_parts[:10]
     
     # 4. Resilience (Simulate failure of top degree part)
     top_part = top_critical[0][0]
-    affected, impact_severity = graph_ops.simulate_part_failure(B, top_part)
+    affected, impact_severity = results['part_failure']
     
     # 5. Stock Savings
-    total_needed, unique, savings = graph_ops.analyze_stock_savings(B)
+    total_needed, unique, savings = results['stock']
     
     # 6. Advanced Topology (Clustering & Jaccard)
-    avg_clust, transitivity, local_clust = graph_ops.get_clustering_analysis(P)
-    P = graph_ops.calculate_jaccard_weights(B, P)
+    avg_clust, transitivity, local_clust = results['clustering']
+    P = results['jaccard']
     
     # 7. Market Segmentation (Assortativity)
-    assortativity, _ = graph_ops.calculate_assortativity(P)
+    assortativity, _ = results['assortativity']
     
     with open(save_path, "w") as f:
         f.write(f"# Relatório de Análise de Grafos: Cadeia de Suprimentos Automotiva\n")
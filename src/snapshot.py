@@ -0,0 +1,190 @@
+"""
+Memory-mapped binary snapshot of the bipartite and projected graphs.
+
+Start-up normally rebuilds B and P from the raw data. A snapshot persists
+both graphs as flat arrays (CSR offsets, neighbors, projection weights and
+the node-name table) behind a small header carrying a format version and
+the hash of the source data. Opening it is a file map plus a header check;
+when the source hash changes the graphs are rebuilt and the file rewritten.
+The mapped graphs are csr.CSRGraph views; networkx graphs are converted
+from them.
+
+Layout (little-endian, every section aligned to 8 bytes):
+    header | kinds int8[n] | b_indptr int64[n+1] | b_indices int32[nb]
+    | car_ids int32[c] | p_indptr int64[c+1] | p_indices int32[np]
+    | p_weights int32[np] | name_offsets int64[n+1] | names utf-8
+"""
+import hashlib
+import mmap
+import os
+import struct
+
+from . import csr
+
+MAGIC = b'VPGSNAP\0'
+VERSION = 1
+# magic, version, dataset hash, n_nodes, b_nnz, n_cars, p_nnz, names_bytes
+HEADER = struct.Struct('<8sI16sQQQQQ')
+
+
+def dataset_hash(source=None):
+    """
+    Hash of the data a snapshot was built from: the data.py constants when
+    source is None, otherwise the bytes of the catalog file.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if source is None:
+        from .data import EDGES_BIPARTIDO, V_CARROS, V_PECAS
+        h.update(repr((V_CARROS, V_PECAS, EDGES_BIPARTIDO)).encode())
+    else:
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    return h.digest()
+
+
+def _sections(n_nodes, b_nnz, n_cars, p_nnz):
+    return [
+        ('kinds', 'int8', n_nodes),
+        ('b_indptr', 'int64', n_nodes + 1),
+        ('b_indices', 'int32', b_nnz),
+        ('car_ids', 'int32', n_cars),
+        ('p_indptr', 'int64', n_cars + 1),
+        ('p_indices', 'int32', p_nnz),
+        ('p_weights', 'int32', p_nnz),
+        ('name_offsets', 'int64', n_nodes + 1),
+    ]
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def save_snapshot(path, B, P, data_hash):
+    """
+    Writes B (bipartite) and P (projection with 'weight') to path.
+    Both may be networkx graphs or csr.CSRGraph. The file is written to a
+    temporary name and moved into place, so readers never see a partial file.
+    """
+    import numpy as np
+
+    if not isinstance(B, csr.CSRGraph):
+        B = csr.from_networkx(B)
+    if not isinstance(P, csr.CSRGraph):
+        P = csr.from_networkx(P, weight='weight')
+
+    encoded = [str(n).encode('utf-8') for n in B.names]
+    name_offsets = np.concatenate(([0], np.cumsum([len(e) for e in encoded]))).astype(np.int64)
+    arrays = {
+        'kinds': B.kinds,
+        'b_indptr': B.indptr,
+        'b_indices': B.indices,
+        'car_ids': np.array([B.index[n] for n in P.names], dtype=np.int32),
+        'p_indptr': P.indptr,
+        'p_indices': P.indices,
+        'p_weights': P.edge_data['weight'],
+        'name_offsets': name_offsets,
+    }
+    n_nodes, b_nnz, n_cars, p_nnz = len(B.names), len(B.indices), len(P.names), len(P.indices)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, data_hash, n_nodes, b_nnz, n_cars, p_nnz,
+                            int(name_offsets[-1])))
+        for name, dtype, count in _sections(n_nodes, b_nnz, n_cars, p_nnz):
+            f.write(b'\0' * (_align(f.tell()) - f.tell()))
+            f.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+        f.write(b''.join(encoded))
+    os.replace(tmp_path, path)
+
+
+def read_header(path):
+    """Returns the header fields as a dict, or None if the file is missing or not a snapshot."""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(raw) < HEADER.size:
+        return None
+    magic, version, data_hash, n_nodes, b_nnz, n_cars, p_nnz, names_bytes = HEADER.unpack(raw)
+    if magic != MAGIC:
+        return None
+    return {'version': version, 'hash': data_hash, 'n_nodes': n_nodes, 'b_nnz': b_nnz,
+            'n_cars': n_cars, 'p_nnz': p_nnz, 'names_bytes': names_bytes}
+
+
+def open_snapshot(path, expected_hash=None):
+    """
+    Maps a snapshot and returns (B, P) as csr.CSRGraph views over the file.
+    Returns None if the file is missing, has another version, a different
+    dataset hash than expected_hash, or is truncated.
+    """
+    import numpy as np
+
+    header = read_header(path)
+    if header is None or header['version'] != VERSION:
+        return None
+    if expected_hash is not None and header['hash'] != expected_hash:
+        return None
+
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    arrays = {}
+    offset = HEADER.size
+    sections = _sections(header['n_nodes'], header['b_nnz'], header['n_cars'], header['p_nnz'])
+    for name, dtype, count in sections:
+        offset = _align(offset)
+        nbytes = count * np.dtype(dtype).itemsize
+        if offset + nbytes > size:
+            return None
+        arrays[name] = np.frombuffer(buf, dtype=dtype, count=count, offset=offset)
+        offset += nbytes
+    if offset + header['names_bytes'] != size:
+        return None
+
+    raw = buf[offset:offset + header['names_bytes']]
+    bounds = arrays['name_offsets'].tolist()
+    names = [raw[bounds[i]:bounds[i + 1]].decode('utf-8') for i in range(header['n_nodes'])]
+
+    B = csr.CSRGraph(names, arrays['kinds'], arrays['b_indptr'], arrays['b_indices'])
+    car_ids = arrays['car_ids']
+    P = csr.CSRGraph([names[i] for i in car_ids.tolist()], arrays['kinds'][car_ids],
+                     arrays['p_indptr'], arrays['p_indices'], {'weight': arrays['p_weights']})
+    return B, P
+
+
+def load_or_build(path, source=None, as_networkx=True):
+    """
+    Opens the snapshot at path if it matches the source data, otherwise
+    rebuilds B and P with graph_ops and rewrites the snapshot (a failed write,
+    e.g. in a read-only directory, only costs the rebuild on the next start).
+    Returns (B, P) as networkx graphs, or as csr.CSRGraph when as_networkx=False;
+    a rebuild returns the same graphs, in the same order, as the snapshot will.
+    Only as_networkx=False is a file map plus a header check: the networkx
+    conversion walks every edge.
+    """
+    from . import graph_ops
+
+    data_hash = dataset_hash(source)
+    graphs = open_snapshot(path, expected_hash=data_hash)
+    if graphs is None:
+        B = graph_ops.build_bipartite_graph(source)
+        P = graph_ops.build_projected_graph(B, method='sparse', with_shared_parts=False)
+        B, P = csr.from_networkx(B), csr.from_networkx(P, weight='weight')
+        # P's nodes carry no 'type': take the car kinds from B, as open_snapshot does
+        P.kinds = B.kinds[[B.index[n] for n in P.names]]
+        graphs = B, P
+        try:
+            save_snapshot(path, *graphs, data_hash)
+        except OSError:
+            pass
+
+    B, P = graphs
+    if as_networkx:
+        return csr.to_networkx(B), csr.to_networkx(P)
+    return B, P
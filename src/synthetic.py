@@ -0,0 +1,216 @@
+"""
+Seeded synthetic car-part catalogs for load testing.
+
+The built-in dataset (data.py) has 36 cars; this generator produces
+catalogs of any size with the same kind of structure:
+- platforms (like PQ35, MQB, CMP): clusters of cars, of heavy-tailed size,
+  shared by one to three brands, drawing most of their parts from a
+  platform pool;
+- brand segments: Premium brands (the names get_vehicle_segments looks
+  for) and Economy brands, each segment with its own part pool;
+- global supplier parts with Zipf-distributed popularity, so a few parts
+  reach a large share of the fleet (like "Sistema ABS Bosch");
+- a few custom parts per car.
+Cars are generated in independent chunks (each with its own seeded RNG), so
+edges can be streamed to a file or into build_bipartite_graph without
+holding the whole catalog in memory, and any chunk size gives the same catalog.
+"""
+import csv
+import gzip
+import json
+
+from . import loader
+
+PREMIUM_BRANDS = ('Audi', 'BMW', 'Mercedes', 'Porsche', 'Volvo', 'Jeep')
+ECONOMY_BRANDS = ('VW', 'Fiat', 'Renault', 'Peugeot', 'Nissan', 'Toyota', 'Honda', 'Ford',
+                  'Citroen', 'Hyundai')
+SUPPLIERS = ('Bosch', 'Continental', 'ZF', 'Denso', 'Valeo', 'Magna', 'Aisin', 'Delphi', 'Mahle',
+             'Brembo')
+
+# Share of each car's parts drawn from each pool
+MIX = {'platform': 0.5, 'segment': 0.2, 'global': 0.2, 'custom': 0.1}
+# Cars generated per RNG stream; fixed so the catalog never depends on chunking
+_BLOCK = 4096
+
+
+def _zipf_cdf(n, alpha, rng=None):
+    """Cumulative Zipf(alpha) weights over n items, in a random item order if rng is given."""
+    import numpy as np
+
+    w = np.arange(1, n + 1, dtype=np.float64) ** -alpha
+    if rng is not None:
+        w = w[rng.permutation(n)]
+    cdf = np.cumsum(w)
+    return cdf / cdf[-1]
+
+
+class SyntheticCatalog:
+    """
+    A reproducible synthetic catalog of num_cars cars.
+    - parts_per_car: mean number of parts per car (before duplicates are dropped).
+    - num_platforms: defaults to about one platform per 150 cars.
+    - alpha: Zipf exponent of part (and platform size) popularity; larger is more skewed.
+    - premium_share: share of platforms owned by Premium brands.
+    - seed: the same seed and parameters always give the same catalog.
+    """
+
+    def __init__(self, num_cars, parts_per_car=12, num_platforms=None, alpha=1.1,
+                 premium_share=0.3, seed=0):
+        import numpy as np
+
+        if num_cars < 1:
+            raise ValueError("num_cars must be positive")
+        self.num_cars = num_cars
+        self.parts_per_car = parts_per_car
+        self.alpha = alpha
+        self.seed = seed
+        self.num_platforms = num_platforms or max(3, num_cars // 150)
+
+        rng = np.random.default_rng([seed, 0])
+        p = self.num_platforms
+        self.platform_cdf = _zipf_cdf(p, 0.8, rng)
+        share = np.diff(self.platform_cdf, prepend=0.0)
+        self.platform_premium = rng.random(p) < premium_share
+        # One to three brands per platform, mostly from the platform's segment
+        self.platform_brands = []
+        for i in range(p):
+            own = PREMIUM_BRANDS if self.platform_premium[i] else ECONOMY_BRANDS
+            other = ECONOMY_BRANDS if self.platform_premium[i] else PREMIUM_BRANDS
+            brands = list(rng.choice(own, size=rng.integers(1, 3), replace=False))
+            if rng.random() < 0.2:
+                brands.append(rng.choice(other))
+            self.platform_brands.append(tuple(str(b) for b in brands))
+        # Pools grow with the expected number of cars on the platform
+        expected = np.maximum(share * num_cars, 1)
+        self.platform_pool = (20 + 2 * np.sqrt(expected)).astype(np.int64)
+        self.platform_offset = np.concatenate(([0], np.cumsum(self.platform_pool)))
+        self.platform_part_cdf = [_zipf_cdf(int(n), alpha, rng) for n in self.platform_pool]
+
+        self.segment_pool = int(30 + 3 * np.sqrt(num_cars))
+        self.segment_cdf = _zipf_cdf(self.segment_pool, alpha, rng)
+        self.global_pool = int(50 + 4 * np.sqrt(num_cars))
+        self.global_cdf = _zipf_cdf(self.global_pool, alpha)
+        # Platform p's CDF shifted into (p, p + 1], so one sorted array serves every platform
+        self._platform_cdfs = np.concatenate(
+            [cdf + i for i, cdf in enumerate(self.platform_part_cdf)])
+        self._names = None
+
+    def _part_names(self):
+        """Names of all pooled parts by part code (platform, segment, then global parts)."""
+        names = []
+        for p, size in enumerate(self.platform_pool):
+            names.extend(f"PLT{p:05d} Module {i:05d}" for i in range(size))
+        for segment in ('Premium', 'Economy'):
+            names.extend(f"{segment} Kit {i:05d}" for i in range(self.segment_pool))
+        names.extend(f"{SUPPLIERS[i % len(SUPPLIERS)]} System {i:05d}"
+                     for i in range(self.global_pool))
+        return names
+
+    def _block(self, block):
+        """(car, part) edges for one fixed block of cars, sorted by car then part code."""
+        import numpy as np
+
+        if self._names is None:
+            self._names = self._part_names()
+        start = block * _BLOCK
+        n = min(_BLOCK, self.num_cars - start)
+        rng = np.random.default_rng([self.seed, 1, block])
+        platform = np.searchsorted(self.platform_cdf, rng.random(n), side='right')
+        platform = platform.clip(max=self.num_platforms - 1)
+        pick = rng.random(n)
+        cars = []
+        for j in range(n):
+            brands = self.platform_brands[platform[j]]
+            brand = brands[int(pick[j] * len(brands))]
+            cars.append(f"{brand} PLT{platform[j]:05d} #{start + j:07d}")
+
+        # Parts per car and per pool
+        k = rng.poisson(self.parts_per_car, size=n).clip(min=1)
+        segment_n = np.rint(k * MIX['segment']).astype(np.int64)
+        global_n = np.rint(k * MIX['global']).astype(np.int64)
+        custom_n = np.rint(k * MIX['custom']).astype(np.int64)
+        platform_n = np.maximum(1, k - segment_n - global_n - custom_n)
+
+        # Platform modules: one search over all platform CDFs, shifted by platform number
+        owner = np.repeat(np.arange(n), platform_n)
+        p = platform[owner]
+        idx = np.searchsorted(self._platform_cdfs, p + rng.random(len(owner)), side='right')
+        codes = [np.minimum(idx, self.platform_offset[p + 1] - 1)]  # p + u may round up to p + 1
+        owners = [owner]
+
+        segment_base = self.platform_offset[-1]
+        owner = np.repeat(np.arange(n), segment_n)
+        economy = ~self.platform_premium[platform[owner]]
+        idx = np.searchsorted(self.segment_cdf, rng.random(len(owner)))
+        idx = idx.clip(max=self.segment_pool - 1)
+        codes.append(segment_base + economy * self.segment_pool + idx)
+        owners.append(owner)
+
+        global_base = segment_base + 2 * self.segment_pool
+        owner = np.repeat(np.arange(n), global_n)
+        idx = np.searchsorted(self.global_cdf, rng.random(len(owner)))
+        idx = idx.clip(max=self.global_pool - 1)
+        codes.append(global_base + idx)
+        owners.append(owner)
+
+        # Unique (car, part) pairs, grouped by car
+        total = global_base + self.global_pool
+        pairs = np.unique(np.concatenate(owners) * total + np.concatenate(codes))
+        names = self._names
+        edges = []
+        bounds = np.searchsorted(pairs // total, np.arange(n + 1))
+        part_codes = (pairs % total).tolist()
+        for j in range(n):
+            car = cars[j]
+            edges.extend((car, names[c]) for c in part_codes[bounds[j]:bounds[j + 1]])
+            edges.extend((car, f"Custom {start + j:07d}-{c}") for c in range(custom_n[j]))
+        return edges
+
+    def iter_edge_chunks(self, chunk_size=100000):
+        """Streams (car, part) edges in lists of at most chunk_size, as loader.iter_edge_chunks."""
+        chunk = []
+        for block in range((self.num_cars + _BLOCK - 1) // _BLOCK):
+            edges = self._block(block)
+            chunk.extend(edges)
+            while len(chunk) >= chunk_size:
+                yield chunk[:chunk_size]
+                chunk = chunk[chunk_size:]
+        if chunk:
+            yield chunk
+
+    def edges(self):
+        """All (car, part) edges, generated lazily."""
+        for chunk in self.iter_edge_chunks():
+            yield from chunk
+
+    def write(self, path, fmt=None):
+        """
+        Streams the catalog to a CSV/TSV/JSON Lines file (gzip if path ends in .gz)
+        with 'car' and 'part' fields, readable by loader.load_edges. Returns the edge count.
+        """
+        fmt = fmt or loader.detect_format(path)
+        opener = gzip.open if str(path).lower().endswith('.gz') else open
+        count = 0
+        with opener(path, 'wt', encoding='utf-8', newline='') as f:
+            if fmt == 'jsonl':
+                for chunk in self.iter_edge_chunks():
+                    f.writelines(json.dumps({'car': c, 'part': p}) + '\n' for c, p in chunk)
+                    count += len(chunk)
+            elif fmt in ('csv', 'tsv'):
+                writer = csv.writer(f, delimiter='\t' if fmt == 'tsv' else ',')
+                writer.writerow(['car', 'part'])
+                for chunk in self.iter_edge_chunks():
+                    writer.writerows(chunk)
+                    count += len(chunk)
+            else:
+                raise ValueError(f"Unknown catalog format: {fmt}")
+        return count
+
+
+def generate_bipartite_graph(num_cars, compact=False, **kwargs):
+    """
+    Builds a synthetic bipartite graph in memory (kwargs go to SyntheticCatalog).
+    Same as graph_ops.build_bipartite_graph(source=SyntheticCatalog(...).edges()).
+    """
+    catalog = SyntheticCatalog(num_cars, **kwargs)
+    return loader.load_bipartite_graph(catalog.edges(), compact=compact)
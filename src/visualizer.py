@@ -1,19 +1,107 @@
 
-import networkx as nx
+import functools
+
 import matplotlib.pyplot as plt
+import networkx as nx
+
+from . import force_layout, layout_cache
+
+# Above this many nodes, Kamada-Kawai / spring layouts give way to force_layout
+LARGE_GRAPH_THRESHOLD = 1000
+
+# Level of detail. 'full' draws every label, edge and heatmap cell (the default
+# up to LOD_NODE_THRESHOLD nodes); 'publication' and 'preview' label only the
+# top nodes, thin edges by weight and downsample heatmaps into blocks.
+# labels: nodes labelled, edges: edges drawn, cells: heatmap side (None = all)
+DETAIL_LEVELS = {
+    'full': {'dpi': 300, 'labels': None, 'edges': None, 'cells': None},
+    'publication': {'dpi': 300, 'labels': 40, 'edges': 20000, 'cells': 1000},
+    'preview': {'dpi': 100, 'labels': 15, 'edges': 3000, 'cells': 250},
+}
+LOD_NODE_THRESHOLD = 200
+
+def _detail_settings(detail, n):
+    if detail is None:
+        detail = 'full' if n <= LOD_NODE_THRESHOLD else 'publication'
+    if detail not in DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail level: {detail}")
+    return DETAIL_LEVELS[detail]
+
+def _top_nodes(G, k, scores=None, weight=None):
+    """The k nodes with the highest score (degree by default), ties by name."""
+    if scores is None:
+        scores = dict(G.degree(weight=weight))
+    ranked = sorted(G.nodes(), key=lambda n: (-scores.get(n, 0), str(n)))
+    return ranked[:k]
+
+def _edge_collection(G, pos, max_edges=None, weighted=False, seed=42):
+    """
+    All edges of G as one LineCollection. Above max_edges only the heaviest
+    edges are kept (ties in random order, so unweighted graphs thin evenly).
+    """
+    import numpy as np
+    from matplotlib.collections import LineCollection
+
+    edges = list(G.edges(data='weight', default=1))
+    if not edges:
+        return None
+    weights = np.array([w for _, _, w in edges], dtype=float)
+    keep = np.random.default_rng(seed).permutation(len(edges))
+    if max_edges is not None and len(edges) > max_edges:
+        keep = keep[np.argsort(-weights[keep], kind='stable')[:max_edges]]
 
-def plot_graph(G, title="Graph", filename="graph.png", weighted=False, groups=None):
+    index = {n: i for i, n in enumerate(G.nodes())}
+    coords = np.array([pos[n] for n in G.nodes()], dtype=float)
+    u = np.array([index[edges[i][0]] for i in keep])
+    v = np.array([index[edges[i][1]] for i in keep])
+    segments = np.stack((coords[u], coords[v]), axis=1)
+    widths = 0.2 + 1.5 * weights[keep] / weights.max() if weighted else 0.3
+    return LineCollection(segments, linewidths=widths, colors='black', alpha=0.15, zorder=1)
+
+def _kamada_kawai(G, pos=None):
+    """Kamada-Kawai (often nice for clusters), spring layout if it fails; pos seeds either."""
+    try:
+        return nx.kamada_kawai_layout(G, pos=pos)
+    except Exception:
+        return nx.spring_layout(G, k=1.5, iterations=50, seed=42, pos=pos)
+
+def _multilevel(G, pos=None, seed=42):
+    return force_layout.multilevel_layout(G, seed=seed, pos=pos)
+
+def get_layout(G, layout_store=None, seed=42):
+    """
+    Node positions for G, reused from the layout cache when possible.
+    Graphs above LARGE_GRAPH_THRESHOLD nodes use the multilevel force layout.
+    - layout_store: a layout_cache.LayoutStore (defaults to the shared
+      on-disk store); False computes the layout without caching.
+    - seed: seed of the multilevel layout.
+    """
+    if G.number_of_nodes() > LARGE_GRAPH_THRESHOLD:
+        compute = functools.partial(_multilevel, seed=seed)
+        name, params = 'multilevel', {'seed': seed}
+    else:
+        name, compute, params = 'kamada_kawai', _kamada_kawai, {}
+    if layout_store is False:
+        return compute(G, None)
+    store = layout_store or layout_cache.default_store
+    return store.layout(G, name, compute, **params)
+
+def plot_graph(G, title="Graph", filename="graph.png", weighted=False, groups=None,
+               layout_store=None, detail=None, label_scores=None):
     """
     Plots the graph G.
     - groups: dict mapping node -> community_id for coloring.
+    - layout_store: see get_layout.
+    - detail: 'full', 'publication' or 'preview' (see DETAIL_LEVELS); by
+      default 'full' for small graphs and 'publication' for large ones.
+    - label_scores: dict node -> score (e.g. a centrality) choosing which
+      nodes get labels when not all do; degree by default.
     """
+    settings = _detail_settings(detail, G.number_of_nodes())
     plt.figure(figsize=(16, 12))
     
-    # Advanced Layout (Kamada-Kawai often nice for clusters)
-    try:
-        pos = nx.kamada_kawai_layout(G)
-    except:
-        pos = nx.spring_layout(G, k=1.5, iterations=50, seed=42)
+    # Advanced Layout (Kamada-Kawai often nice for clusters), cached across figures and runs
+    pos = get_layout(G, layout_store)
     
     # 1. Node Colors
     if groups:
@@ -31,35 +119,47 @@ def plot_graph(G, title="Graph", filename="graph.png", weighted=False, groups=No
         node_colors = 'skyblue'
         cmap = None
 
-    # 2. Draw Nodes
-    nx.draw_networkx_nodes(G, pos, node_size=600, node_color=node_colors, cmap=cmap, alpha=0.9, edgecolors='black')
-    
-    # 3. Draw Labels
-    nx.draw_networkx_labels(G, pos, font_size=8, font_weight='bold')
-    
-    # 4. Draw Edges
-    width = 1.0
-    if weighted:
-        # Scale width by weight
-        weights = [G[u][v].get('weight', 1) for u, v in G.edges()]
-        if weights:
-            max_w = max(weights)
-            width = [(w / max_w) * 4 + 0.5 for w in weights]
-        else:
-            width = 1.0
+    if settings['labels'] is not None:
+        # Level of detail: small nodes, top-k labels, edges as one thinned collection
+        node_size = max(4, 600 * LOD_NODE_THRESHOLD / max(G.number_of_nodes(), 1))
+        nx.draw_networkx_nodes(G, pos, node_size=node_size, node_color=node_colors, cmap=cmap,
+                               alpha=0.9, linewidths=0)
+        top = _top_nodes(G, settings['labels'], label_scores, 'weight' if weighted else None)
+        nx.draw_networkx_labels(G, pos, labels={n: n for n in top}, font_size=8, font_weight='bold')
+        edges = _edge_collection(G, pos, settings['edges'], weighted)
+        if edges is not None:
+            plt.gca().add_collection(edges)
+    else:
+        # 2. Draw Nodes
+        nx.draw_networkx_nodes(G, pos, node_size=600, node_color=node_colors, cmap=cmap, alpha=0.9,
+                               edgecolors='black')
+
+        # 3. Draw Labels
+        nx.draw_networkx_labels(G, pos, font_size=8, font_weight='bold')
+
+        # 4. Draw Edges
+        width = 1.0
+        if weighted:
+            # Scale width by weight
+            weights = [G[u][v].get('weight', 1) for u, v in G.edges()]
+            if weights:
+                max_w = max(weights)
+                width = [(w / max_w) * 4 + 0.5 for w in weights]
+            else:
+                width = 1.0
         
-    nx.draw_networkx_edges(G, pos, width=width, alpha=0.3)
+        nx.draw_networkx_edges(G, pos, width=width, alpha=0.3)
     
-    if weighted:
-        # Only show weights > 1 to avoid clutter, or top edges
-        labels = nx.get_edge_attributes(G, 'weight')
-        # Filter for high weights only?
-        # nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=6)
+        if weighted:
+            # Only show weights > 1 to avoid clutter, or top edges
+            labels = nx.get_edge_attributes(G, 'weight')
+            # Filter for high weights only?
+            # nx.draw_networkx_edge_labels(G, pos, edge_labels=labels, font_size=6)
 
     plt.title(title, fontsize=18)
     plt.axis('off')
     plt.tight_layout()
-    plt.savefig(filename, dpi=300)
+    plt.savefig(filename, dpi=settings['dpi'])
     print(f"Graph saved to {filename}")
     plt.close()
 
@@ -90,7 +190,9 @@ def plot_resilience_curve(stats, filename="resilience_curve.png"):
     y = [s[2] for s in stats]  # GC Size
     
     plt.figure(figsize=(10, 6))
-    plt.plot(x, y, marker='o', linestyle='-', color='crimson', linewidth=2)
+    # Markers only help on short curves; thousands of them dominate rendering time
+    marker = 'o' if len(x) <= 100 else None
+    plt.plot(x, y, marker=marker, linestyle='-', color='crimson', linewidth=2)
     plt.fill_between(x, y, color='crimson', alpha=0.1)
     
     plt.xlabel("Number of Critical Suppliers Failed")
@@ -103,12 +205,16 @@ def plot_resilience_curve(stats, filename="resilience_curve.png"):
     print(f"Resilience curve saved to {filename}")
     plt.close()
 
-def plot_k_core(G, core_numbers, filename="k_core.png"):
+def plot_k_core(G, core_numbers, filename="k_core.png", layout_store=None):
     """
     Plots the graph with nodes colored by their K-Core shell.
+    - layout_store: see get_layout (only used above LARGE_GRAPH_THRESHOLD nodes).
     """
     plt.figure(figsize=(16, 12))
-    pos = nx.spring_layout(G, k=2, seed=88)
+    if G.number_of_nodes() > LARGE_GRAPH_THRESHOLD:
+        pos = get_layout(G, layout_store, seed=88)
+    else:
+        pos = nx.spring_layout(G, k=2, seed=88)
     
     # Color based on Core Number
     cores = [core_numbers[n] for n in G.nodes()]
@@ -128,26 +234,34 @@ def plot_k_core(G, core_numbers, filename="k_core.png"):
 
 # ==================== NEW VISUALIZATIONS ====================
 
-def plot_jaccard_heatmap(P, filename="fig7_jaccard_heatmap.png"):
+def plot_jaccard_heatmap(P, filename="fig7_jaccard_heatmap.png", matrix=None, nodes=None,
+                         detail=None, groups=None):
     """
     Plots a heatmap of Jaccard similarity between vehicles.
     P: Projected graph with 'jaccard' edge attribute.
+    matrix, nodes: optional precomputed similarity matrix (dense or sparse) and
+    its row order, e.g. from similarity.compute_similarity; P is then ignored.
+    detail: 'full', 'publication' or 'preview' (see DETAIL_LEVELS). Below
+    'full' the matrix stays sparse, is ordered by community and averaged
+    into at most DETAIL_LEVELS[detail]['cells'] blocks per side.
+    groups: dict mapping node -> community_id used for that order.
     """
     import numpy as np
     
-    nodes = sorted(list(P.nodes()))
-    n = len(nodes)
-    matrix = np.zeros((n, n))
-    
-    # Fill matrix with Jaccard values
-    for i, u in enumerate(nodes):
-        for j, v in enumerate(nodes):
-            if i == j:
-                matrix[i][j] = 1.0  # Self-similarity
-            elif P.has_edge(u, v):
-                matrix[i][j] = P[u][v].get('jaccard', 0)
-            else:
-                matrix[i][j] = 0
+    n = P.number_of_nodes() if matrix is None else len(nodes)
+    settings = _detail_settings(detail, n)
+    if settings['cells'] is not None:
+        return _plot_block_heatmap(P, filename, matrix, nodes, groups, settings)
+
+    if matrix is None:
+        nodes = sorted(list(P.nodes()))
+        matrix = nx.to_numpy_array(P, nodelist=nodes, weight='jaccard', nonedge=0.0)
+    else:
+        matrix = matrix.toarray() if hasattr(matrix, 'toarray') else np.array(matrix, dtype=float)
+        order = sorted(range(len(nodes)), key=lambda i: nodes[i])
+        matrix = matrix[np.ix_(order, order)]
+        nodes = [nodes[i] for i in order]
+    np.fill_diagonal(matrix, 1.0)  # Self-similarity
     
     plt.figure(figsize=(14, 12))
     
@@ -172,6 +286,74 @@ def plot_jaccard_heatmap(P, filename="fig7_jaccard_heatmap.png"):
     plt.close()
 
 
+def block_heatmap(P=None, matrix=None, nodes=None, groups=None, cells=1000):
+    """
+    Block-averaged similarity image for large heatmaps.
+    Rows/columns are ordered by community (groups), then name, and split into
+    at most cells consecutive blocks; each pixel is the mean similarity of its
+    block (diagonal counted as 1). The n x n matrix is never made dense.
+    Returns (image, ordered nodes, block index of every ordered node).
+    """
+    import numpy as np
+    from scipy import sparse
+
+    if matrix is None:
+        nodes = list(P.nodes())
+        M = nx.to_scipy_sparse_array(P, nodelist=nodes, weight='jaccard', format='csr')
+    else:
+        M = sparse.csr_matrix(matrix)
+    n = len(nodes)
+    groups = groups or {}
+    order = np.array(sorted(range(n), key=lambda i: (groups.get(nodes[i], -1), str(nodes[i]))),
+                     dtype=np.int64)
+    M = sparse.csr_matrix(M[order][:, order])
+    M.setdiag(1.0)  # Self-similarity
+
+    cells = max(1, min(cells, n))
+    block = np.arange(n) * cells // n
+    R = sparse.csr_matrix((np.ones(n), (block, np.arange(n))), shape=(cells, n))
+    counts = np.bincount(block, minlength=cells).astype(float)
+    image = (R @ M @ R.T).toarray() / np.outer(counts, counts)
+    return image, [nodes[i] for i in order], block
+
+def _plot_block_heatmap(P, filename, matrix, nodes, groups, settings):
+    image, ordered, block = block_heatmap(P, matrix, nodes, groups, settings['cells'])
+
+    plt.figure(figsize=(14, 12))
+    # Block means of a sparse matrix are small; scale colours to the densest block
+    im = plt.imshow(image, cmap='YlOrRd', aspect='auto', vmin=0,
+                    vmax=max(float(image.max()), 1e-9), interpolation='nearest')
+    cbar = plt.colorbar(im, shrink=0.8)
+    cbar.set_label('Índice de Jaccard (média por bloco)', fontsize=12)
+
+    # Community boundaries instead of one tick per vehicle
+    ticks, names = [], []
+    if groups:
+        comms = [groups.get(v, -1) for v in ordered]
+        starts = [i for i in range(len(ordered)) if i == 0 or comms[i] != comms[i - 1]]
+        for k, i in enumerate(starts):
+            end = starts[k + 1] if k + 1 < len(starts) else len(ordered)
+            if i > 0:
+                plt.axhline(block[i] - 0.5, color='black', linewidth=0.3)
+                plt.axvline(block[i] - 0.5, color='black', linewidth=0.3)
+            ticks.append((block[i] + block[end - 1]) / 2)
+            names.append(f"C{comms[i]}")
+        if len(names) > 40:
+            ticks, names = [], []
+    plt.xticks(ticks, names, rotation=90, fontsize=7)
+    plt.yticks(ticks, names, fontsize=7)
+
+    side = image.shape[0]
+    plt.title(f"Similaridade de Jaccard entre Veículos "
+              f"({len(ordered)} veículos, {side}x{side} blocos)", fontsize=16)
+    plt.xlabel("Veículos (ordenados por comunidade)", fontsize=12)
+    plt.ylabel("Veículos (ordenados por comunidade)", fontsize=12)
+
+    plt.tight_layout()
+    plt.savefig(filename, dpi=settings['dpi'])
+    print(f"Jaccard heatmap saved to {filename}")
+    plt.close()
+
 def plot_degree_distribution(G, filename="fig8_degree_distribution.png", log_scale=True):
     """
     Plots the degree distribution histogram.
@@ -302,18 +484,17 @@ def plot_local_clustering(G, local_clustering, filename="fig10_local_clustering.
     plt.close()
 
 
-def plot_bridges_and_cuts(G, bridges, articulation_points, filename="fig11_bridges_cuts.png"):
+def plot_bridges_and_cuts(G, bridges, articulation_points, filename="fig11_bridges_cuts.png",
+                          layout_store=None):
     """
     Plots the graph highlighting bridges (critical edges) and articulation points.
     bridges: list of edge tuples
     articulation_points: list of node names
+    layout_store: see get_layout.
     """
     plt.figure(figsize=(16, 12))
     
-    try:
-        pos = nx.kamada_kawai_layout(G)
-    except:
-        pos = nx.spring_layout(G, k=1.5, iterations=50, seed=42)
+    pos = get_layout(G, layout_store)
     
     # 1. Draw all edges first (light)
     regular_edges = [e for e in G.edges() if e not in bridges and (e[1], e[0]) not in bridges]
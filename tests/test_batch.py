@@ -0,0 +1,30 @@
+import os
+import sys
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import batch, graph_ops
+
+
+class TestBatchScenarios(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        parts = [p for p, *_ in graph_ops.get_part_criticality(self.B)]
+        self.scenarios = [parts[:k] for k in range(0, 8)] + [["Sistema ABS Bosch", "Unknown Part"]]
+        self.expected = [graph_ops.simulate_supplier_collapse(self.B, s)[:2]
+                         for s in self.scenarios]
+
+    def test_serial_matches_simulation(self):
+        results = batch.run_supplier_scenarios(self.B, self.scenarios, processes=1)
+        self.assertEqual(results, self.expected)
+
+    def test_pool_and_streaming(self):
+        results = batch.run_supplier_scenarios(self.B, self.scenarios, processes=2)
+        self.assertEqual(results, self.expected)
+        streamed = dict(batch.iter_supplier_scenarios(self.B, self.scenarios, processes=2))
+        self.assertEqual([streamed[i] for i in range(len(self.scenarios))], self.expected)
+
+if __name__ == '__main__':
+    unittest.main()
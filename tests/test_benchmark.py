@@ -0,0 +1,61 @@
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_and_write(self):
+        names = ['build_projected_graph[loop]', 'predict_demand',
+                 'simulate_cumulative_failure[percolation]']
+        results = benchmark.run_benchmarks(sizes=[40], names=names, repeat=1, verbose=False)
+        self.assertEqual([r['benchmark'] for r in results], names)
+        for r in results:
+            self.assertEqual(r['cars'], 40)
+            self.assertGreater(r['seconds'], 0)
+            self.assertGreaterEqual(r['peak_mb'], 0)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path, csv_path = os.path.join(tmp, "b.json"), os.path.join(tmp, "b.csv")
+            benchmark.write_json(results, json_path, sizes=[40])
+            benchmark.write_csv(results, csv_path)
+            self.assertEqual(benchmark.load_results(json_path), results)
+            with open(json_path) as f:
+                self.assertEqual(json.load(f)['metadata']['sizes'], [40])
+            with open(csv_path) as f:
+                self.assertEqual(len(list(csv.DictReader(f))), len(names))
+
+    def test_size_limits_and_unknown_names(self):
+        results = benchmark.run_benchmarks(sizes=[benchmark.LOOP_LIMIT + 1],
+                                           names=['build_projected_graph[loop]'],
+                                           repeat=1, memory=False, verbose=False)
+        self.assertEqual(results, [])
+        with self.assertRaises(ValueError):
+            benchmark.run_benchmarks(sizes=[10], names=['no_such_benchmark'])
+
+    def test_compare_flags_regressions(self):
+        def record(name, seconds, peak):
+            return {'benchmark': name, 'cars': 100, 'seconds': seconds, 'peak_mb': peak}
+
+        baseline = [record('a', 1.0, 10.0), record('b', 1.0, 10.0),
+                    record('c', 0.001, 10.0), record('d', 1.0, 10.0)]
+        results = [record('a', 1.1, 10.5), record('b', 1.5, 20.0),
+                   record('c', 0.002, 10.0), record('e', 9.0, 99.0)]
+        regressions = benchmark.compare(results, baseline, threshold=0.25)
+        self.assertEqual(sorted((r[0], r[2]) for r in regressions),
+                         [('b', 'peak_mb'), ('b', 'seconds')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+import networkx as nx
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import cache, graph_ops
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        cache.invalidate()
+        self.B = graph_ops.build_bipartite_graph()
+
+    def test_fingerprint(self):
+        G1 = nx.Graph([(1, 2), (2, 3)])
+        G2 = nx.Graph([(3, 2), (2, 1)])
+        self.assertEqual(cache.graph_fingerprint(G1), cache.graph_fingerprint(G2))
+        G2[1][2]['weight'] = 5
+        self.assertNotEqual(cache.graph_fingerprint(G1), cache.graph_fingerprint(G2))
+
+    def test_criticality_is_memoized(self):
+        first = graph_ops.get_part_criticality(self.B)
+        again = graph_ops.get_part_criticality(graph_ops.build_bipartite_graph())
+        self.assertIs(first, again)
+        self.assertIsNot(graph_ops.get_part_criticality(self.B, k=10, seed=1), first)
+
+        cache.invalidate(self.B)
+        self.assertIsNot(graph_ops.get_part_criticality(self.B), first)
+
+        damaged = self.B.copy()
+        damaged.remove_node("Sistema ABS Bosch")
+        self.assertNotEqual(graph_ops.get_part_criticality(damaged)[0][0], "Sistema ABS Bosch")
+
+    def test_unfingerprintable_graphs_run_uncached(self):
+        @cache.cached_analysis
+        def node_count(G):
+            return len(G)
+
+        C = graph_ops.build_bipartite_graph(compact=True)
+        self.assertIsNone(cache.analysis_key(node_count, C))
+        self.assertEqual(node_count(C), self.B.number_of_nodes())
+        self.assertEqual(len(cache.default_cache), 0)
+
+    def test_lru_eviction(self):
+        lru = cache.AnalysisCache(maxsize=2)
+        lru.put('a', 1)
+        lru.put('b', 2)
+        lru.get('a')
+        lru.put('c', 3)
+        self.assertIn('a', lru)
+        self.assertNotIn('b', lru)
+        self.assertEqual(len(lru), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+import networkx as nx
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import centrality, graph_ops
+
+
+class TestBetweenness(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        self.exact = centrality.betweenness_centrality(self.B)
+
+    def test_sampled_is_seeded_and_close(self):
+        a = centrality.betweenness_centrality(self.B, k=40, seed=3)
+        b = centrality.betweenness_centrality(self.B, k=40, seed=3)
+        self.assertEqual(a, b)
+        self.assertLess(max(abs(a[v] - self.exact[v]) for v in self.exact), 0.2)
+
+    def test_epsilon_sample_size(self):
+        self.assertEqual(centrality.sample_size_for_error(10 ** 6, 0.5), 34)
+        self.assertEqual(centrality.sample_size_for_error(50, 0.01), 50)
+        with self.assertRaises(ValueError):
+            centrality.sample_size_for_error(50, 0)
+
+    def test_parts_only_criticality(self):
+        crit = graph_ops.get_part_criticality(self.B, k=20, seed=1, parts_only=True)
+        self.assertEqual(len(crit[0]), 5)
+        self.assertEqual(crit[0][0], "Sistema ABS Bosch")
+        self.assertTrue(all(0.0 <= bc <= 1.0 for _, _, _, bc, _ in crit))
+
+class TestPowerIteration(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+
+    def test_eigenvector_matches_networkx(self):
+        scores = centrality.eigenvector_centrality(self.B)
+        expected = nx.eigenvector_centrality(self.B, max_iter=1000)
+        self.assertLess(max(abs(scores[v] - expected[v]) for v in expected), 1e-4)
+
+    def test_warm_start_after_removal(self):
+        scores = centrality.eigenvector_centrality(self.B)
+        damaged = self.B.copy()
+        damaged.remove_node("Turbocompressor KKK")
+        warm, warm_iters = centrality.eigenvector_centrality(damaged, x0=scores, full_output=True)
+        cold, cold_iters = centrality.eigenvector_centrality(damaged, full_output=True)
+        self.assertLessEqual(warm_iters, cold_iters)
+        self.assertLess(max(abs(warm[v] - cold[v]) for v in cold), 1e-4)
+
+    def test_pagerank_matches_networkx(self):
+        scores = centrality.pagerank(self.B)
+        expected = nx.pagerank(self.B)
+        self.assertLess(max(abs(scores[v] - expected[v]) for v in expected), 1e-4)
+        self.assertAlmostEqual(sum(scores.values()), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+
+import networkx as nx
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import communities, graph_ops
+
+
+class TestLouvain(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        self.P = graph_ops.build_projected_graph(self.B)
+
+    def modularity(self, G, comms):
+        return nx.community.modularity(G, comms, weight='weight')
+
+    def test_seeded_partition(self):
+        comm_map, comms = graph_ops.detect_communities(self.P, method='louvain', seed=1)
+        again = communities.louvain(self.P, seed=1)
+        self.assertEqual(comms, again[1])
+        self.assertEqual(set(comm_map), set(self.P.nodes()))
+        self.assertGreaterEqual(self.modularity(self.P, comms) + 1e-9,
+                                self.modularity(self.P, graph_ops.detect_communities(self.P)[1]))
+
+    def test_karate_quality(self):
+        K = nx.karate_club_graph()
+        _, comms = communities.louvain(K, seed=0)
+        self.assertGreater(nx.community.modularity(K, comms), 0.40)
+
+    def test_warm_start_refinement(self):
+        comm_map, comms = communities.louvain(self.P, seed=1)
+        # Unchanged graph: refinement keeps the partition
+        self.assertEqual(communities.refine_communities(self.P, comm_map, [], seed=1)[1], comms)
+
+        damaged = self.B.copy()
+        damaged.remove_node("Sistema ABS Bosch")
+        P2 = graph_ops.build_projected_graph(damaged)
+        changed = list(self.B.neighbors("Sistema ABS Bosch"))
+        _, refined = graph_ops.detect_communities(P2, method='louvain', seed=1, init=comm_map,
+                                                  changed=changed)
+        self.assertEqual(set().union(*refined), set(P2.nodes()))
+        self.assertGreaterEqual(self.modularity(P2, refined), self.modularity(P2, comms))
+
+        # A new car tied to one family joins it
+        P3 = self.P.copy()
+        family = sorted(comms[0])
+        P3.add_edges_from((("New Car", car, {'weight': 1}) for car in family))
+        new_map, _ = communities.refine_communities(P3, comm_map, ["New Car"], seed=1)
+        self.assertEqual(new_map["New Car"], new_map[family[0]])
+
+if __name__ == '__main__':
+    unittest.main()
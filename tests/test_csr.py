@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import csr, graph_ops
+
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        self.P = graph_ops.build_projected_graph(self.B)
+        self.C = csr.from_networkx(self.B)
+
+    def test_compact_memory(self):
+        self.assertLess(self.C.nbytes / self.B.number_of_edges(), 32)
+
+    def test_roundtrip(self):
+        back = csr.to_networkx(self.C)
+        self.assertEqual(set(map(frozenset, back.edges())), set(map(frozenset, self.B.edges())))
+        self.assertEqual(dict(back.nodes(data='type')), dict(self.B.nodes(data='type')))
+
+    def test_projection_and_degrees(self):
+        P = graph_ops.build_projected_graph(self.C)
+        self.assertIsInstance(P, csr.CSRGraph)
+        weights = {frozenset((u, v)): w for u, v, w in csr.to_networkx(P).edges(data='weight')}
+        self.assertEqual(weights, {frozenset((u, v)): w for u, v, w in self.P.edges(data='weight')})
+        self.assertEqual(graph_ops.get_degrees(P)[0][1], graph_ops.get_degrees(self.P)[0][1])
+        self.assertEqual(dict(graph_ops.get_degrees(self.C)), dict(graph_ops.get_degrees(self.B)))
+
+    def test_failure_simulations(self):
+        affected, severity = graph_ops.simulate_part_failure(self.C, "Sistema ABS Bosch")
+        expected, expected_severity = graph_ops.simulate_part_failure(self.B, "Sistema ABS Bosch")
+        self.assertEqual(set(affected), set(expected))
+        self.assertEqual(severity, expected_severity)
+        parts = ["Sistema ABS Bosch", "Plataforma MQB", "Motor HR16DE"]
+        self.assertEqual(graph_ops.simulate_supplier_collapse(self.C, parts)[:2],
+                         graph_ops.simulate_supplier_collapse(self.B, parts)[:2])
+        self.assertEqual(graph_ops.simulate_cumulative_failure(self.C, parts),
+                         graph_ops.simulate_cumulative_failure(self.B, parts))
+
+    def test_jaccard(self):
+        P = graph_ops.calculate_jaccard_weights(self.C, graph_ops.build_projected_graph(self.C))
+        expected = graph_ops.calculate_jaccard_weights(self.B, self.P)
+        for u, v, j in csr.to_networkx(P).edges(data='jaccard'):
+            self.assertAlmostEqual(j, expected[u][v]['jaccard'])
+
+if __name__ == '__main__':
+    unittest.main()
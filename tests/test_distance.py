@@ -0,0 +1,68 @@
+import os
+import sys
+import unittest
+
+import networkx as nx
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import distance, graph_ops
+
+
+class TestDistanceMetrics(unittest.TestCase):
+    def setUp(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        self.graphs = [G.subgraph(max(nx.connected_components(G), key=len)).copy() for G in (B, P)]
+        self.graphs.append(nx.path_graph(9))
+
+    def test_single_pass_matches_networkx(self):
+        for G in self.graphs:
+            metrics = distance.all_source_metrics(G)
+            self.assertEqual(metrics['eccentricity'], nx.eccentricity(G))
+            self.assertEqual(metrics['diameter'], nx.diameter(G))
+            self.assertEqual(sorted(metrics['center'], key=str), sorted(nx.center(G), key=str))
+            self.assertAlmostEqual(metrics['avg_path_length'], nx.average_shortest_path_length(G))
+
+    def test_parallel_matches_serial(self):
+        G = self.graphs[0]
+        self.assertEqual(distance.all_source_metrics(G, processes=2),
+                         distance.all_source_metrics(G))
+
+    def test_bounds_are_exact(self):
+        for G in self.graphs:
+            ecc, runs = distance.bounding_eccentricities(G)
+            self.assertEqual(ecc, nx.eccentricity(G))
+            self.assertLessEqual(runs, G.number_of_nodes())
+            self.assertEqual(distance.ifub_diameter(G)[0], nx.diameter(G))
+
+    def test_sampled_apl(self):
+        G = self.graphs[0]
+        exact = nx.average_shortest_path_length(G)
+        apl, (low, high), k = distance.sampled_average_path_length(G, samples=30, seed=1)
+        self.assertEqual(k, 30)
+        self.assertLessEqual(low, apl)
+        self.assertLessEqual(apl, high)
+        self.assertLess(abs(apl - exact), 0.5)
+        full, (low, high), _ = distance.sampled_average_path_length(G, samples=10 ** 6)
+        self.assertAlmostEqual(full, exact)
+        self.assertEqual(low, high)
+
+    def test_single_node(self):
+        G = nx.Graph()
+        G.add_node('x')
+        info = graph_ops.get_graph_info(G)
+        self.assertIn("Diameter: 0\nCenter: ['x']\nAvg Path Length: 0.0000\n", info)
+        sampled = graph_ops.get_graph_info(G, apl_samples=10, seed=0)
+        self.assertIn("Diameter: 0\nCenter: ['x']\nAvg Path Length: 0.0000 (", sampled)
+        self.assertEqual(distance.ifub_diameter(G)[0], 0)
+
+    def test_disconnected_raises(self):
+        G = nx.Graph([(1, 2), (3, 4)])
+        with self.assertRaises(nx.NetworkXError):
+            distance.all_source_metrics(G)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import networkx as nx
+import numpy as np
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import force_layout, layout_cache, visualizer
+
+
+def edge_ratio(G, pos):
+    """Mean edge length over mean distance between random node pairs."""
+    nodes = list(G.nodes())
+    P = np.array([pos[v] for v in nodes])
+    index = {v: i for i, v in enumerate(nodes)}
+    e = np.array([(index[u], index[v]) for u, v in G.edges()])
+    edges = np.linalg.norm(P[e[:, 0]] - P[e[:, 1]], axis=1).mean()
+    r = np.random.default_rng(0).integers(0, len(nodes), (5000, 2))
+    return edges / np.linalg.norm(P[r[:, 0]] - P[r[:, 1]], axis=1).mean()
+
+
+class TestForceLayout(unittest.TestCase):
+    def test_grid_graph_is_untangled(self):
+        # Above EXACT_LIMIT, so coarsening and grid repulsion are exercised
+        G = nx.grid_2d_graph(40, 40)
+        pos = force_layout.multilevel_layout(G, seed=1)
+        self.assertEqual(set(pos), set(G.nodes()))
+        coords = np.array(list(pos.values()))
+        self.assertLessEqual(np.abs(coords).max(), 1.0 + 1e-9)
+        self.assertLess(edge_ratio(G, pos), 0.1)
+
+    def test_seed_is_reproducible(self):
+        G = nx.barabasi_albert_graph(600, 2, seed=3)
+        a = force_layout.multilevel_layout(G, seed=7)
+        b = force_layout.multilevel_layout(G, seed=7)
+        self.assertTrue(all(np.array_equal(a[v], b[v]) for v in G))
+
+    def test_coarsen_collapses_stars(self):
+        G = nx.star_graph(50)
+        _, A = force_layout._adjacency(G)
+        labels, size = force_layout.coarsen(A, np.random.default_rng(0))
+        self.assertEqual(size, 1)
+        self.assertEqual(len(labels), 51)
+
+    def test_warm_start_and_edge_cases(self):
+        G = nx.grid_2d_graph(30, 30)
+        pos = force_layout.multilevel_layout(G, seed=1)
+        G.add_edge((0, 0), 'new')
+        seed = layout_cache.seed_positions(G, pos)
+        warm = force_layout.multilevel_layout(G, pos=seed, iterations=10)
+        self.assertLess(edge_ratio(G, warm), 0.1)
+        self.assertEqual(force_layout.multilevel_layout(nx.Graph()), {})
+        self.assertEqual(len(force_layout.multilevel_layout(nx.empty_graph(3), seed=0)), 3)
+
+    def test_visualizer_switches_above_threshold(self):
+        G = nx.grid_2d_graph(40, 30)
+        self.assertGreater(G.number_of_nodes(), visualizer.LARGE_GRAPH_THRESHOLD)
+        with tempfile.TemporaryDirectory() as tmp:
+            store = layout_cache.LayoutStore(tmp)
+            pos = visualizer.get_layout(G, store, seed=5)
+            expected = force_layout.multilevel_layout(G, seed=5)
+            self.assertTrue(all(np.allclose(pos[v], expected[v]) for v in G))
+
+
+if __name__ == '__main__':
+    unittest.main()
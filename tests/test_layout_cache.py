@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import networkx as nx
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops, layout_cache, visualizer
+
+
+class TestLayoutStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = os.path.join(self.tmp.name, "layouts")
+        self.seeds = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def compute(self, G, pos):
+        self.seeds.append(pos)
+        return nx.spring_layout(G, seed=1, pos=pos)
+
+    def test_reused_across_calls_and_runs(self):
+        G = nx.karate_club_graph()
+        store = layout_cache.LayoutStore(self.dir)
+        first = store.layout(G, 'spring', self.compute, k=1)
+        self.assertEqual(store.layout(G, 'spring', self.compute, k=1), first)
+        self.assertEqual(len(self.seeds), 1)
+
+        # A new store (next run) reads the file; other parameters are separate entries
+        other = layout_cache.LayoutStore(self.dir)
+        self.assertEqual(other.layout(G, 'spring', self.compute, k=1), first)
+        other.layout(G, 'spring', self.compute, k=2)
+        self.assertEqual(len(self.seeds), 2)
+        self.assertIsNone(self.seeds[-1])
+
+    def test_file_removed_by_another_process(self):
+        G = nx.karate_club_graph()
+        store = layout_cache.LayoutStore(self.dir)
+        store.layout(G, 'spring', self.compute, k=1)
+        # Another worker prunes the file between listdir and getmtime
+        with mock.patch.object(layout_cache.os.path, 'getmtime', side_effect=FileNotFoundError):
+            G.add_edge(0, 100)
+            store.layout(G, 'spring', self.compute, k=1)
+        self.assertEqual(len(self.seeds), 2)
+
+    def test_warm_start_from_similar_graph(self):
+        G = nx.karate_club_graph()
+        store = layout_cache.LayoutStore(self.dir)
+        old = store.layout(G, 'spring', self.compute)
+        H = G.copy()
+        H.add_edge(0, 'new')
+        store.layout(H, 'spring', self.compute)
+        seed = self.seeds[-1]
+        self.assertEqual(store.warm_starts, 1)
+        self.assertEqual(seed[5], old[5])
+        self.assertEqual(seed['new'], old[0])  # mean of its only neighbour
+
+        # Too little overlap starts from scratch
+        store.layout(nx.path_graph(range(100, 200)), 'spring', self.compute)
+        self.assertIsNone(self.seeds[-1])
+
+    def test_visualizer_uses_store(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        store = layout_cache.LayoutStore(self.dir)
+        pos = visualizer.get_layout(P, store)
+        self.assertEqual(set(pos), set(P.nodes()))
+        self.assertEqual(visualizer.get_layout(P, store), pos)
+        self.assertEqual((store.misses, store.hits), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
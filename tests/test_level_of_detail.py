@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import matplotlib
+
+matplotlib.use('Agg')
+import networkx as nx
+import numpy as np
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import layout_cache, visualizer
+
+
+class TestLevelOfDetail(unittest.TestCase):
+    def setUp(self):
+        self.G = nx.random_partition_graph([150, 150], 0.1, 0.005, seed=1)
+        for u, v in self.G.edges():
+            self.G[u][v]['weight'] = 1 + (u + v) % 4
+            self.G[u][v]['jaccard'] = ((u * v) % 7) / 7
+        self.groups = {v: (0 if v < 150 else 1) for v in self.G}
+
+    def test_settings(self):
+        self.assertIs(visualizer._detail_settings(None, 10), visualizer.DETAIL_LEVELS['full'])
+        self.assertIs(visualizer._detail_settings(None, 10 ** 5),
+                      visualizer.DETAIL_LEVELS['publication'])
+        with self.assertRaises(ValueError):
+            visualizer._detail_settings('poster', 10)
+
+    def test_top_labels_and_edge_thinning(self):
+        top = visualizer._top_nodes(self.G, 5)
+        degrees = sorted((d for _, d in self.G.degree()), reverse=True)
+        self.assertEqual([self.G.degree(v) for v in top], degrees[:5])
+        self.assertEqual(visualizer._top_nodes(self.G, 1, scores={7: 1.0}), [7])
+
+        pos = nx.circular_layout(self.G)
+        edges = visualizer._edge_collection(self.G, pos, max_edges=100, weighted=True)
+        self.assertEqual(len(edges.get_segments()), 100)
+        # Heaviest edges only
+        widths = np.asarray(edges.get_linewidths())
+        self.assertTrue(np.all(widths >= 0.2 + 1.5 * 4 / 4 - 1e-9))
+        segments = visualizer._edge_collection(self.G, pos).get_segments()
+        self.assertEqual(len(segments), self.G.number_of_edges())
+
+    def test_block_heatmap_matches_dense_means(self):
+        image, ordered, block = visualizer.block_heatmap(self.G, groups=self.groups, cells=30)
+        self.assertEqual(image.shape, (30, 30))
+        self.assertEqual(sorted(ordered), sorted(self.G))
+        dense = nx.to_numpy_array(self.G, nodelist=ordered, weight='jaccard')
+        np.fill_diagonal(dense, 1.0)
+        rows = block == 3
+        cols = block == 17
+        self.assertAlmostEqual(image[3, 17], dense[np.ix_(rows, cols)].mean())
+        # Community order: each community is a run of consecutive rows
+        self.assertEqual(sorted(self.groups[v] for v in ordered), [self.groups[v] for v in ordered])
+
+    def test_preview_plots(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = layout_cache.LayoutStore(tmp)
+            graph_png = os.path.join(tmp, "graph.png")
+            heat_png = os.path.join(tmp, "heat.png")
+            visualizer.plot_graph(self.G, filename=graph_png, weighted=True, groups=self.groups,
+                                  layout_store=store, detail='preview')
+            visualizer.plot_jaccard_heatmap(self.G, filename=heat_png, detail='preview',
+                                            groups=self.groups)
+            self.assertTrue(os.path.getsize(graph_png) > 0)
+            self.assertTrue(os.path.getsize(heat_png) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
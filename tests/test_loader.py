@@ -0,0 +1,88 @@
+import gzip
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import csr, graph_ops, loader
+from src.data import EDGES_BIPARTIDO
+
+
+class TestStreamingLoader(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.edges = EDGES_BIPARTIDO + EDGES_BIPARTIDO[:10]  # with duplicates
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def assertSameGraph(self, G):
+        expected = graph_ops.build_bipartite_graph()
+        used = {n for e in EDGES_BIPARTIDO for n in e}
+        self.assertEqual(set(G.nodes()), used)
+        self.assertEqual(set(map(frozenset, G.edges())), set(map(frozenset, expected.edges())))
+        self.assertEqual({n: d['type'] for n, d in G.nodes(data=True)},
+                         {n: d['type'] for n, d in expected.nodes(data=True) if n in used})
+
+    def test_csv_with_header(self):
+        with open(self.path('bom.csv'), 'w', encoding='utf-8') as f:
+            f.write("part,car\n")
+            for car, part in self.edges:
+                f.write(f"\"{part}\",\"{car}\"\n")
+        self.assertSameGraph(graph_ops.build_bipartite_graph(self.path('bom.csv'), chunk_size=7))
+
+    def test_tsv_gz_without_header(self):
+        with gzip.open(self.path('bom.tsv.gz'), 'wt', encoding='utf-8') as f:
+            for car, part in self.edges:
+                f.write(f"{car}\t{part}\n")
+        self.assertSameGraph(graph_ops.build_bipartite_graph(self.path('bom.tsv.gz'),
+                                                             header=False))
+
+    def test_jsonl_compact(self):
+        with open(self.path('bom.jsonl'), 'w', encoding='utf-8') as f:
+            for car, part in self.edges:
+                f.write(json.dumps({'car': car, 'part': part}) + "\n")
+        C = graph_ops.build_bipartite_graph(self.path('bom.jsonl'), compact=True)
+        self.assertIsInstance(C, csr.CSRGraph)
+        self.assertSameGraph(csr.to_networkx(C))
+
+    def test_chunks_and_errors(self):
+        with open(self.path('bom.csv'), 'w', encoding='utf-8') as f:
+            for car, part in self.edges:
+                f.write(f"\"{car}\",\"{part}\"\n")
+        chunks = list(loader.iter_edge_chunks(self.path('bom.csv'), chunk_size=50, header=False))
+        self.assertTrue(all(len(c) <= 50 for c in chunks))
+        self.assertEqual(sum(len(c) for c in chunks), len(self.edges))
+        self.assertEqual(len(loader.load_edges(self.edges)), len(set(EDGES_BIPARTIDO)))
+        with self.assertRaises(ValueError):
+            loader.detect_format(self.path('bom.xlsx'))
+        with self.assertRaises(ValueError):
+            loader.load_edges([("A", "X"), ("X", "Y")]).to_networkx()
+
+    def test_unknown_header(self):
+        with open(self.path('bom.csv'), 'w', encoding='utf-8') as f:
+            f.write("vehicle,component\nVW Golf Mk6,Sistema ABS Bosch\n")
+        with self.assertRaises(ValueError):
+            loader.load_edges(self.path('bom.csv'))
+        store = loader.load_edges(self.path('bom.csv'), car_field='vehicle',
+                                  part_field='component')
+        self.assertEqual((store.cars, store.parts), (["VW Golf Mk6"], ["Sistema ABS Bosch"]))
+
+    def test_numeric_ids(self):
+        with open(self.path('bom.jsonl'), 'w', encoding='utf-8') as f:
+            for car, part in [(1, 10), (1, 11), (2, 10), (0, 11)]:
+                f.write(json.dumps({'car': car, 'part': part}) + "\n")
+        B = graph_ops.build_bipartite_graph(self.path('bom.jsonl'))
+        self.assertEqual(set(B.edges()), {('1', '10'), ('1', '11'), ('2', '10'), ('0', '11')})
+        store = loader.load_edges([(1, 10), (2, 10)])
+        self.assertEqual((store.cars, store.parts), ([1, 2], [10]))
+
+if __name__ == '__main__':
+    unittest.main()
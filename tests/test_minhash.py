@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops, minhash
+
+
+class TestMinHashIndex(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(self.B)
+        self.P = graph_ops.calculate_jaccard_weights(self.B, P)
+        self.index = minhash.MinHashIndex(self.B, threshold=0.5, seed=1)
+
+    def test_choose_bands(self):
+        bands, rows = minhash.choose_bands(128, 0.5)
+        self.assertEqual(bands * rows, 128)
+        self.assertLess(abs((1 / bands) ** (1 / rows) - 0.5), 0.1)
+
+    def test_candidate_pairs_recall(self):
+        expected = {frozenset((u, v)) for u, v, j in self.P.edges(data='jaccard') if j >= 0.5}
+        found = {frozenset((u, v)) for u, v, _ in self.index.candidate_pairs(exact=True)}
+        self.assertEqual(found, expected)
+
+    def test_query_and_estimates(self):
+        result = self.index.query("VW Golf Mk6", threshold=0.5, exact=True)
+        self.assertIn("Audi TT Mk2", [car for car, _ in result])
+        estimate = self.index.estimate_jaccard("VW Golf Mk6", "Audi TT Mk2")
+        exact = self.P["VW Golf Mk6"]["Audi TT Mk2"]['jaccard']
+        self.assertAlmostEqual(estimate, exact, delta=0.15)
+        again = minhash.MinHashIndex(self.B, threshold=0.5, seed=1)
+        self.assertEqual((again.signatures == self.index.signatures).all(), True)
+        # Any memory budget (here a few cars per block) gives the same signatures
+        small = minhash.MinHashIndex(self.B, threshold=0.5, seed=1, block_bytes=128 * 8 * 20)
+        self.assertEqual((small.signatures == self.index.signatures).all(), True)
+
+    def test_sparsified_projection(self):
+        S = graph_ops.build_projected_graph(self.B, method='minhash', threshold=0.5)
+        self.assertEqual(set(S.nodes()), set(self.P.nodes()))
+        for u, v, d in S.edges(data=True):
+            self.assertGreaterEqual(d['jaccard'], 0.5)
+            self.assertEqual(d['weight'], self.P[u][v]['weight'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops, monte_carlo
+from src.projection import incidence_matrix
+
+
+class TestMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+
+    def test_batch_impact_matches_collapse(self):
+        A, cars, parts = incidence_matrix(self.B)
+        coo = A.tocoo()
+        failed = np.random.default_rng(1).random((5, len(parts))) < 0.2
+        stopped, giant = monte_carlo._batch_impact(A, coo.row, coo.col, failed)
+        for t in range(5):
+            failed_parts = [p for p, f in zip(parts, failed[t]) if f]
+            _, largest, _ = graph_ops.simulate_supplier_collapse(self.B, failed_parts)
+            affected = {c for p in failed_parts for c in self.B.neighbors(p)}
+            self.assertEqual(giant[t], largest)
+            self.assertEqual(stopped[t], len(affected))
+
+    def test_seeded_and_batch_independent(self):
+        r1 = monte_carlo.simulate_random_failures(self.B, 0.05, trials=300, batch_size=64, seed=7)
+        r2 = monte_carlo.simulate_random_failures(self.B, 0.05, trials=300, batch_size=300, seed=7)
+        np.testing.assert_array_equal(r1['samples']['giant_component'],
+                                      r2['samples']['giant_component'])
+        lo, hi = r1['cars_stopped']['ci']
+        self.assertLessEqual(lo, r1['cars_stopped']['mean'])
+        self.assertGreaterEqual(hi, r1['cars_stopped']['mean'])
+
+    def test_per_part_probabilities(self):
+        result = monte_carlo.simulate_random_failures(self.B, {"Sistema ABS Bosch": 1.0},
+                                                      trials=20, seed=0)
+        affected, _ = graph_ops.simulate_part_failure(self.B, "Sistema ABS Bosch")
+        self.assertEqual(result['cars_stopped']['mean'], len(affected))
+        with self.assertRaises(ValueError):
+            monte_carlo.simulate_random_failures(self.B, 1.5, trials=1)
+        with self.assertRaisesRegex(ValueError, "trials"):
+            monte_carlo.simulate_random_failures(self.B, 0.1, trials=0)
+        with self.assertRaises(ValueError):
+            monte_carlo.simulate_random_failures(self.B, 0.1, batch_size=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import math
+import os
+import sys
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops
+from src.neighbors import NeighborIndex
+
+
+class TestNeighborIndex(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(self.B)
+        self.P = graph_ops.calculate_jaccard_weights(self.B, P)
+        self.index = NeighborIndex(self.B)
+
+    def brute_force(self, car, k, metric):
+        scored = []
+        for other in self.P.neighbors(car):
+            d = self.P[car][other]
+            if metric == 'shared':
+                score = d['weight']
+            elif metric == 'jaccard':
+                score = d['jaccard']
+            else:
+                score = sum(1 / math.log(self.B.degree(p)) for p in d['shared_parts'])
+            scored.append((other, score))
+        return sorted(scored, key=lambda item: (-round(item[1], 9), item[0]))[:k]
+
+    def assertSameRanking(self, got, expected):
+        self.assertEqual([c for c, _ in got], [c for c, _ in expected])
+        for (_, a), (_, b) in zip(got, expected):
+            self.assertAlmostEqual(a, b)
+
+    def test_single_queries_match_projection(self):
+        for metric in ('shared', 'jaccard', 'weighted'):
+            for car in ("VW Golf Mk6", "Peugeot 208", "Volvo XC40"):
+                self.assertSameRanking(self.index.query(car, k=5, metric=metric),
+                                       self.brute_force(car, 5, metric))
+
+    def test_batch_matches_single(self):
+        cars = list(self.P.nodes())
+        for metric in ('shared', 'jaccard', 'weighted'):
+            batch = self.index.query_batch(cars, k=3, metric=metric, chunk_size=7)
+            for car in cars:
+                self.assertSameRanking(batch[car], self.index.query(car, k=3, metric=metric))
+        with self.assertRaises(ValueError):
+            self.index.query("VW Golf Mk6", metric='euclid')
+
+if __name__ == '__main__':
+    unittest.main()
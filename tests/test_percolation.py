@@ -0,0 +1,45 @@
+import os
+import sys
+import unittest
+
+import networkx as nx
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops
+from src.percolation import UnionFind, percolation_curve
+
+
+class TestPercolation(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        self.parts = [p for p, *_ in graph_ops.get_part_criticality(self.B)]
+
+    def test_union_find(self):
+        uf = UnionFind(5)
+        uf.union(0, 1)
+        uf.union(3, 4)
+        uf.union(1, 0)
+        self.assertEqual(uf.components, 3)
+        self.assertEqual(uf.largest, 2)
+        self.assertEqual(uf.find(0), uf.find(1))
+
+    def test_matches_cumulative_failure(self):
+        order = self.parts[:10] + ["Unknown Part", self.parts[0]]
+        expected = graph_ops.simulate_cumulative_failure(self.B, order)
+        curve = graph_ops.simulate_cumulative_failure(self.B, order, method='percolation')
+        self.assertEqual(curve, expected)
+
+    def test_component_counts(self):
+        curve = percolation_curve(self.B, self.parts)
+        self.assertEqual(len(curve), len(self.parts) + 1)
+        B_damaged = self.B.copy()
+        B_damaged.remove_nodes_from(self.parts[:3])
+        P = graph_ops.build_projected_graph(B_damaged)
+        self.assertEqual(curve[3][1], nx.number_connected_components(P))
+        # With every part gone, each car is its own component
+        self.assertEqual(curve[-1][1:], (P.number_of_nodes(), 1))
+
+if __name__ == '__main__':
+    unittest.main()
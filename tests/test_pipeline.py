@@ -0,0 +1,79 @@
+import operator
+import os
+import sys
+import tempfile
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import cache, graph_ops, pipeline, report_generator
+
+
+class TestPipeline(unittest.TestCase):
+    def test_dependencies_and_memoization(self):
+        for processes in (1, 2):
+            pipe = pipeline.Pipeline(processes)
+            pipe.add_input('x', 3).add_input('y', 4)
+            pipe.add('sum', operator.add, ['x', 'y'])
+            pipe.add('square', operator.mul, ['sum', 'sum'])
+            pipe.add('neg', operator.neg, ['square'], local=True)
+            self.assertEqual(pipe.run(['neg']), {'neg': -49})
+            self.assertEqual(pipe.results['sum'], 7)
+            pipe.tasks['sum'] = (operator.sub, ('x', 'y'), {}, False)
+            self.assertEqual(pipe['square'], 49)  # memoized, not recomputed
+
+    def test_errors(self):
+        pipe = pipeline.Pipeline(1)
+        pipe.add('a', operator.neg, ['b'])
+        pipe.add('b', operator.neg, ['a'])
+        with self.assertRaises(ValueError):
+            pipe.run()
+        with self.assertRaises(ValueError):
+            pipe.add('a', operator.neg)
+        with self.assertRaises(ValueError):
+            pipeline.Pipeline(1).add('c', operator.neg, ['missing']).run()
+
+    def test_analysis_pipeline_matches_direct_calls(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        results = pipeline.analysis_pipeline(B, P, processes=2).run()
+        critical = graph_ops.get_part_criticality(B)
+        self.assertEqual(results['criticality'], critical)
+        self.assertEqual(results['stock'], graph_ops.analyze_stock_savings(B))
+        top5 = [p for p, *_ in critical[:5]]
+        self.assertEqual(results['cumulative_failure'],
+                         graph_ops.simulate_cumulative_failure(B, top5))
+        self.assertEqual(results['communities'], graph_ops.detect_communities(P))
+
+    def test_pool_shares_analysis_cache(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        cache.invalidate()
+        pipeline.analysis_pipeline(B, P, processes=2).run(['criticality', 'k_core'])
+        self.assertEqual(len(cache.default_cache), 2)  # worker results stored in this process
+
+        hits = cache.default_cache.hits
+        graph_ops.get_part_criticality(B)
+        pipeline.analysis_pipeline(B, P, processes=2).run(['criticality', 'k_core'])
+        self.assertEqual(cache.default_cache.hits, hits + 3)
+        self.assertEqual(len(cache.default_cache), 2)
+
+    def test_small_graphs_run_in_process(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        self.assertEqual(pipeline.analysis_pipeline(B, P).processes, 1)
+        self.assertEqual(pipeline.analysis_pipeline(B, P, processes=2).processes, 2)
+
+    def test_report_serial(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.md")
+            report_generator.generate_full_report(B, P, save_path=path, processes=1)
+            with open(path) as f:
+                self.assertIn("Assortatividade por Segmento", f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops
+from src.projection import IncrementalProjection
+
+
+def edge_map(P):
+    return {frozenset((u, v)): (d['weight'], set(d['shared_parts']))
+            for u, v, d in P.edges(data=True)}
+
+
+class TestProjectionEngines(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+        self.P = graph_ops.build_projected_graph(self.B)
+
+    def test_sparse_matches_loop(self):
+        P_sparse = graph_ops.build_projected_graph(self.B, method='sparse')
+        self.assertEqual(set(P_sparse.nodes()), set(self.P.nodes()))
+        self.assertEqual(edge_map(P_sparse), edge_map(self.P))
+        P_weights = graph_ops.build_projected_graph(self.B, method='sparse',
+                                                    with_shared_parts=False)
+        self.assertEqual(list(P_weights.edges(data='weight')), list(P_sparse.edges(data='weight')))
+        self.assertTrue(all('shared_parts' not in d for _, _, d in P_weights.edges(data=True)))
+
+    def test_index_matches_loop(self):
+        P_index = graph_ops.build_projected_graph(self.B, method='index')
+        self.assertEqual(set(P_index.nodes()), set(self.P.nodes()))
+        self.assertEqual(edge_map(P_index), edge_map(self.P))
+
+    def test_simulators_accept_method(self):
+        parts = [p for p, *_ in graph_ops.get_part_criticality(self.B)[:5]]
+        expected = graph_ops.simulate_cumulative_failure(self.B, parts)
+        curve = graph_ops.simulate_cumulative_failure(self.B, parts, method='index')
+        self.assertEqual(curve, expected)
+        n, gc, _ = graph_ops.simulate_supplier_collapse(self.B, parts[:2], method='index')
+        self.assertEqual((n, gc), graph_ops.simulate_supplier_collapse(self.B, parts[:2])[:2])
+
+    def test_incremental_simulators(self):
+        parts = [p for p, *_ in graph_ops.get_part_criticality(self.B)[:5]]
+        expected = graph_ops.simulate_cumulative_failure(self.B, parts)
+        curve = graph_ops.simulate_cumulative_failure(self.B, parts, method='incremental')
+        self.assertEqual(curve, expected)
+
+        inc = IncrementalProjection(self.B)
+        n, gc, P_damaged = graph_ops.simulate_supplier_collapse(self.B, parts[:2], incremental=inc)
+        self.assertEqual((n, gc), graph_ops.simulate_supplier_collapse(self.B, parts[:2])[:2])
+        # Reused projection is restored after the scenario
+        self.assertEqual(edge_map(inc.P), edge_map(self.P))
+        collapsed = graph_ops.simulate_supplier_collapse(self.B, parts[:2])[2]
+        self.assertEqual(edge_map(P_damaged), edge_map(collapsed))
+
+    def test_incremental_remove_add_roundtrip(self):
+        inc = IncrementalProjection(self.B)
+        cars = inc.remove_part("Sistema ABS Bosch")
+        self.assertGreater(len(cars), 0)
+        B_damaged = self.B.copy()
+        B_damaged.remove_node("Sistema ABS Bosch")
+        self.assertEqual(edge_map(inc.P), edge_map(graph_ops.build_projected_graph(B_damaged)))
+        inc.add_part("Sistema ABS Bosch", cars)
+        self.assertEqual(edge_map(inc.P), edge_map(self.P))
+
+    def test_non_parts_are_skipped(self):
+        inc = IncrementalProjection(self.B)
+        self.assertEqual(inc.remove_part("VW Golf Mk6"), [])
+        self.assertIn("VW Golf Mk6", inc.B)
+        self.assertEqual(edge_map(inc.P), edge_map(self.P))
+        failures = ["VW Golf Mk6", "Sistema ABS Bosch"]
+        expected = graph_ops.simulate_cumulative_failure(self.B, failures, method='percolation')
+        self.assertEqual(len(expected), 2)
+        curve = graph_ops.simulate_cumulative_failure(self.B, failures, method='incremental')
+        self.assertEqual(curve, expected)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            graph_ops.build_projected_graph(self.B, method='magic')
+
+if __name__ == '__main__':
+    unittest.main()
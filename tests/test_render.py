@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops, render, visualizer
+
+
+class TestRenderFigures(unittest.TestCase):
+    def test_pool_renders_every_figure(self):
+        B = graph_ops.build_bipartite_graph()
+        hubs = graph_ops.get_part_criticality(B)
+        curve = graph_ops.simulate_cumulative_failure(B, [p for p, *_ in hubs[:3]])
+        with tempfile.TemporaryDirectory() as tmp:
+            names = [os.path.join(tmp, f) for f in ("hubs.png", "curve.png", "degrees.png")]
+            jobs = [
+                render.figure_job(visualizer.plot_criticality, hubs, filename=names[0]),
+                render.figure_job(visualizer.plot_resilience_curve, curve, filename=names[1]),
+                render.figure_job(visualizer.plot_degree_distribution, B, filename=names[2]),
+            ]
+            for processes in (1, 2):
+                timings = render.render_figures(jobs, processes=processes, verbose=False)
+                self.assertEqual(list(timings), names)
+                self.assertTrue(all(t >= 0 for t in timings.values()))
+                self.assertTrue(all(os.path.getsize(n) > 0 for n in names))
+                for n in names:
+                    os.remove(n)
+        self.assertEqual(render.render_figures([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,5 +36,29 @@ class TestProjectStructure(unittest.TestCase):
         has_jaccard = any('jaccard' in d for u, v, d in P.edges(data=True))
         self.assertTrue(has_jaccard, "Edges should have jaccard attribute")
 
+    def test_predict_demand(self):
+        B = graph_ops.build_bipartite_graph()
+        P = graph_ops.build_projected_graph(B)
+        _, communities = graph_ops.detect_communities(P)
+        stds, sugs = graph_ops.predict_demand(B, communities)
+
+        # Reference: per-community part frequencies with the 70% rule
+        for i, comm in enumerate(communities):
+            counts = {}
+            for car in comm:
+                for p in B.neighbors(car):
+                    counts[p] = counts.get(p, 0) + 1
+            expected = {p for p, c in counts.items() if c >= len(comm) * 0.7}
+            self.assertEqual(set(stds[i]), expected)
+            for car in comm:
+                missing = expected - set(B.neighbors(car))
+                self.assertEqual(set(sugs.get(car, [])), missing)
+
+        _, ranked = graph_ops.predict_demand(B, communities, threshold=0.5, with_support=True)
+        for car, items in ranked.items():
+            supports = [s for _, s in items]
+            self.assertEqual(supports, sorted(supports, reverse=True))
+            self.assertTrue(all(0.5 <= s <= 1.0 for s in supports))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,50 @@
+import math
+import os
+import sys
+import tempfile
+import unittest
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops, similarity, visualizer
+
+
+class TestSimilarityEngine(unittest.TestCase):
+    def setUp(self):
+        self.B = graph_ops.build_bipartite_graph()
+
+    def test_sparse_jaccard_matches_loop(self):
+        expected = graph_ops.build_projected_graph(self.B)
+        graph_ops.calculate_jaccard_weights(self.B, expected)
+        P = graph_ops.build_projected_graph(self.B)
+        graph_ops.calculate_jaccard_weights(self.B, P, method='sparse')
+        for u, v, d in expected.edges(data=True):
+            self.assertAlmostEqual(P[u][v]['jaccard'], d['jaccard'])
+
+    def test_all_measures(self):
+        cars, mats = similarity.compute_similarity(self.B, measures=similarity.MEASURES, dense=True)
+        i, j = cars.index("VW Golf Mk6"), cars.index("Audi A3 8P")
+        a, b = set(self.B.neighbors(cars[i])), set(self.B.neighbors(cars[j]))
+        inter = len(a & b)
+        self.assertAlmostEqual(mats['jaccard'][i, j], inter / len(a | b))
+        self.assertAlmostEqual(mats['overlap'][i, j], inter / min(len(a), len(b)))
+        self.assertAlmostEqual(mats['cosine'][i, j], inter / math.sqrt(len(a) * len(b)))
+        self.assertAlmostEqual(mats['sorensen'][i, j], 2 * inter / (len(a) + len(b)))
+        self.assertAlmostEqual(mats['jaccard'][i, i], 1.0)
+        with self.assertRaises(ValueError):
+            similarity.compute_similarity(self.B, measures=('dice-ish',))
+
+    def test_heatmap_from_matrix(self):
+        cars, mats = similarity.compute_similarity(self.B)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'heatmap.png')
+            visualizer.plot_jaccard_heatmap(None, filename=path, matrix=mats['jaccard'], nodes=cars)
+            self.assertTrue(os.path.getsize(path) > 0)
+
+if __name__ == '__main__':
+    unittest.main()
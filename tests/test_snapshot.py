@@ -0,0 +1,61 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import csr, graph_ops, snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'graphs.vpg')
+        self.B = graph_ops.build_bipartite_graph()
+        self.P = graph_ops.build_projected_graph(self.B)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        snapshot.save_snapshot(self.path, self.B, self.P, snapshot.dataset_hash())
+        B, P = snapshot.open_snapshot(self.path, expected_hash=snapshot.dataset_hash())
+        self.assertIsInstance(B, csr.CSRGraph)
+        B_nx, P_nx = csr.to_networkx(B), csr.to_networkx(P)
+        self.assertEqual(list(B_nx.nodes()), list(self.B.nodes()))
+        self.assertEqual(set(map(frozenset, B_nx.edges())), set(map(frozenset, self.B.edges())))
+        self.assertEqual({frozenset((u, v)): w for u, v, w in P_nx.edges(data='weight')},
+                         {frozenset((u, v)): w for u, v, w in self.P.edges(data='weight')})
+
+    def test_rejects_stale_or_corrupt(self):
+        snapshot.save_snapshot(self.path, self.B, self.P, b'x' * 16)
+        self.assertIsNone(snapshot.open_snapshot(self.path, expected_hash=snapshot.dataset_hash()))
+        with open(self.path, 'r+b') as f:
+            f.truncate(200)
+        self.assertIsNone(snapshot.open_snapshot(self.path))
+        self.assertIsNone(snapshot.open_snapshot(os.path.join(self.tmp.name, 'missing.vpg')))
+
+    def test_load_or_build(self):
+        B, P = snapshot.load_or_build(self.path)
+        self.assertEqual(snapshot.read_header(self.path)['hash'], snapshot.dataset_hash())
+        B2, P2 = snapshot.load_or_build(self.path)
+        self.assertEqual(B2.number_of_edges(), B.number_of_edges())
+        self.assertEqual(P2.number_of_edges(), P.number_of_edges())
+        self.assertEqual(graph_ops.get_part_criticality(B2)[0][0], "Sistema ABS Bosch")
+        # The rebuild returns the graphs exactly as later launches read them
+        self.assertEqual(list(B.nodes(data=True)), list(B2.nodes(data=True)))
+        self.assertEqual(list(P.nodes(data=True)), list(P2.nodes(data=True)))
+        self.assertEqual(list(P.edges(data=True)), list(P2.edges(data=True)))
+        Bc, Pc = snapshot.load_or_build(self.path, as_networkx=False)
+        self.assertIsInstance(Pc, csr.CSRGraph)
+
+    def test_load_or_build_unwritable(self):
+        path = os.path.join(self.tmp.name, 'missing-dir', 'graph.vpg')
+        B, P = snapshot.load_or_build(path)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(P.number_of_edges(), self.P.number_of_edges())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add root to path so we can import src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import graph_ops, synthetic
+
+
+class TestSyntheticCatalog(unittest.TestCase):
+    def test_seeded_and_independent_of_chunking(self):
+        a = list(synthetic.SyntheticCatalog(5000, seed=3).edges())
+        chunks = synthetic.SyntheticCatalog(5000, seed=3).iter_edge_chunks(777)
+        b = [e for chunk in chunks for e in chunk]
+        c = list(synthetic.SyntheticCatalog(5000, seed=4).edges())
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        self.assertEqual(len(set(a)), len(a))
+
+    def test_structure(self):
+        B = synthetic.generate_bipartite_graph(3000, seed=1)
+        cars = [n for n, d in B.nodes(data=True) if d['type'] == 'car']
+        parts = [n for n, d in B.nodes(data=True) if d['type'] == 'part']
+        self.assertEqual(len(cars), 3000)
+        self.assertFalse(set(cars) & set(parts))
+
+        # Heavy tail: the top part reaches a large share of the fleet, the median part few cars
+        degrees = sorted((B.degree(p) for p in parts), reverse=True)
+        self.assertGreater(degrees[0], 0.2 * len(cars))
+        self.assertLess(degrees[len(degrees) // 2], 10)
+
+        segments = set(graph_ops.get_vehicle_segments(cars).values())
+        self.assertEqual(segments, {'Premium', 'Economy'})
+
+        # Platforms: about half of each car's parts are modules of its own platform
+        own = sum(1 for c in cars for p in B.neighbors(c) if p.startswith(c.split()[1] + ' Module'))
+        self.assertGreater(own / B.number_of_edges(), 0.35)
+
+    def test_streamed_file_matches_memory(self):
+        catalog = synthetic.SyntheticCatalog(1500, seed=2)
+        expected = graph_ops.build_bipartite_graph(source=catalog.edges())
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("catalog.csv.gz", "catalog.jsonl"):
+                path = os.path.join(tmp, name)
+                count = catalog.write(path)
+                self.assertEqual(count, expected.number_of_edges())
+                B = graph_ops.build_bipartite_graph(source=path)
+                self.assertEqual(set(B.edges()), set(expected.edges()))
+        C = synthetic.generate_bipartite_graph(1500, compact=True, seed=2)
+        self.assertEqual(C.number_of_edges(), expected.number_of_edges())
+
+
+if __name__ == '__main__':
+    unittest.main()